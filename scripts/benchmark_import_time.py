@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Benchmark the startup cost of importing integrated_widgets.
+
+Each import statement is executed in a fresh interpreter so that module caches
+from earlier runs do not skew the result. For every statement the script
+reports the median wall-clock import time and the number of modules that the
+import added to ``sys.modules``.
+
+Usage:
+    python scripts/benchmark_import_time.py
+    python scripts/benchmark_import_time.py --repeat 10 "from integrated_widgets import IQtCheckBox"
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Sequence
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = REPO_ROOT / "src"
+
+DEFAULT_STATEMENTS: tuple[str, ...] = (
+    "import integrated_widgets",
+    "from integrated_widgets import IQtCheckBox",
+    "from integrated_widgets import IQtRealUnitedScalarEntry",
+    "from integrated_widgets import *",
+    "import integrated_widgets.controllers",
+)
+
+_PROBE = """
+import json, sys, time
+baseline = len(sys.modules)
+start = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "modules": len(sys.modules) - baseline}}))
+"""
+
+
+def measure(statement: str) -> tuple[float, int]:
+    """Run one import statement in a fresh interpreter and return (seconds, added modules)."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_PATH), env.get("PYTHONPATH", "")]))
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(statement=statement)],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    data = json.loads(result.stdout.strip().splitlines()[-1])
+    return data["seconds"], data["modules"]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("statements", nargs="*", default=list(DEFAULT_STATEMENTS), help="Import statements to benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of fresh interpreters per statement (default: 5)")
+    args = parser.parse_args(argv)
+
+    width = max(len(statement) for statement in args.statements)
+    print(f"{'statement':<{width}}  {'median ms':>10}  {'modules':>8}")
+    for statement in args.statements:
+        try:
+            samples = [measure(statement) for _ in range(args.repeat)]
+        except subprocess.CalledProcessError as error:
+            print(f"{statement:<{width}}  failed: {error.stderr.strip().splitlines()[-1] if error.stderr else error}")
+            continue
+        median_ms = statistics.median(seconds for seconds, _ in samples) * 1000.0
+        modules = max(count for _, count in samples)
+        print(f"{statement:<{width}}  {median_ms:>10.1f}  {modules:>8d}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Benchmark the cost of tearing down large widget trees.
+
+Builds a form of N IQtTextEntry widgets (sharing one observable, as a large
+bound form would) and measures disposing of all controllers, once with one
+``dispose()`` call per controller and once with ``IQtWidgetBase.dispose_tree()``
+(``BaseController.dispose_many``). The deferred Qt deletions are processed
+afterwards and are included in the timings. Results are reported per 1,000
+controllers.
+
+Usage:
+    python scripts/benchmark_teardown.py
+    python scripts/benchmark_teardown.py --count 5000 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "src"))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QCoreApplication, QEvent  # noqa: E402
+from PySide6.QtWidgets import QApplication, QVBoxLayout, QWidget  # noqa: E402
+
+from nexpy import XValue  # noqa: E402
+from integrated_widgets import IQtTextEntry  # noqa: E402
+from integrated_widgets.core import IQtWidgetBase, LayoutPayloadBase  # noqa: E402
+
+
+@dataclass(frozen=True)
+class _EntriesPayload(LayoutPayloadBase):
+    entries: list[IQtTextEntry]
+
+
+def _layout(payload: _EntriesPayload, **layout_strategy_kwargs: Any) -> QWidget:
+    widget = QWidget()
+    layout = QVBoxLayout(widget)
+    for entry in payload.entries:
+        layout.addWidget(entry)
+    return widget
+
+
+def _build_form(count: int) -> IQtWidgetBase[_EntriesPayload]:
+    observable = XValue[str]("text")
+    form = IQtWidgetBase(_EntriesPayload([IQtTextEntry(observable) for _ in range(count)]), _layout)
+    QCoreApplication.processEvents()
+    return form
+
+
+def _dispose_one_by_one(form: IQtWidgetBase[_EntriesPayload]) -> None:
+    for controller in form.controllers_in_tree():
+        controller.dispose()
+    form.deleteLater()
+
+
+def _dispose_tree(form: IQtWidgetBase[_EntriesPayload]) -> None:
+    form.dispose_tree()
+
+
+def measure(count: int, teardown: Callable[[IQtWidgetBase[_EntriesPayload]], None]) -> float:
+    """Build a form of *count* controllers, tear it down and return the seconds spent."""
+    form = _build_form(count)
+    start = time.perf_counter()
+    teardown(form)
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    QCoreApplication.processEvents()
+    return time.perf_counter() - start
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=2000, help="Number of controllers in the form (default: 2000)")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of forms per teardown variant (default: 5)")
+    args = parser.parse_args(argv)
+
+    _app = QApplication.instance() or QApplication(sys.argv)
+
+    variants: dict[str, Callable[[IQtWidgetBase[_EntriesPayload]], None]] = {
+        "dispose() per controller": _dispose_one_by_one,
+        "dispose_tree()": _dispose_tree,
+    }
+    width = max(len(name) for name in variants)
+    print(f"{'teardown':<{width}}  {'median ms / 1000 controllers':>28}")
+    for name, teardown in variants.items():
+        samples = [measure(args.count, teardown) for _ in range(args.repeat)]
+        per_thousand_ms = statistics.median(samples) * 1000.0 * 1000.0 / args.count
+        print(f"{name:<{width}}  {per_thousand_ms:>28.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
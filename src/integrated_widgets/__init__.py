@@ -9,7 +9,7 @@ Import organization:
 --------------------
 - Top-level (`from integrated_widgets import ...`):
     - End-user IQT widgets (e.g., IQtCheckBox, IQtTextEntry, IQtFloatEntry, etc.)
-    - Signal hooks and utilities (IQtSignalHook, default)
+    - Signal hooks and utilities (IQtSignalHook, IQtSignalHookGroup, CommitJournal, run_async, default)
 
 - Payloads for custom layouting:
     - `from integrated_widgets.payloads import CheckBoxPayload, TextEntryPayload, ...`
@@ -28,28 +28,76 @@ Import structure cheatsheet:
     # Signal integration
     from integrated_widgets import IQtSignalHook, default
 
+Lazy loading:
+-------------
+Exported names are resolved on first attribute access (PEP 562), so
+`import integrated_widgets` does not import PySide6, nexpy or united_system.
+`from integrated_widgets import IQtCheckBox` only loads the modules that
+IQtCheckBox depends on. The same applies to `integrated_widgets.controllers`,
+`integrated_widgets.payloads` and `integrated_widgets.core`.
+
 """
 
 from ._version import __version__
 
-# IQT Widgets - Primary API
-from .iqt_widgets.iqt_check_box import IQtCheckBox
-from .iqt_widgets.iqt_display_value import IQtDisplayValue
-from .iqt_widgets.iqt_double_list_selection import IQtDoubleListSelection
-from .iqt_widgets.iqt_float_entry import IQtFloatEntry
-from .iqt_widgets.iqt_integer_entry import IQtIntegerEntry
-from .iqt_widgets.iqt_optional_text_entry import IQtOptionalTextEntry
-from .iqt_widgets.iqt_path_selector import IQtPathSelector
-from .iqt_widgets.iqt_radio_buttons_select import IQtRadioButtonsSelect
-from .iqt_widgets.iqt_range_slider import IQtRangeSlider
-from .iqt_widgets.iqt_real_united_scalar_entry import IQtRealUnitedScalarEntry
-from .iqt_widgets.iqt_listview_single_optional_select import IQtListviewSingleOptionalSelect
-from .iqt_widgets.iqt_combobox_optional_select import IQtComboboxOptionalSelect
-from .iqt_widgets.iqt_combobox_select import IQtComboboxSelect
-from .iqt_widgets.iqt_text_entry import IQtTextEntry
-from .iqt_widgets.iqt_unit_entry import IQtUnitEntry
-from .auxiliaries.iqt_signal_hook import IQtSignalHook
-from .auxiliaries.default import default
+from typing import TYPE_CHECKING
+
+from .auxiliaries.lazy_imports import lazy_module_attributes
+
+if TYPE_CHECKING:
+    # IQT Widgets - Primary API
+    from .iqt_widgets.iqt_check_box import IQtCheckBox
+    from .iqt_widgets.iqt_display_value import IQtDisplayValue
+    from .iqt_widgets.iqt_double_list_selection import IQtDoubleListSelection
+    from .iqt_widgets.iqt_float_entry import IQtFloatEntry
+    from .iqt_widgets.iqt_integer_entry import IQtIntegerEntry
+    from .iqt_widgets.iqt_optional_text_entry import IQtOptionalTextEntry
+    from .iqt_widgets.iqt_path_selector import IQtPathSelector
+    from .iqt_widgets.iqt_radio_buttons_select import IQtRadioButtonsSelect
+    from .iqt_widgets.iqt_range_slider import IQtRangeSlider
+    from .iqt_widgets.iqt_real_united_scalar_entry import IQtRealUnitedScalarEntry
+    from .iqt_widgets.iqt_listview_single_optional_select import IQtListviewSingleOptionalSelect
+    from .iqt_widgets.iqt_combobox_optional_select import IQtComboboxOptionalSelect
+    from .iqt_widgets.iqt_combobox_select import IQtComboboxSelect
+    from .iqt_widgets.iqt_text_entry import IQtTextEntry
+    from .iqt_widgets.iqt_unit_entry import IQtUnitEntry
+    from .iqt_widgets.iqt_virtual_form import IQtVirtualForm, FormField
+    from .auxiliaries.iqt_signal_hook import IQtSignalHook
+    from .auxiliaries.iqt_signal_hook_group import IQtSignalHookGroup
+    from .auxiliaries.commit_journal import CommitJournal
+    from .auxiliaries.qt_async import run_async
+    from .auxiliaries.default import default
+    from .auxiliaries.debounce import AdaptiveDebounce, DebouncePolicy
+    from .auxiliaries.validation_cache import pure_validator
+
+# Exported name -> (module, attribute); resolved on first access
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str]] = {
+    "IQtCheckBox": (".iqt_widgets.iqt_check_box", "IQtCheckBox"),
+    "IQtDisplayValue": (".iqt_widgets.iqt_display_value", "IQtDisplayValue"),
+    "IQtDoubleListSelection": (".iqt_widgets.iqt_double_list_selection", "IQtDoubleListSelection"),
+    "IQtFloatEntry": (".iqt_widgets.iqt_float_entry", "IQtFloatEntry"),
+    "IQtIntegerEntry": (".iqt_widgets.iqt_integer_entry", "IQtIntegerEntry"),
+    "IQtOptionalTextEntry": (".iqt_widgets.iqt_optional_text_entry", "IQtOptionalTextEntry"),
+    "IQtPathSelector": (".iqt_widgets.iqt_path_selector", "IQtPathSelector"),
+    "IQtRadioButtonsSelect": (".iqt_widgets.iqt_radio_buttons_select", "IQtRadioButtonsSelect"),
+    "IQtRangeSlider": (".iqt_widgets.iqt_range_slider", "IQtRangeSlider"),
+    "IQtRealUnitedScalarEntry": (".iqt_widgets.iqt_real_united_scalar_entry", "IQtRealUnitedScalarEntry"),
+    "IQtListviewSingleOptionalSelect": (".iqt_widgets.iqt_listview_single_optional_select", "IQtListviewSingleOptionalSelect"),
+    "IQtComboboxOptionalSelect": (".iqt_widgets.iqt_combobox_optional_select", "IQtComboboxOptionalSelect"),
+    "IQtComboboxSelect": (".iqt_widgets.iqt_combobox_select", "IQtComboboxSelect"),
+    "IQtTextEntry": (".iqt_widgets.iqt_text_entry", "IQtTextEntry"),
+    "IQtUnitEntry": (".iqt_widgets.iqt_unit_entry", "IQtUnitEntry"),
+    "IQtVirtualForm": (".iqt_widgets.iqt_virtual_form", "IQtVirtualForm"),
+    "FormField": (".iqt_widgets.iqt_virtual_form", "FormField"),
+    "IQtSignalHook": (".auxiliaries.iqt_signal_hook", "IQtSignalHook"),
+    "IQtSignalHookGroup": (".auxiliaries.iqt_signal_hook_group", "IQtSignalHookGroup"),
+    "CommitJournal": (".auxiliaries.commit_journal", "CommitJournal"),
+    "run_async": (".auxiliaries.qt_async", "run_async"),
+    "default": (".auxiliaries.default", "default"),
+    "AdaptiveDebounce": (".auxiliaries.debounce", "AdaptiveDebounce"),
+    "DebouncePolicy": (".auxiliaries.debounce", "DebouncePolicy"),
+    "pure_validator": (".auxiliaries.validation_cache", "pure_validator"),
+}
 
 __all__ = [
     "__version__",
@@ -73,7 +121,21 @@ __all__ = [
     "IQtRangeSlider",
     "IQtRealUnitedScalarEntry",
     "IQtUnitEntry",
+    # Virtualized forms
+    "IQtVirtualForm",
+    "FormField",
     "IQtSignalHook",
+    "IQtSignalHookGroup",
+    # Undo/redo
+    "CommitJournal",
+    # asyncio
+    "run_async",
     # Debouncing / default
     "default",
+    "AdaptiveDebounce",
+    "DebouncePolicy",
+    # Validation
+    "pure_validator",
 ]
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, globals(), _LAZY_ATTRIBUTES)
@@ -0,0 +1,250 @@
+"""
+Undo/redo journal over controller commits
+=========================================
+
+**`CommitJournal`** records every successful commit of the controllers it is
+attached to as a delta: the submitted values and the previous values of the
+affected hooks. Unlike snapshotting all values on each change, an edit costs
+memory proportional to what it changed.
+
+Usage
+-----
+
+```python
+journal = CommitJournal(memory_budget_bytes=1_000_000)
+journal.attach(payload.registered_controllers)
+
+undo_action.triggered.connect(journal.undo)
+redo_action.triggered.connect(journal.redo)
+```
+
+Grouping
+--------
+Commits following each other within ``group_window_ms`` (by default the global
+debounce time) are merged into one entry, so dragging a slider or typing a word
+is undone in one step. For a merged entry, the earliest previous value and the
+latest submitted value of each hook are kept.
+
+Memory budget
+-------------
+Each entry's size is estimated from its values. When the total exceeds
+``memory_budget_bytes``, the oldest undo entries are dropped.
+
+Undo and redo are applied through the batched nexus submission path (one
+``NexusManager.submit_values`` call per entry) and are not recorded again.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Mapping, Optional
+from logging import Logger
+import sys
+import time
+
+from nexpy.core import Nexus, NexusManager
+
+from .default import default
+from .resources import log_msg
+
+# Rough per-item overhead of an entry (dict slots, hook reference), in bytes
+_ITEM_OVERHEAD_BYTES: int = 64
+
+
+@dataclass
+class _JournalEntry:
+    nexus_manager: NexusManager
+    before: dict[Any, Any]
+    after: dict[Any, Any]
+    last_commit_time: float
+    size_bytes: int = field(default=0)
+
+
+class CommitJournal:
+    """
+    Bounded undo/redo history of controller commits, recorded as deltas per hook.
+
+    Parameters
+    ----------
+    memory_budget_bytes : int, optional
+        Upper bound for the estimated memory of all entries. Defaults to 10 MB.
+    group_window_ms : int | Callable[[], int], optional
+        Commits within this time of the previous commit are merged into one entry.
+        Defaults to the global debounce time (``default.DEFAULT_DEBOUNCE_MS``).
+    size_estimator : Callable[[Any], int], optional
+        Estimates the memory of a single value. Defaults to ``sys.getsizeof``.
+    logger : Logger, optional
+        Logger instance for debugging.
+    """
+
+    def __init__(
+        self,
+        *,
+        memory_budget_bytes: int = 10_000_000,
+        group_window_ms: Optional[int|Callable[[], int]] = None,
+        size_estimator: Callable[[Any], int] = sys.getsizeof,
+        logger: Optional[Logger] = None,
+    ) -> None:
+        if memory_budget_bytes <= 0:
+            raise ValueError(f"memory_budget_bytes must be positive, got {memory_budget_bytes}")
+        self._memory_budget_bytes: int = memory_budget_bytes
+        self._group_window_ms: int|Callable[[], int] = group_window_ms if group_window_ms is not None else (lambda: default.DEFAULT_DEBOUNCE_MS)
+        self._size_estimator: Callable[[Any], int] = size_estimator
+        self._logger: Optional[Logger] = logger
+
+        self._undo_stack: deque[_JournalEntry] = deque()
+        self._redo_stack: list[_JournalEntry] = []
+        self._memory_usage: int = 0
+        self._group_open: bool = False
+
+    ###########################################################################
+    # Public API
+    ###########################################################################
+
+    def attach(self, controllers: Iterable[Any]) -> None:
+        """Record the commits of the given controllers in this journal."""
+        for controller in controllers:
+            controller.set_commit_journal(self)
+
+    def detach(self, controllers: Iterable[Any]) -> None:
+        """Stop recording the commits of the given controllers."""
+        for controller in controllers:
+            if controller.commit_journal is self:
+                controller.set_commit_journal(None)
+
+    @property
+    def can_undo(self) -> bool:
+        return len(self._undo_stack) > 0
+
+    @property
+    def can_redo(self) -> bool:
+        return len(self._redo_stack) > 0
+
+    @property
+    def undo_count(self) -> int:
+        """Number of entries that can be undone."""
+        return len(self._undo_stack)
+
+    @property
+    def redo_count(self) -> int:
+        """Number of entries that can be redone."""
+        return len(self._redo_stack)
+
+    @property
+    def memory_usage(self) -> int:
+        """Estimated memory of all entries in bytes."""
+        return self._memory_usage
+
+    def end_group(self) -> None:
+        """Close the current entry; the next commit starts a new one even within the group window."""
+        self._group_open = False
+
+    def undo(self) -> tuple[bool, str]:
+        """Restore the previous values of the latest entry."""
+        if not self._undo_stack:
+            return False, "Nothing to undo"
+        entry = self._undo_stack.pop()
+        success, msg = self._apply(entry, entry.before)
+        if success:
+            self._redo_stack.append(entry)
+        else:
+            self._memory_usage -= entry.size_bytes
+        self._group_open = False
+        return success, msg
+
+    def redo(self) -> tuple[bool, str]:
+        """Re-apply the submitted values of the latest undone entry."""
+        if not self._redo_stack:
+            return False, "Nothing to redo"
+        entry = self._redo_stack.pop()
+        success, msg = self._apply(entry, entry.after)
+        if success:
+            self._undo_stack.append(entry)
+        else:
+            self._memory_usage -= entry.size_bytes
+        self._group_open = False
+        return success, msg
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._undo_stack.clear()
+        self._redo_stack.clear()
+        self._memory_usage = 0
+        self._group_open = False
+
+    ###########################################################################
+    # Recording (called by BaseController after a successful commit)
+    ###########################################################################
+
+    def record(self, nexus_manager: NexusManager, before: Mapping[Any, Any], after: Mapping[Any, Any]) -> None:
+        """
+        Record a commit.
+
+        Parameters
+        ----------
+        nexus_manager : NexusManager
+            The nexus manager the commit was submitted to.
+        before : Mapping[Hook, Any]
+            The values of the submitted hooks before the commit.
+        after : Mapping[Hook, Any]
+            The submitted values.
+        """
+        now = time.monotonic()
+        self._drop_redo()
+
+        last = self._undo_stack[-1] if self._undo_stack else None
+        if (
+            self._group_open
+            and last is not None
+            and last.nexus_manager is nexus_manager
+            and (now - last.last_commit_time) * 1000.0 <= self._group_window()
+        ):
+            self._memory_usage -= last.size_bytes
+            for hook, value in before.items():
+                last.before.setdefault(hook, value)
+            last.after.update(after)
+            last.last_commit_time = now
+            last.size_bytes = self._estimate(last)
+            self._memory_usage += last.size_bytes
+        else:
+            entry = _JournalEntry(nexus_manager, dict(before), dict(after), now)
+            entry.size_bytes = self._estimate(entry)
+            self._undo_stack.append(entry)
+            self._memory_usage += entry.size_bytes
+
+        self._group_open = True
+        self._enforce_budget()
+
+    ###########################################################################
+    # Internal methods
+    ###########################################################################
+
+    def _group_window(self) -> int:
+        return self._group_window_ms() if callable(self._group_window_ms) else self._group_window_ms
+
+    def _estimate(self, entry: _JournalEntry) -> int:
+        size = 0
+        for values in (entry.before, entry.after):
+            for value in values.values():
+                size += _ITEM_OVERHEAD_BYTES + self._size_estimator(value)
+        return size
+
+    def _drop_redo(self) -> None:
+        for entry in self._redo_stack:
+            self._memory_usage -= entry.size_bytes
+        self._redo_stack.clear()
+
+    def _enforce_budget(self) -> None:
+        # Keep at least the latest entry, even if it alone exceeds the budget
+        while self._memory_usage > self._memory_budget_bytes and len(self._undo_stack) > 1:
+            dropped = self._undo_stack.popleft()
+            self._memory_usage -= dropped.size_bytes
+
+    def _apply(self, entry: _JournalEntry, values: Mapping[Any, Any]) -> tuple[bool, str]:
+        # Resolve nexuses now: hooks may have been joined into other nexuses since the commit
+        nexus_and_values: dict[Nexus[Any], Any] = {hook._get_nexus(): value for hook, value in values.items()}
+        success, msg = entry.nexus_manager.submit_values(nexus_and_values, logger=self._logger)
+        if not success:
+            log_msg(self, "_apply", self._logger, f"Failed to apply journal entry: {msg}")
+        return success, msg
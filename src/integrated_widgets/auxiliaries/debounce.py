@@ -0,0 +1,164 @@
+"""
+Debounce policies for controller submissions
+============================================
+
+A controller's ``debounce_ms`` is a fixed delay or a callable returning one.
+
+`DebouncePolicy` adds edge options to the delay:
+
+* ``trailing`` (default): commit when the input has been quiet for the delay
+* ``leading``: commit the first change of a burst immediately
+* ``max_wait_ms``: commit at least every ``max_wait_ms`` during sustained input
+  (e.g. a held arrow key), which the restart-on-every-change delay alone never does
+
+```python
+controller = FloatEntryController(value, debounce_ms=DebouncePolicy(delay_ms=100, max_wait_ms=500))
+default.DEBOUNCE_POLICY = DebouncePolicy(max_wait_ms=250)   # edge options for all other controllers
+```
+
+`AdaptiveDebounce` is a callable that tunes the delay to what a commit of the
+controller costs. Commits that fan out to large nexus graphs are debounced
+longer, and cheap commits happen almost immediately.
+
+```python
+controller = FloatEntryController(value, debounce_ms=AdaptiveDebounce(min_ms=0, max_ms=300))
+controller.debounce_diagnostics()   # {'debounce_ms': 12, 'average_commit_ms': 3.1, ...}
+```
+
+The controller reports the duration of every commit (nexus submission including
+propagation) to its `AdaptiveDebounce`. The delay is ``cost_factor`` times the
+exponentially weighted moving average of these durations, clamped to
+``[min_ms, max_ms]``. Use one instance per controller.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+
+class AdaptiveDebounce:
+    """
+    Debounce delay derived from the measured commit cost (moving average).
+
+    Parameters
+    ----------
+    min_ms : int, optional
+        Lower bound of the delay. Defaults to 0.
+    max_ms : int, optional
+        Upper bound of the delay. Defaults to 500.
+    initial_ms : int, optional
+        Delay before the first commit has been measured. Defaults to ``min_ms``.
+    cost_factor : float, optional
+        Delay per millisecond of average commit cost. Defaults to 4.0.
+    smoothing : float, optional
+        Weight of the newest measurement in the moving average, in (0, 1]. Defaults to 0.2.
+    """
+
+    __slots__ = ("_min_ms", "_max_ms", "_initial_ms", "_cost_factor", "_smoothing", "_average_ms", "_last_ms", "_samples")
+
+    def __init__(
+        self,
+        *,
+        min_ms: int = 0,
+        max_ms: int = 500,
+        initial_ms: Optional[int] = None,
+        cost_factor: float = 4.0,
+        smoothing: float = 0.2,
+    ) -> None:
+        if min_ms < 0 or max_ms < min_ms:
+            raise ValueError(f"Invalid bounds: min_ms={min_ms}, max_ms={max_ms}")
+        if not 0.0 < smoothing <= 1.0:
+            raise ValueError(f"smoothing must be in (0, 1], got {smoothing}")
+        if cost_factor < 0:
+            raise ValueError(f"cost_factor must not be negative, got {cost_factor}")
+        self._min_ms: int = min_ms
+        self._max_ms: int = max_ms
+        self._initial_ms: int = min_ms if initial_ms is None else min(max(initial_ms, min_ms), max_ms)
+        self._cost_factor: float = cost_factor
+        self._smoothing: float = smoothing
+        self._average_ms: Optional[float] = None
+        self._last_ms: Optional[float] = None
+        self._samples: int = 0
+
+    def __call__(self) -> int:
+        """Get the current delay in milliseconds."""
+        if self._average_ms is None:
+            return self._initial_ms
+        return int(min(max(round(self._cost_factor * self._average_ms), self._min_ms), self._max_ms))
+
+    def record_commit(self, duration_ms: float) -> None:
+        """Feed the duration of a commit (called by the controller)."""
+        self._last_ms = duration_ms
+        self._samples += 1
+        if self._average_ms is None:
+            self._average_ms = duration_ms
+        else:
+            self._average_ms += self._smoothing * (duration_ms - self._average_ms)
+
+    def reset(self) -> None:
+        """Forget all measurements."""
+        self._average_ms = None
+        self._last_ms = None
+        self._samples = 0
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Get the measured commit cost and the resulting delay."""
+        return {
+            "debounce_ms": self(),
+            "average_commit_ms": self._average_ms,
+            "last_commit_ms": self._last_ms,
+            "samples": self._samples,
+            "min_ms": self._min_ms,
+            "max_ms": self._max_ms,
+        }
+
+    def __repr__(self) -> str:
+        return f"AdaptiveDebounce(debounce_ms={self()}, min_ms={self._min_ms}, max_ms={self._max_ms}, samples={self._samples})"
+
+
+@dataclass(frozen=True)
+class DebouncePolicy:
+    """
+    Debounce delay with leading-edge, trailing-edge and max-wait options.
+
+    Can be passed as ``debounce_ms`` of a controller, or set globally as
+    ``default.DEBOUNCE_POLICY``. The global policy applies to controllers whose
+    ``debounce_ms`` is not a policy; their own delay is kept.
+
+    Parameters
+    ----------
+    delay_ms : int | Callable[[], int], optional
+        Quiet time before a trailing commit (e.g. an `AdaptiveDebounce`). None uses
+        the global default debounce time. Defaults to None.
+    leading : bool, optional
+        Commit the first change of a burst immediately. Defaults to False.
+    trailing : bool, optional
+        Commit the latest change once the input has been quiet for ``delay_ms``. Defaults to True.
+    max_wait_ms : int, optional
+        Maximum time a change may stay uncommitted during sustained input. Defaults to None (no limit).
+    """
+
+    delay_ms: Optional[int|Callable[[], int]] = None
+    leading: bool = False
+    trailing: bool = True
+    max_wait_ms: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if not self.leading and not self.trailing and self.max_wait_ms is None:
+            raise ValueError("A debounce policy needs a leading edge, a trailing edge or a max wait")
+        if self.max_wait_ms is not None and self.max_wait_ms < 0:
+            raise ValueError(f"max_wait_ms must not be negative, got {self.max_wait_ms}")
+
+    def __call__(self) -> int:
+        """Get the current delay in milliseconds."""
+        if self.delay_ms is None:
+            from .default import get_default_debounce_ms
+            return get_default_debounce_ms()
+        if callable(self.delay_ms):
+            return self.delay_ms()
+        return self.delay_ms
+
+
+# Trailing-edge debouncing only (the behavior without any policy)
+TRAILING_ONLY: DebouncePolicy = DebouncePolicy()
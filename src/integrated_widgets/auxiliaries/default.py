@@ -4,7 +4,10 @@
 
 """Global default configuration for integrated_widgets."""
 
-from typing import Callable
+from typing import Callable, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .debounce import DebouncePolicy
 
 # Global default debounce time in milliseconds
 _DEFAULT_DEBOUNCE_MS: int = 50
@@ -24,14 +27,98 @@ def set_default_debounce_ms(value: int) -> None:
 # Create the callable that returns the current value
 default_debounce_ms: Callable[[], int] = get_default_debounce_ms
 
+# Whether controllers defer widget invalidation while none of their widgets is visible
+_DEFER_HIDDEN_INVALIDATION: bool = False
+
+
+def get_defer_hidden_invalidation() -> bool:
+    """Get whether invalidations of hidden controllers are deferred."""
+    return _DEFER_HIDDEN_INVALIDATION
+
+
+def set_defer_hidden_invalidation(value: bool) -> None:
+    """Set whether invalidations of hidden controllers are deferred."""
+    global _DEFER_HIDDEN_INVALIDATION
+    _DEFER_HIDDEN_INVALIDATION = value
+
+
+# Edge and max-wait options for controllers whose debounce_ms is not a DebouncePolicy
+_DEBOUNCE_POLICY: Optional["DebouncePolicy"] = None
+
+
+def get_debounce_policy() -> Optional["DebouncePolicy"]:
+    """Get the global debounce policy (None means trailing-edge debouncing only)."""
+    return _DEBOUNCE_POLICY
+
+
+def set_debounce_policy(value: Optional["DebouncePolicy"]) -> None:
+    """Set the global debounce policy."""
+    global _DEBOUNCE_POLICY
+    _DEBOUNCE_POLICY = value
+
+
+# Size of the result cache of validators marked with pure_validator (0 disables caching)
+_VALIDATION_CACHE_SIZE: int = 256
+
+
+def get_validation_cache_size() -> int:
+    """Get the size of the validation cache of new composite controllers."""
+    return _VALIDATION_CACHE_SIZE
+
+
+def set_validation_cache_size(value: int) -> None:
+    """Set the size of the validation cache of new composite controllers."""
+    if value < 0:
+        raise ValueError(f"Validation cache size must not be negative, got {value}")
+    global _VALIDATION_CACHE_SIZE
+    _VALIDATION_CACHE_SIZE = value
+
+
+# Time budget per slice of time-sliced invalidation flushing (None: every request is its own Qt event)
+_INVALIDATION_FRAME_BUDGET_MS: Optional[float] = None
+
+
+def get_invalidation_frame_budget_ms() -> Optional[float]:
+    """Get the time budget per invalidation slice (None means time slicing is disabled)."""
+    return _INVALIDATION_FRAME_BUDGET_MS
+
+
+def set_invalidation_frame_budget_ms(value: Optional[float]) -> None:
+    """Set the time budget per invalidation slice."""
+    if value is not None and value <= 0:
+        raise ValueError(f"Invalidation frame budget must be positive, got {value}")
+    global _INVALIDATION_FRAME_BUDGET_MS
+    _INVALIDATION_FRAME_BUDGET_MS = value
+
+
+# Whether controllers skip commits of values equal to the current hook values (see auxiliaries.equality)
+_ELIDE_UNCHANGED_COMMITS: bool = False
+
+
+def get_elide_unchanged_commits() -> bool:
+    """Get whether commits of unchanged values are skipped."""
+    return _ELIDE_UNCHANGED_COMMITS
+
+
+def set_elide_unchanged_commits(value: bool) -> None:
+    """Set whether commits of unchanged values are skipped."""
+    global _ELIDE_UNCHANGED_COMMITS
+    _ELIDE_UNCHANGED_COMMITS = value
+
 
 class DefaultConfig:
-    """Configuration object that allows setting DEFAULT_DEBOUNCE_MS.
+    """Configuration object that allows setting DEFAULT_DEBOUNCE_MS, DEFER_HIDDEN_INVALIDATION, DEBOUNCE_POLICY,
+    VALIDATION_CACHE_SIZE, INVALIDATION_FRAME_BUDGET_MS and ELIDE_UNCHANGED_COMMITS.
     
     Usage:
         from integrated_widgets import default
         
         default.DEFAULT_DEBOUNCE_MS = 50
+        default.DEFER_HIDDEN_INVALIDATION = True
+        default.DEBOUNCE_POLICY = DebouncePolicy(max_wait_ms=250)
+        default.VALIDATION_CACHE_SIZE = 0
+        default.INVALIDATION_FRAME_BUDGET_MS = 8.0
+        default.ELIDE_UNCHANGED_COMMITS = True
     """
     
     @property
@@ -44,6 +131,78 @@ class DefaultConfig:
         """Set the default debounce time."""
         set_default_debounce_ms(value)
 
+    @property
+    def DEFER_HIDDEN_INVALIDATION(self) -> bool:
+        """Get whether controllers defer widget updates while all their widgets are hidden."""
+        return get_defer_hidden_invalidation()
+
+    @DEFER_HIDDEN_INVALIDATION.setter
+    def DEFER_HIDDEN_INVALIDATION(self, value: bool) -> None:
+        """Set whether controllers defer widget updates while all their widgets are hidden.
+
+        When enabled, invalidations of a controller whose widgets are all hidden (hidden tab,
+        collapsed group box, minimized window) are collapsed into one pending update that is
+        applied when one of its widgets is shown again.
+        """
+        set_defer_hidden_invalidation(value)
+
+    @property
+    def DEBOUNCE_POLICY(self) -> Optional["DebouncePolicy"]:
+        """Get the global debounce policy."""
+        return get_debounce_policy()
+
+    @DEBOUNCE_POLICY.setter
+    def DEBOUNCE_POLICY(self, value: Optional["DebouncePolicy"]) -> None:
+        """Set the global debounce policy.
+
+        Its leading-edge, trailing-edge and max-wait options apply to all controllers whose
+        debounce_ms is not a DebouncePolicy; their own debounce delay is kept.
+        """
+        set_debounce_policy(value)
+
+    @property
+    def VALIDATION_CACHE_SIZE(self) -> int:
+        """Get the size of the validation cache of composite controllers."""
+        return get_validation_cache_size()
+
+    @VALIDATION_CACHE_SIZE.setter
+    def VALIDATION_CACHE_SIZE(self, value: int) -> None:
+        """Set the size of the validation cache of composite controllers created afterwards.
+
+        Only validators marked with pure_validator are cached. 0 disables caching.
+        """
+        set_validation_cache_size(value)
+
+    @property
+    def INVALIDATION_FRAME_BUDGET_MS(self) -> Optional[float]:
+        """Get the time budget per invalidation slice."""
+        return get_invalidation_frame_budget_ms()
+
+    @INVALIDATION_FRAME_BUDGET_MS.setter
+    def INVALIDATION_FRAME_BUDGET_MS(self, value: Optional[float]) -> None:
+        """Set the time budget per invalidation slice.
+
+        When set, invalidation requests are deduplicated and flushed by the shared
+        InvalidationScheduler: focused and visible controllers first, at most this many
+        milliseconds per event-loop turn. None (the default) disables time slicing.
+        """
+        set_invalidation_frame_budget_ms(value)
+
+    @property
+    def ELIDE_UNCHANGED_COMMITS(self) -> bool:
+        """Get whether commits of unchanged values are skipped."""
+        return get_elide_unchanged_commits()
+
+    @ELIDE_UNCHANGED_COMMITS.setter
+    def ELIDE_UNCHANGED_COMMITS(self, value: bool) -> None:
+        """Set whether commits of unchanged values are skipped.
+
+        When enabled, submissions whose values all equal the current hook values
+        (type-aware, see integrated_widgets.auxiliaries.equality) are neither submitted
+        to the nexus nor followed by a widget invalidation. Disabled by default.
+        """
+        set_elide_unchanged_commits(value)
+
 
 # Create the default instance for easy access
 default = DefaultConfig()
\ No newline at end of file
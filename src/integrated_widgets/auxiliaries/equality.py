@@ -0,0 +1,86 @@
+"""
+Type-aware value equality for no-op commit elision
+==================================================
+
+With ``default.ELIDE_UNCHANGED_COMMITS = True`` (off by default), controllers skip
+commits whose values all equal the current hook values (e.g. `evaluate()` after
+focus leaves an unchanged field), so no nexus submission and no invalidation
+happens. `values_equal` decides what "equal" means:
+
+- ``float``: exactly equal, and NaN equals NaN. Set ``FLOAT_REL_TOL`` / ``FLOAT_ABS_TOL``
+  to also treat floats within a tolerance as equal (e.g. ``FLOAT_REL_TOL = 1e-12``)
+- ``RealUnitedScalar``: same display unit and equal values (as floats); NaN equals NaN.
+  The display unit is part of the state, so ``100 m`` and ``0.1 km`` are not equal.
+- Sets (``set``, ``frozenset``, other ``AbstractSet``): set equality, regardless of set type
+- Everything else: same type and ``==``
+
+Values of different types are never equal, so e.g. ``1`` vs. ``1.0`` or ``True``
+vs. ``1`` are still committed (and validated).
+
+Add or replace the rule of a type with `register_value_equality`, or give a
+controller its own with `BaseController.set_value_equality`:
+
+```python
+register_value_equality(Decimal, lambda a, b: a.compare_total(b) == 0)
+controller.set_value_equality(lambda current, new: current is new)
+```
+"""
+
+from __future__ import annotations
+
+from collections.abc import Set as AbstractSet
+from typing import Any, Callable
+import math
+
+from united_system import RealUnitedScalar
+
+ValueEquality = Callable[[Any, Any], bool]
+"""Decides whether a submitted value equals the current value: ``(current, new) -> bool``."""
+
+FLOAT_REL_TOL: float = 0.0
+FLOAT_ABS_TOL: float = 0.0
+
+_EQUALITY_BY_TYPE: dict[type, ValueEquality] = {}
+
+
+def _floats_equal(a: float, b: float) -> bool:
+    if math.isnan(a) or math.isnan(b):
+        return math.isnan(a) and math.isnan(b)
+    return math.isclose(a, b, rel_tol=FLOAT_REL_TOL, abs_tol=FLOAT_ABS_TOL)
+
+
+def _real_united_scalars_equal(a: RealUnitedScalar, b: RealUnitedScalar) -> bool:
+    return a.unit == b.unit and _floats_equal(a.value(), b.value())
+
+
+def _sets_equal(a: AbstractSet[Any], b: AbstractSet[Any]) -> bool:
+    return len(a) == len(b) and all(item in b for item in a)
+
+
+def register_value_equality(value_type: type, equality: ValueEquality) -> None:
+    """Use *equality* to compare values of exactly *value_type* (subclasses need their own registration)."""
+    _EQUALITY_BY_TYPE[value_type] = equality
+
+
+def values_equal(current: Any, new: Any) -> bool:
+    """Whether submitting *new* instead of *current* would be a no-op (see module docstring)."""
+    if current is new:
+        return True
+    value_type = type(current)
+    if isinstance(current, AbstractSet) and isinstance(new, AbstractSet):
+        equality = _EQUALITY_BY_TYPE.get(value_type, _sets_equal)
+    elif type(new) is not value_type:
+        return False
+    else:
+        equality = _EQUALITY_BY_TYPE.get(value_type)
+    try:
+        if equality is not None:
+            return bool(equality(current, new))
+        return bool(current == new)
+    except Exception:
+        # E.g. ambiguous truth values of array comparisons: commit to be safe
+        return False
+
+
+register_value_equality(float, _floats_equal)
+register_value_equality(RealUnitedScalar, _real_united_scalars_equal)
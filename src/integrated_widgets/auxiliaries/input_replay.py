@@ -0,0 +1,520 @@
+"""
+Recording and replay of user input
+==================================
+
+`InputRecorder` records the user input of a widget tree:
+
+- every ``userInputFinishedSignal`` emission of its controlled widgets (see
+  `BaseControlledWidget`), together with the widget state the controller reads
+  (e.g. the text of a line edit),
+- text edits of line edits and editable combo boxes,
+- handle drags of range sliders.
+
+The result is an `InputLog` with microsecond timestamps, stored as compact JSON.
+`replay_input` plays a log back into a freshly built tree of the same shape,
+either in real time or as fast as possible, and measures the work it caused.
+
+Usage
+-----
+
+```python
+recorder = InputRecorder(main_widget)
+recorder.start()
+...  # operator session
+recorder.stop().save("session.json")
+
+report = replay_input(other_main_widget, InputLog.load("session.json"), speed=None)
+print(report)
+# Replayed 412 events in 903.1 ms: 57 commits (3 elided), 171 invalidations, ...
+```
+
+Widgets are addressed by the payload path of their controller (see
+`collect_controllers`) and their position among the controller's controlled
+widgets, e.g. ``"settings.temperature#0"``. The widget classes are stored with
+the log and checked before replay.
+
+Measurements
+------------
+The replay uses the tracing instrumentation (see `tracing`) and enables it if
+it is off:
+
+- ``commit_latencies_ms``: for every commit, the time from the oldest input of
+  its controller since the previous commit to the end of the commit
+- ``invalidations``: widget invalidations
+- ``frame_times_ms``: durations of the event-loop passes that applied an input or
+  ran instrumented work (commits, invalidations, rebuilds, ...)
+
+Widgets need not be shown. Note that with ``default.DEFER_HIDDEN_INVALIDATION``
+hidden controllers defer their invalidations until they become visible.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+import json
+import time
+
+from PySide6.QtCore import QCoreApplication, QEventLoop
+from PySide6.QtWidgets import QAbstractButton, QButtonGroup, QCheckBox, QComboBox, QLineEdit, QListWidget
+
+from . import tracing
+from .tracing import TraceEvent
+from ..controlled_widgets.base_controlled_widget import BaseControlledWidget
+from ..controlled_widgets.controlled_range_slider import ControlledRangeSlider
+from ..controllers.core.base_controller import BaseController
+
+LOG_FORMAT: str = "iw-input-1"
+
+# Event kinds
+INPUT: str = "input"
+"""A ``userInputFinishedSignal`` emission."""
+EDIT: str = "edit"
+"""A text edit of a line edit or an editable combo box."""
+DRAG: str = "drag"
+"""A handle drag of a range slider."""
+
+# Ring buffer size of the tracer the replay enables if tracing is off
+_REPLAY_TRACE_CAPACITY: int = 1_000_000
+
+_SETTLE_POLL_S: float = 0.001
+
+
+@dataclass(frozen=True)
+class InputEvent:
+    """A recorded user input."""
+
+    time_us: int
+    """Time since the start of the recording."""
+    widget: int
+    """Index into `InputLog.widgets`."""
+    kind: str
+    """`INPUT`, `EDIT` or `DRAG`."""
+    arg: Any = None
+    """The signal argument (JSON-encoded, see `InputLog`)."""
+    state: Any = None
+    """The widget state at the time of the input, restored before the signal is replayed."""
+
+
+@dataclass(frozen=True)
+class InputLog:
+    """
+    Recorded user input of a widget tree.
+
+    Signal arguments and widget states are stored as JSON values; tuples are
+    stored as ``{"t": [...]}`` and buttons of radio button groups by their
+    position in the group, ``{"b": index}``.
+    """
+
+    widgets: tuple[tuple[str, str], ...]
+    """Address and class name of every recorded widget."""
+    events: tuple[InputEvent, ...]
+    """The events, oldest first."""
+
+    @property
+    def duration_ms(self) -> float:
+        return self.events[-1].time_us / 1000.0 if self.events else 0.0
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def to_json(self) -> str:
+        """Encode as compact JSON (one array per event)."""
+        return json.dumps(
+            {
+                "format": LOG_FORMAT,
+                "widgets": [list(widget) for widget in self.widgets],
+                "events": [[event.time_us, event.widget, event.kind, event.arg, event.state] for event in self.events],
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, text: str | bytes) -> "InputLog":
+        data = json.loads(text)
+        if data.get("format") != LOG_FORMAT:
+            raise ValueError(f"Not an input log of format {LOG_FORMAT!r}: {data.get('format')!r}")
+        return cls(
+            tuple((address, class_name) for address, class_name in data["widgets"]),
+            tuple(InputEvent(time_us, widget, kind, arg, state) for time_us, widget, kind, arg, state in data["events"]),
+        )
+
+    def save(self, path: str | Path) -> None:
+        Path(path).write_text(self.to_json(), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path) -> "InputLog":
+        return cls.from_json(Path(path).read_text(encoding="utf-8"))
+
+
+@dataclass(frozen=True)
+class ReplayReport:
+    """Measurements of a replay (see module docstring)."""
+
+    events: int
+    duration_ms: float
+    commits: int
+    elided_commits: int
+    invalidations: int
+    commit_latencies_ms: tuple[float, ...] = field(repr=False)
+    frame_times_ms: tuple[float, ...] = field(repr=False)
+    dropped_trace_events: int = 0
+    """Trace events lost to the ring buffer; if not 0, the counts are incomplete."""
+
+    def summary(self) -> dict[str, float]:
+        """Counts, and mean, 95th percentile and maximum of the commit latencies and frame times."""
+        summary: dict[str, float] = {
+            "events": self.events,
+            "duration_ms": self.duration_ms,
+            "commits": self.commits,
+            "elided_commits": self.elided_commits,
+            "invalidations": self.invalidations,
+        }
+        for name, samples in (("commit_latency", self.commit_latencies_ms), ("frame_time", self.frame_times_ms)):
+            summary[f"{name}_mean_ms"] = sum(samples) / len(samples) if samples else 0.0
+            summary[f"{name}_p95_ms"] = _percentile(samples, 0.95)
+            summary[f"{name}_max_ms"] = max(samples, default=0.0)
+        return summary
+
+    def __str__(self) -> str:
+        summary = self.summary()
+        return (
+            f"Replayed {self.events} events in {self.duration_ms:.1f} ms: "
+            f"{self.commits} commits ({self.elided_commits} elided), {self.invalidations} invalidations, "
+            f"commit latency p95 {summary['commit_latency_p95_ms']:.1f} ms, "
+            f"frame time p95 {summary['frame_time_p95_ms']:.1f} ms (max {summary['frame_time_max_ms']:.1f} ms)"
+        )
+
+
+###########################################################################
+# Widget addressing and state
+###########################################################################
+
+def collect_controlled_widgets(root: Any) -> dict[str, BaseControlledWidget]:
+    """
+    Collect the controlled widgets of a widget tree, keyed by their address (see module docstring).
+
+    Parameters
+    ----------
+    root : LayoutPayloadBase | IQtWidgetBase
+        A payload, or a widget holding one.
+    """
+    from .widget_snapshot import collect_controllers
+
+    widgets: dict[str, BaseControlledWidget] = {}
+    for path, controller in collect_controllers(root).items():
+        for index, widget in enumerate(_controlled_widgets_of(controller)):
+            widgets[f"{path}#{index}"] = widget
+    return widgets
+
+
+def _controlled_widgets_of(controller: BaseController[Any, Any]) -> list[BaseControlledWidget]:
+    # Registration order; QButtonGroup-based widgets are not registered and found among the attributes
+    widgets: list[BaseControlledWidget] = [widget for widget in controller._controlled_widgets if isinstance(widget, BaseControlledWidget)] # type: ignore
+    for value in vars(controller).values():
+        if isinstance(value, BaseControlledWidget) and not any(value is widget for widget in widgets):
+            widgets.append(value)
+    return widgets
+
+
+def _encode(value: Any, widget: Any) -> Any:
+    if isinstance(value, tuple):
+        return {"t": [_encode(item, widget) for item in value]} # type: ignore
+    if isinstance(value, QAbstractButton) and isinstance(widget, QButtonGroup):
+        return {"b": widget.buttons().index(value)}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, list):
+        return [_encode(item, widget) for item in value] # type: ignore
+    # Not replayable; the restored widget state has to do
+    return None
+
+
+def _decode(value: Any, widget: Any) -> Any:
+    if isinstance(value, dict):
+        if "t" in value:
+            return tuple(_decode(item, widget) for item in value["t"]) # type: ignore
+        if "b" in value and isinstance(widget, QButtonGroup):
+            return widget.buttons()[value["b"]]
+    if isinstance(value, list):
+        return [_decode(item, widget) for item in value] # type: ignore
+    return value
+
+
+def _capture_state(widget: BaseControlledWidget) -> Any:
+    if isinstance(widget, QLineEdit):
+        return widget.text()
+    if isinstance(widget, QComboBox):
+        return None if widget.isEditable() else widget.currentIndex()
+    if isinstance(widget, QCheckBox):
+        return widget.checkState().value
+    if isinstance(widget, QListWidget):
+        return sorted(widget.row(item) for item in widget.selectedItems())
+    if isinstance(widget, ControlledRangeSlider):
+        return list(widget.getCurrentSpanTickPositions())
+    if isinstance(widget, QButtonGroup):
+        return widget.buttons().index(widget.checkedButton()) if widget.checkedButton() is not None else None
+    return None
+
+
+def _restore_state(widget: BaseControlledWidget, state: Any) -> None:
+    if state is None:
+        return
+    was_blocked = widget.blockSignals(True) # type: ignore
+    try:
+        if isinstance(widget, QLineEdit):
+            widget.setText(state)
+        elif isinstance(widget, QComboBox):
+            widget.setCurrentIndex(state)
+        elif isinstance(widget, QCheckBox):
+            widget.setCheckState(type(widget.checkState())(state))
+        elif isinstance(widget, QListWidget):
+            widget.clearSelection()
+            for row in state:
+                item = widget.item(row)
+                if item is not None:
+                    item.setSelected(True)
+        elif isinstance(widget, ControlledRangeSlider):
+            widget.setCurrentSpanTickPositions(*state)
+        elif isinstance(widget, QButtonGroup):
+            buttons = widget.buttons()
+            if 0 <= state < len(buttons):
+                buttons[state].setChecked(True)
+    finally:
+        widget.blockSignals(was_blocked) # type: ignore
+
+
+###########################################################################
+# Recording
+###########################################################################
+
+class InputRecorder:
+    """
+    Records the user input of a widget tree into an `InputLog`.
+
+    The controlled widgets are collected when recording starts, so rebuild the
+    tree before, not during a recording.
+
+    Parameters
+    ----------
+    root : LayoutPayloadBase | IQtWidgetBase
+        The widget tree to record.
+    """
+
+    def __init__(self, root: Any) -> None:
+        self._root = root
+        self._widgets: list[tuple[str, str]] = []
+        self._events: list[InputEvent] = []
+        self._connections: list[tuple[Any, Callable[..., None]]] = []
+        self._start_ns: int = 0
+
+    def start(self) -> None:
+        """Start recording (dropping the events of a previous recording)."""
+        if self._connections:
+            return
+        self._widgets.clear()
+        self._events.clear()
+        for index, (address, widget) in enumerate(collect_controlled_widgets(self._root).items()):
+            self._widgets.append((address, type(widget).__name__))
+            self._connect(widget.userInputFinishedSignal, self._recorder(index, widget, INPUT)) # type: ignore
+            if isinstance(widget, QLineEdit):
+                self._connect(widget.textEdited, self._recorder(index, widget, EDIT))
+            elif isinstance(widget, QComboBox) and widget.lineEdit() is not None:
+                self._connect(widget.lineEdit().textEdited, self._recorder(index, widget, EDIT))
+            elif isinstance(widget, ControlledRangeSlider):
+                self._connect(widget.sliderMoved, self._recorder(index, widget, DRAG))
+        self._start_ns = time.perf_counter_ns()
+
+    def stop(self) -> InputLog:
+        """Stop recording and return the log."""
+        for signal, slot in self._connections:
+            try:
+                signal.disconnect(slot)
+            except (RuntimeError, TypeError):
+                # Widget already deleted
+                pass
+        self._connections.clear()
+        return self.log
+
+    @property
+    def is_recording(self) -> bool:
+        return bool(self._connections)
+
+    @property
+    def log(self) -> InputLog:
+        """The events recorded so far."""
+        return InputLog(tuple(self._widgets), tuple(self._events))
+
+    def _connect(self, signal: Any, slot: Callable[..., None]) -> None:
+        signal.connect(slot)
+        self._connections.append((signal, slot))
+
+    def _recorder(self, index: int, widget: BaseControlledWidget, kind: str) -> Callable[..., None]:
+        def record(*args: Any) -> None:
+            time_us = (time.perf_counter_ns() - self._start_ns) // 1000
+            arg = args[0] if len(args) == 1 else (tuple(args) if args else None)
+            state = _capture_state(widget) if kind == INPUT else None
+            self._events.append(InputEvent(time_us, index, kind, _encode(arg, widget), _encode(state, widget)))
+        return record
+
+
+###########################################################################
+# Replay
+###########################################################################
+
+def replay_input(
+    root: Any,
+    log: InputLog,
+    *,
+    speed: Optional[float] = 1.0,
+    settle_timeout_ms: float = 5000.0,
+) -> ReplayReport:
+    """
+    Replay recorded user input into a widget tree and measure the work it causes.
+
+    Each input restores the recorded widget state (with the widget's Qt signals
+    blocked) and then emits the recorded signal, so controllers handle it like
+    the original input.
+
+    Parameters
+    ----------
+    root : LayoutPayloadBase | IQtWidgetBase
+        The widget tree, of the same shape as the recorded one.
+    log : InputLog
+        The recorded input.
+    speed : Optional[float], optional
+        Playback speed relative to the recording (1.0 is real time). None replays
+        as fast as possible, processing pending Qt events between inputs. Defaults to 1.0.
+    settle_timeout_ms : float, optional
+        After the last input, how long to wait at most for debounced commits and
+        invalidations to finish. Defaults to 5000 ms.
+
+    Returns
+    -------
+    ReplayReport
+        The measurements.
+
+    Raises
+    ------
+    KeyError
+        If a recorded widget is missing from the tree or has a different class.
+    """
+    if speed is not None and speed <= 0:
+        raise ValueError(f"speed must be positive or None, got {speed}")
+
+    available = collect_controlled_widgets(root)
+    widgets: list[BaseControlledWidget] = []
+    for address, class_name in log.widgets:
+        widget = available.get(address)
+        if widget is None or type(widget).__name__ != class_name:
+            found = None if widget is None else type(widget).__name__
+            raise KeyError(f"Input log does not match the widget tree at {address!r} (recorded: {class_name}, found: {found})")
+        widgets.append(widget)
+
+    owns_tracer = tracing.get_tracer() is None
+    tracer = tracing.start_tracing(_REPLAY_TRACE_CAPACITY) if owns_tracer else tracing.get_tracer()
+    assert tracer is not None
+    dropped_before = tracer.dropped_count
+    inputs: dict[str, list[int]] = {}
+    frame_times_ms: list[float] = []
+
+    def run_pass(input_start_ns: Optional[int] = None) -> None:
+        # A pass is a frame if it applied an input or any instrumented work ran in it
+        recorded_before = len(tracer._events) + tracer.dropped_count # type: ignore
+        pass_start_ns = time.perf_counter_ns() if input_start_ns is None else input_start_ns
+        QCoreApplication.processEvents(QEventLoop.ProcessEventsFlag.AllEvents)
+        if input_start_ns is not None or len(tracer._events) + tracer.dropped_count != recorded_before: # type: ignore
+            frame_times_ms.append((time.perf_counter_ns() - pass_start_ns) / 1e6)
+
+    start_ns = time.perf_counter_ns()
+    try:
+        for event in log.events:
+            if speed is not None:
+                due_ns = start_ns + int(event.time_us * 1000 / speed)
+                while time.perf_counter_ns() < due_ns:
+                    run_pass()
+                    time.sleep(min(_SETTLE_POLL_S, max(0.0, (due_ns - time.perf_counter_ns()) / 1e9)))
+            widget = widgets[event.widget]
+            input_start_ns = time.perf_counter_ns()
+            if event.kind == INPUT:
+                inputs.setdefault(tracing.subject_id(widget.controller), []).append(input_start_ns)
+            _apply_event(widget, event)
+            run_pass(input_start_ns)
+
+        settle_deadline_ns = time.perf_counter_ns() + int(settle_timeout_ms * 1e6)
+        while time.perf_counter_ns() < settle_deadline_ns and _has_pending_work(widgets):
+            run_pass()
+            time.sleep(_SETTLE_POLL_S)
+        run_pass()
+        end_ns = time.perf_counter_ns()
+        trace_events = [trace_event for trace_event in tracer.events() if trace_event.start_ns >= start_ns]
+        dropped = tracer.dropped_count - dropped_before
+    finally:
+        if owns_tracer:
+            tracing.stop_tracing()
+
+    return ReplayReport(
+        events=len(log.events),
+        duration_ms=(end_ns - start_ns) / 1e6,
+        commits=sum(1 for trace_event in trace_events if trace_event.name == "commit"),
+        elided_commits=sum(1 for trace_event in trace_events if trace_event.name == "commit_elided"),
+        invalidations=sum(1 for trace_event in trace_events if trace_event.name == "invalidate"),
+        commit_latencies_ms=_commit_latencies_ms(trace_events, inputs),
+        frame_times_ms=tuple(frame_times_ms),
+        dropped_trace_events=dropped,
+    )
+
+
+def _apply_event(widget: BaseControlledWidget, event: InputEvent) -> None:
+    arg = _decode(event.arg, widget)
+    if event.kind == EDIT:
+        editor = widget if isinstance(widget, QLineEdit) else widget.lineEdit() # type: ignore
+        editor.setText(arg)
+        editor.textEdited.emit(arg)
+    elif event.kind == DRAG:
+        _restore_state(widget, list(arg))
+        widget.sliderMoved.emit(*arg) # type: ignore
+    else:
+        _restore_state(widget, _decode(event.state, widget))
+        widget.userInputFinishedSignal.emit(arg) # type: ignore
+
+
+def _has_pending_work(widgets: Iterable[BaseControlledWidget]) -> bool:
+    from .invalidation_scheduler import _SCHEDULER
+
+    if _SCHEDULER is not None and _SCHEDULER.backlog_depth > 0:
+        return True
+    for widget in widgets:
+        # Deferred invalidations of hidden controllers wait for visibility, not for us
+        if widget.controller._pending_submission_values is not None: # type: ignore
+            return True
+    return False
+
+
+def _commit_latencies_ms(trace_events: list[TraceEvent], inputs: dict[str, list[int]]) -> tuple[float, ...]:
+    """Match every commit (or elided commit) to the oldest input of its controller since the previous one."""
+    latencies: list[float] = []
+    next_input: dict[str, int] = {}
+    commits = sorted((event for event in trace_events if event.name in ("commit", "commit_elided")), key=lambda event: event.end_ns)
+    for commit in commits:
+        if commit.subject is None:
+            continue
+        times = inputs.get(commit.subject, [])
+        position = next_input.get(commit.subject, 0)
+        if position >= len(times) or times[position] > commit.start_ns:
+            # Not caused by a replayed input (e.g. a programmatic submission)
+            continue
+        if commit.name == "commit":
+            latencies.append((commit.end_ns - times[position]) / 1e6)
+        while position < len(times) and times[position] <= commit.start_ns:
+            position += 1
+        next_input[commit.subject] = position
+    return tuple(latencies)
+
+
+def _percentile(samples: tuple[float, ...], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
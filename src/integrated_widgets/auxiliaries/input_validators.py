@@ -0,0 +1,301 @@
+"""
+Keystroke-level input validation for line edits
+===============================================
+
+Entry controllers parse their text only when editing finishes. Invalid text is
+then reverted with an invalidation round-trip, and values that parse but fail
+validation cost a failed nexus submission. The validators in this module run the
+same parse and validation rules on every keystroke instead:
+
+- Text that can never become valid (e.g. ``"1x"`` in a float entry) is rejected
+  as it is typed.
+- Text that is incomplete or fails the controller's validation (e.g. ``"1e"`` or
+  a value out of range) is kept while typing. When editing finishes, it is
+  reverted to the controller's current value without reaching the debounce and
+  commit pipeline.
+
+Unit strings are checked against a small token grammar (symbols, ``*``, ``/``,
+``·``, ``^`` exponents, superscripts and parentheses). Grammar and parse results
+are cached per text, so retyping the same prefixes does not parse units again.
+
+Enable it per controller or widget with ``keystroke_validation=True``:
+
+```python
+entry = IQtFloatEntry(value_nexpy, keystroke_validation=True)
+```
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache, partial
+from typing import Any, Callable, Generic, Literal, Optional, TypeVar
+import re
+
+from PySide6.QtCore import QObject
+from PySide6.QtGui import QValidator
+
+T = TypeVar("T")
+
+InputState = Literal["acceptable", "intermediate", "invalid"]
+
+_PARSE_CACHE_SIZE: int = 1024
+
+# Prefixes of float() input: sign, digits (with underscores), fraction and exponent
+_FLOAT_PREFIX = re.compile(r"[+-]?(?:(?:\d[\d_]*(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d*)?|\.)?")
+_INTEGER_PREFIX = re.compile(r"[+-]?(?:\d[\d_]*)?")
+_FLOAT_WORDS: tuple[str, ...] = ("infinity", "nan")
+
+# Unit token grammar
+_UNIT_TOKEN = re.compile(
+    r"(?P<ws>\s+)"
+    r"|(?P<symbol>[°%]?[^\W\d_]+|%)"
+    r"|(?P<number>\d+)"
+    r"|(?P<superscript>[⁻⁰¹²³⁴⁵⁶⁷⁸⁹]+)"
+    r"|(?P<caret>\^)"
+    r"|(?P<minus>-)"
+    r"|(?P<operator>[*/·])"
+    r"|(?P<lparen>\()"
+    r"|(?P<rparen>\))"
+)
+
+
+def _is_float_prefix(text: str) -> bool:
+    """Whether *text* can still be completed to a float (e.g. ``""``, ``"-"``, ``"1e"``, ``"in"``)."""
+    if _FLOAT_PREFIX.fullmatch(text) is not None:
+        return True
+    word = text.lstrip("+-").lower()
+    return len(text) - len(word) <= 1 and any(candidate.startswith(word) for candidate in _FLOAT_WORDS)
+
+
+def _is_integer_prefix(text: str) -> bool:
+    """Whether *text* can still be completed to an integer (e.g. ``""``, ``"-"``, ``"1_0"``)."""
+    return _INTEGER_PREFIX.fullmatch(text) is not None
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _unit_grammar_state(text: str) -> InputState:
+    """
+    Check a unit string against the unit token grammar.
+
+    Returns "acceptable" for syntactically complete unit strings, "intermediate"
+    for prefixes of them (e.g. ``"m/"``, ``"m^-"``, ``"(kg"``) and "invalid" otherwise.
+    """
+    expect_term = True
+    after_caret = False
+    after_caret_minus = False
+    depth = 0
+    position = 0
+    while position < len(text):
+        match = _UNIT_TOKEN.match(text, position)
+        if match is None:
+            return "invalid"
+        position = match.end()
+        kind = match.lastgroup
+        if kind == "ws":
+            continue
+        if after_caret or after_caret_minus:
+            if kind == "minus" and after_caret:
+                after_caret, after_caret_minus = False, True
+            elif kind == "number":
+                after_caret = after_caret_minus = False
+            else:
+                return "invalid"
+        elif kind == "symbol":
+            expect_term = False
+        elif kind == "number":
+            # "1/s", or an exponent without caret ("m2")
+            expect_term = False
+        elif kind == "lparen" and expect_term:
+            depth += 1
+        elif expect_term:
+            return "invalid"
+        elif kind == "operator":
+            expect_term = True
+        elif kind == "caret":
+            after_caret = True
+        elif kind == "superscript":
+            pass
+        elif kind == "rparen" and depth > 0:
+            depth -= 1
+        else:
+            return "invalid"
+    if not text.strip():
+        return "acceptable"
+    if expect_term or after_caret or after_caret_minus or depth > 0:
+        return "intermediate"
+    return "acceptable"
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _unit_text_state(text: str) -> InputState:
+    state = _unit_grammar_state(text)
+    if state != "acceptable":
+        return state
+    from united_system import Unit
+    try:
+        Unit(text)
+    except Exception:
+        # Unknown symbol so far (e.g. "k" on the way to "km")
+        return "intermediate"
+    return "acceptable"
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _split_real_united_scalar_text(text: str) -> Optional[tuple[str, str]]:
+    """Split text into a numeric prefix and a unit part, or None if the numeric part cannot be completed."""
+    match = _FLOAT_PREFIX.match(text)
+    number = match.group(0) if match is not None else ""
+    rest = text[len(number):]
+    if not number:
+        word_match = re.match(r"[+-]?[^\W\d_]+", text)
+        if word_match is not None and _is_float_prefix(word_match.group(0)):
+            number, rest = word_match.group(0), text[word_match.end():]
+    if not number and text:
+        return None
+    return number, rest
+
+
+def _parse_real_united_scalar(text: str) -> Any:
+    from united_system import RealUnitedScalar
+    return RealUnitedScalar(text)
+
+
+def _is_real_united_scalar_prefix(text: str) -> bool:
+    split = _split_real_united_scalar_text(text)
+    if split is None:
+        return False
+    number, rest = split
+    if not _is_float_prefix(number):
+        return False
+    return _unit_grammar_state(rest.strip()) != "invalid"
+
+
+def _parse_unit(text: str) -> Any:
+    if not text or _unit_text_state(text) != "acceptable":
+        raise ValueError(f"Invalid unit: {text!r}")
+    from united_system import Unit
+    return Unit(text)
+
+
+class ParsingValidator(QValidator, Generic[T]):
+    """
+    QValidator that runs a controller's parse and validation rules on every keystroke.
+
+    Parameters
+    ----------
+    parse : Callable[[str], T]
+        Converts the stripped text to a value. Raises on invalid text.
+    is_prefix : Callable[[str], bool]
+        Whether stripped text that does not parse can still be completed to valid text.
+    custom_validator : Optional[Callable[[T], tuple[bool, str]]], optional
+        Additional validation of parsed values. Values failing it are intermediate input.
+    fallback_text : Optional[Callable[[], str]], optional
+        Provides the text to revert to when editing finishes on intermediate input
+        (usually the current value of the controller). Fallback text that is not
+        acceptable itself is ignored and the input is left unchanged.
+    cache_size : int, optional
+        Number of parse results cached per validator. Defaults to 128.
+    parent : Optional[QObject], optional
+        The parent QObject.
+    """
+
+    def __init__(
+        self,
+        parse: Callable[[str], T],
+        is_prefix: Callable[[str], bool],
+        *,
+        custom_validator: Optional[Callable[[T], tuple[bool, str]]] = None,
+        fallback_text: Optional[Callable[[], str]] = None,
+        cache_size: int = 128,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self._is_prefix = is_prefix
+        self._custom_validator = custom_validator
+        self._fallback_text = fallback_text
+        self._parse_cached: Callable[[str], tuple[bool, Any]] = lru_cache(maxsize=cache_size)(partial(ParsingValidator._try_parse, parse))
+
+    @staticmethod
+    def _try_parse(parse: Callable[[str], T], text: str) -> tuple[bool, Any]:
+        try:
+            return True, parse(text)
+        except Exception:
+            return False, None
+
+    def input_state(self, text: str) -> InputState:
+        """Classify text as "acceptable", "intermediate" (incomplete or failing validation) or "invalid"."""
+        stripped = text.strip()
+        parsed, value = self._parse_cached(stripped)
+        if not parsed:
+            return "intermediate" if self._is_prefix(stripped) else "invalid"
+        if self._custom_validator is not None and not self._custom_validator(value)[0]:
+            return "intermediate"
+        return "acceptable"
+
+    def validate(self, text: str, pos: int) -> QValidator.State: # type: ignore[override]
+        state = self.input_state(text)
+        if state == "acceptable":
+            return QValidator.State.Acceptable
+        if state == "intermediate":
+            return QValidator.State.Intermediate
+        return QValidator.State.Invalid
+
+    def fixup(self, text: str) -> str: # type: ignore[override]
+        if self._fallback_text is None:
+            return text
+        fallback = self._fallback_text()
+        if self.input_state(fallback) != "acceptable":
+            return text
+        return fallback
+
+
+def float_input_validator(
+    *,
+    custom_validator: Optional[Callable[[float], tuple[bool, str]]] = None,
+    fallback_text: Optional[Callable[[], str]] = None,
+    parent: Optional[QObject] = None,
+) -> ParsingValidator[float]:
+    """Create a validator for text parsed with ``float()``."""
+    return ParsingValidator(float, _is_float_prefix, custom_validator=custom_validator, fallback_text=fallback_text, parent=parent)
+
+
+def integer_input_validator(
+    *,
+    custom_validator: Optional[Callable[[int], tuple[bool, str]]] = None,
+    fallback_text: Optional[Callable[[], str]] = None,
+    parent: Optional[QObject] = None,
+) -> ParsingValidator[int]:
+    """Create a validator for text parsed with ``int()``."""
+    return ParsingValidator(int, _is_integer_prefix, custom_validator=custom_validator, fallback_text=fallback_text, parent=parent)
+
+
+def unit_input_validator(
+    *,
+    custom_validator: Optional[Callable[[Any], tuple[bool, str]]] = None,
+    fallback_text: Optional[Callable[[], str]] = None,
+    parent: Optional[QObject] = None,
+) -> ParsingValidator[Any]:
+    """Create a validator for unit strings (e.g. ``"km"``, ``"m/s^2"``)."""
+    return ParsingValidator(
+        _parse_unit,
+        lambda text: _unit_grammar_state(text) != "invalid",
+        custom_validator=custom_validator,
+        fallback_text=fallback_text,
+        parent=parent,
+    )
+
+
+def real_united_scalar_input_validator(
+    *,
+    custom_validator: Optional[Callable[[Any], tuple[bool, str]]] = None,
+    fallback_text: Optional[Callable[[], str]] = None,
+    parent: Optional[QObject] = None,
+) -> ParsingValidator[Any]:
+    """Create a validator for RealUnitedScalar strings (e.g. ``"2.5 km"``)."""
+    return ParsingValidator(
+        _parse_real_united_scalar,
+        _is_real_united_scalar_prefix,
+        custom_validator=custom_validator,
+        fallback_text=fallback_text,
+        parent=parent,
+    )
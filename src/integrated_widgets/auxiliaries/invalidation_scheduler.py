@@ -0,0 +1,248 @@
+"""
+Time-sliced, prioritized widget invalidation
+============================================
+
+By default every invalidation request of a controller is queued as its own Qt
+event, so a large upstream change can invalidate thousands of controllers in one
+event-loop turn. When ``default.INVALIDATION_FRAME_BUDGET_MS`` is set, requests go
+to the shared `InvalidationScheduler` instead:
+
+- Requests are deduplicated: a controller is pending at most once, however often
+  its hooks change before it is flushed.
+- Each slice flushes pending controllers in priority order (a controlled widget
+  has focus, then visible, then hidden) until the budget is spent. The remaining
+  controllers are flushed in later slices, so input and paint events are
+  processed in between.
+- The priority of a controller is taken once, when it is enqueued, into a FIFO
+  bucket per priority. A slice only pops from the buckets, so its cost grows with
+  the controllers it flushes, not with the backlog.
+- A controller is always invalidated as a whole, from the hook values current at
+  the time of its flush, so a composite controller never shows a mix of old and
+  new values.
+
+```python
+from integrated_widgets import default
+from integrated_widgets.core import get_invalidation_scheduler
+
+default.INVALIDATION_FRAME_BUDGET_MS = 8.0
+...
+get_invalidation_scheduler().stats()
+# {'backlog_depth': 0, 'max_backlog_depth': 2400, 'flushed': 2400, 'slices': 31, ...}
+```
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
+from collections import deque
+import time
+import weakref
+
+from PySide6.QtCore import QObject, QTimer
+
+from . import tracing
+from .default import default
+
+if TYPE_CHECKING:
+    from ..controllers.core.base_controller import BaseController
+
+_SCHEDULER: Optional["InvalidationScheduler"] = None
+
+# Invalidation priorities (lower is flushed first)
+PRIORITY_FOCUSED: int = 0
+PRIORITY_VISIBLE: int = 1
+PRIORITY_HIDDEN: int = 2
+
+
+class _PendingInvalidation:
+
+    __slots__ = ("key", "ref", "caller_info", "enqueued_ns")
+
+    def __init__(self, key: int, ref: "weakref.ref[BaseController[Any, Any]]", caller_info: str, enqueued_ns: int) -> None:
+        self.key = key
+        self.ref = ref
+        self.caller_info = caller_info
+        self.enqueued_ns = enqueued_ns
+
+
+class InvalidationScheduler(QObject):
+    """
+    Flushes controller invalidations in prioritized, time-budgeted slices on the GUI thread.
+
+    Use `get_invalidation_scheduler()` for the shared instance that controllers use.
+
+    Parameters
+    ----------
+    budget_ms : Optional[float], optional
+        Time budget per slice. None (default) uses ``default.INVALIDATION_FRAME_BUDGET_MS``
+        at the time of each slice. At least one controller is flushed per slice.
+    parent : Optional[QObject], optional
+        The parent QObject.
+    """
+
+    def __init__(self, budget_ms: Optional[float] = None, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._budget_ms: Optional[float] = budget_ms
+        self._pending: dict[int, _PendingInvalidation] = {}
+        # FIFO per priority; entries no longer in _pending (discarded) are skipped when popped
+        self._buckets: tuple[deque[_PendingInvalidation], ...] = tuple(
+            deque() for _ in range(PRIORITY_HIDDEN + 1)
+        )
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.flush_slice)
+        self.reset_stats()
+
+    def schedule(self, controller: "BaseController[Any, Any]", caller_info: str = "") -> None:
+        """
+        Queue an invalidation of a controller. Must be called on the GUI thread.
+
+        The priority of the controller is determined here; a controller that is already
+        pending keeps its place.
+        """
+        key = id(controller)
+        pending = self._pending.get(key)
+        if pending is not None and pending.ref() is controller:
+            return
+        pending = _PendingInvalidation(key, weakref.ref(controller), caller_info, time.perf_counter_ns())
+        self._pending[key] = pending
+        self._buckets[controller._invalidation_priority()].append(pending)
+        self._max_backlog_depth = max(self._max_backlog_depth, len(self._pending))
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def discard(self, controller: "BaseController[Any, Any]") -> None:
+        """Drop a pending invalidation (e.g. of a disposed controller)."""
+        pending = self._pending.get(id(controller))
+        if pending is not None and pending.ref() is controller:
+            del self._pending[id(controller)]
+            if not self._pending:
+                self._clear_buckets()
+
+    def is_pending(self, controller: "BaseController[Any, Any]") -> bool:
+        """Whether an invalidation of the controller is waiting to be flushed."""
+        pending = self._pending.get(id(controller))
+        return pending is not None and pending.ref() is controller
+
+    @property
+    def backlog_depth(self) -> int:
+        """Number of controllers waiting to be flushed."""
+        return len(self._pending)
+
+    def flush_slice(self) -> int:
+        """
+        Flush pending invalidations until the slice budget is spent.
+
+        Returns
+        -------
+        int
+            The number of controllers invalidated.
+        """
+        if not self._pending:
+            return 0
+        budget_ms = self._budget_ms if self._budget_ms is not None else default.INVALIDATION_FRAME_BUDGET_MS
+        budget_ns: float = (budget_ms or 0.0) * 1e6
+        start_ns = time.perf_counter_ns()
+
+        flushed = 0
+        with tracing.span("invalidation_slice", self, args={"backlog": len(self._pending)}):
+            while self._pending:
+                if flushed > 0 and time.perf_counter_ns() - start_ns >= budget_ns:
+                    break
+                pending = self._pop_next()
+                if pending is None:
+                    break
+                controller = pending.ref()
+                if controller is None or controller._is_disposed:
+                    continue
+                applied_ns = time.perf_counter_ns()
+                controller._invalidate_widgets(caller_info=pending.caller_info)
+                latency_ms = (applied_ns - pending.enqueued_ns) / 1e6
+                self._total_latency_ms += latency_ms
+                self._max_latency_ms = max(self._max_latency_ms, latency_ms)
+                flushed += 1
+
+        self._flushed += flushed
+        self._slices += 1
+        self._last_slice_ms = (time.perf_counter_ns() - start_ns) / 1e6
+        if self._pending:
+            # The rest goes to later slices, after Qt has processed input and paint events
+            self._deferred_slices += 1
+            self._timer.start()
+        else:
+            self._clear_buckets()
+        return flushed
+
+    def _pop_next(self) -> Optional[_PendingInvalidation]:
+        """Remove and return the pending invalidation to flush next, or None if there is none."""
+        for bucket in self._buckets:
+            while bucket:
+                pending = bucket.popleft()
+                if self._pending.get(pending.key) is pending:
+                    del self._pending[pending.key]
+                    return pending
+        return None
+
+    def _clear_buckets(self) -> None:
+        for bucket in self._buckets:
+            bucket.clear()
+
+    def flush_all(self) -> int:
+        """Flush all pending invalidations now, ignoring the budget. Returns the number of controllers invalidated."""
+        flushed = 0
+        while self._pending:
+            budget_ms = self._budget_ms
+            self._budget_ms = float("inf")
+            try:
+                flushed += self.flush_slice()
+            finally:
+                self._budget_ms = budget_ms
+        self._timer.stop()
+        return flushed
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the backlog and latency counters.
+
+        Returns
+        -------
+        dict[str, Any]
+            ``backlog_depth``, ``max_backlog_depth``, ``flushed``, ``slices``, ``deferred_slices``
+            (slices that ran out of budget), ``average_latency_ms`` and ``max_latency_ms`` (from
+            request to flush) and ``last_slice_ms``.
+        """
+        return {
+            "backlog_depth": len(self._pending),
+            "max_backlog_depth": self._max_backlog_depth,
+            "flushed": self._flushed,
+            "slices": self._slices,
+            "deferred_slices": self._deferred_slices,
+            "average_latency_ms": self._total_latency_ms / self._flushed if self._flushed else 0.0,
+            "max_latency_ms": self._max_latency_ms,
+            "last_slice_ms": self._last_slice_ms,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset the counters (the backlog is kept)."""
+        self._max_backlog_depth: int = len(self._pending)
+        self._flushed: int = 0
+        self._slices: int = 0
+        self._deferred_slices: int = 0
+        self._total_latency_ms: float = 0.0
+        self._max_latency_ms: float = 0.0
+        self._last_slice_ms: float = 0.0
+
+
+def get_invalidation_scheduler() -> InvalidationScheduler:
+    """Get the shared scheduler, creating it on first use (requires a QApplication)."""
+    global _SCHEDULER
+    if _SCHEDULER is None:
+        _SCHEDULER = InvalidationScheduler()
+    return _SCHEDULER
+
+
+def discard_scheduled_invalidation(controller: "BaseController[Any, Any]") -> None:
+    """Drop a pending invalidation of a controller from the shared scheduler, if it exists."""
+    if _SCHEDULER is not None:
+        _SCHEDULER.discard(controller)
@@ -28,6 +28,25 @@ other_hook.join(signal_hook, initial_sync_mode="use_target_value")
 # When other_hook's value changes, signal_hook will react and emit the signal
 ```
 
+Emission control
+----------------
+For hooks joined to fast-changing nexuses, emissions can be reduced:
+
+* ``coalesce=True``: changes within one event-loop turn are collapsed and only
+  the latest value is emitted (on the next turn).
+* ``max_rate_hz``: at most this many emissions per second. The latest value is
+  always delivered by a trailing emission.
+* ``equality`` / ``tolerance``: change-only mode. A value is not emitted if it
+  equals the last emitted value (according to ``equality``, or within an
+  absolute ``tolerance`` for numbers).
+
+``emitted_count`` and ``suppressed_count`` report how many changes were
+emitted and how many were dropped by these options.
+
+```python
+hook = IQtSignalHook(source_hook, coalesce=True, max_rate_hz=30, tolerance=1e-9)
+```
+
 Design principles
 -----------------
 * **Standalone**: The hook is independent and can be connected to any observable
@@ -38,10 +57,12 @@ Design principles
 
 from __future__ import annotations
 
-from typing import Optional, TypeVar, Generic
+from typing import Callable, Optional, TypeVar, Generic
 from logging import Logger
+import math
+import time
 
-from PySide6.QtCore import QObject, Signal, SignalInstance
+from PySide6.QtCore import QObject, QThread, QTimer, Qt, Signal, SignalInstance
 
 from nexpy import Hook
 from nexpy.core import NexusManager, HookBase
@@ -64,15 +85,52 @@ class IQtSignalHook(QObject, HookBase[T], Generic[T], metaclass=IQtSignalHookMet
     
     # Qt signal that emits when the hook's value changes
     value_changed = Signal(object)  # Emits the new value
+
+    # Internal: marshals emission scheduling to the thread that owns the timer
+    _schedule_requested = Signal()
     
     def __init__(
         self,
         initial_value_or_hook: T | Hook[T],
         *,
         signal: Optional[SignalInstance] = None,
+        coalesce: bool = False,
+        max_rate_hz: Optional[float] = None,
+        equality: Optional[Callable[[T, T], bool]] = None,
+        tolerance: Optional[float] = None,
         logger: Optional[Logger] = None,
         nexus_manager: NexusManager = nexpy_default.NEXUS_MANAGER,
     ) -> None:
+        """
+        Initialize the signal hook.
+
+        Parameters
+        ----------
+        initial_value_or_hook : T | Hook[T]
+            The initial value, or a hook to join with.
+        signal : SignalInstance, optional
+            A signal to emit instead of ``value_changed``.
+        coalesce : bool, optional
+            Collapse all changes within one event-loop turn into a single emission of the latest value.
+        max_rate_hz : float, optional
+            Maximum number of emissions per second. The latest value is always emitted eventually.
+        equality : Callable[[T, T], bool], optional
+            Change-only mode: skip emitting a value equal to the last emitted value.
+        tolerance : float, optional
+            Change-only mode for numbers: skip emitting a value within this absolute tolerance
+            of the last emitted value. Mutually exclusive with ``equality``.
+        logger : Logger, optional
+            Logger instance for debugging.
+        nexus_manager : NexusManager, optional
+            The nexus manager to use.
+        """
+
+        if max_rate_hz is not None and max_rate_hz <= 0:
+            raise ValueError(f"max_rate_hz must be positive, got {max_rate_hz}")
+        if equality is not None and tolerance is not None:
+            raise ValueError("Provide either equality or tolerance, not both")
+        if tolerance is not None and tolerance < 0:
+            raise ValueError(f"tolerance must not be negative, got {tolerance}")
 
         # Initialize QObject first
         QObject.__init__(self)
@@ -80,6 +138,26 @@ class IQtSignalHook(QObject, HookBase[T], Generic[T], metaclass=IQtSignalHookMet
         # Override the signal if provided (must be done after QObject.__init__)
         if signal is not None:
             self.value_changed = signal
+
+        # Emission control
+        self._coalesce: bool = coalesce
+        self._min_interval_ms: Optional[float] = None if max_rate_hz is None else 1000.0 / max_rate_hz
+        if tolerance is not None:
+            equality = lambda a, b: abs(a - b) <= tolerance # type: ignore
+        self._equality: Optional[Callable[[T, T], bool]] = equality
+        self._has_last_emitted: bool = False
+        self._last_emitted_value: Optional[T] = None
+        self._last_emission_time: Optional[float] = None
+        self._has_pending: bool = False
+        self._pending_value: Optional[T] = None
+        self._emitted_count: int = 0
+        self._suppressed_count: int = 0
+        self._emit_timer: Optional[QTimer] = None
+        if coalesce or max_rate_hz is not None:
+            self._emit_timer = QTimer(self)
+            self._emit_timer.setSingleShot(True)
+            self._emit_timer.timeout.connect(self.flush)
+            self._schedule_requested.connect(self._schedule_emission, Qt.ConnectionType.QueuedConnection)
         
         # Extract initial value
         if isinstance(initial_value_or_hook, Hook):
@@ -100,13 +178,85 @@ class IQtSignalHook(QObject, HookBase[T], Generic[T], metaclass=IQtSignalHookMet
         if isinstance(initial_value_or_hook, Hook):
             self.join(initial_value_or_hook, initial_sync_mode="use_target_value") # type: ignore
 
+        # In change-only mode, the initial value counts as already seen by subscribers
+        if self._equality is not None:
+            self._last_emitted_value = self.value
+            self._has_last_emitted = True
+
+    @property
+    def emitted_count(self) -> int:
+        """Number of value changes that were emitted."""
+        return self._emitted_count
+
+    @property
+    def suppressed_count(self) -> int:
+        """Number of value changes that were dropped by coalescing, rate limiting or change-only mode."""
+        return self._suppressed_count
+
     def react_to_value_changed(self) -> None:
-        """React to value changes by emitting the Qt signal."""
+        """React to value changes by emitting the Qt signal (subject to the emission control options)."""
         value: T = self.value
+        if self._emit_timer is None:
+            self._emit_value(value)
+            return
+
+        # Keep only the latest value; a replaced pending value is never emitted
+        if self._has_pending:
+            self._suppressed_count += 1
+        self._pending_value = value
+        self._has_pending = True
+
+        if QThread.currentThread() is self.thread():
+            self._schedule_emission()
+        else:
+            self._schedule_requested.emit()
+
+    def flush(self) -> None:
+        """Emit the pending value (if any) immediately."""
+        if self._emit_timer is not None:
+            self._emit_timer.stop()
+        if not self._has_pending:
+            return
+        value: T = self._pending_value # type: ignore
+        self._has_pending = False
+        self._pending_value = None
+        self._emit_value(value)
+
+    def _schedule_emission(self) -> None:
+        """Start the emission timer for the pending value, honoring coalescing and the rate limit."""
+        if self._emit_timer is None or not self._has_pending or self._emit_timer.isActive():
+            return
+        delay_ms = 0
+        if self._min_interval_ms is not None and self._last_emission_time is not None:
+            elapsed_ms = (time.monotonic() - self._last_emission_time) * 1000.0
+            delay_ms = max(0, math.ceil(self._min_interval_ms - elapsed_ms))
+        if delay_ms == 0 and not self._coalesce:
+            # Rate limit only and the interval has passed: emit right away
+            self.flush()
+        else:
+            self._emit_timer.start(delay_ms)
+
+    def _emit_value(self, value: T) -> None:
+        if self._equality is not None and self._has_last_emitted and self._equality(self._last_emitted_value, value): # type: ignore
+            self._suppressed_count += 1
+            return
+        self._last_emitted_value = value
+        self._has_last_emitted = True
+        self._last_emission_time = time.monotonic()
+        self._emitted_count += 1
         self.value_changed.emit(value)
     
     def dispose(self) -> None:
         """Dispose of the hook and clean up Qt resources."""
+        # Drop pending emissions
+        try:
+            if self._emit_timer is not None:
+                self._emit_timer.stop()
+        except (RuntimeError, AttributeError):
+            # Timer may have been deleted already
+            pass
+        self._has_pending = False
+
         # Disconnect from the observables system first
         try:
             self.isolate()
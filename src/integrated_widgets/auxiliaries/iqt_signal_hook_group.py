@@ -0,0 +1,240 @@
+"""
+Grouped Qt signal hook for observables integration
+==================================================
+
+**`IQtSignalHookGroup`** joins many hooks at once and emits a single Qt signal
+carrying a dict of the keys and values that changed. Where N `IQtSignalHook`
+instances fire a slot N times for one composite update (e.g. all secondary
+hooks of a `RangeSliderController`), the group fires it once.
+
+Usage
+-----
+
+```python
+group = IQtSignalHookGroup.from_hook_carrier(
+    range_slider_controller,
+    ["span_values_tuple", "span_size_value", "span_center_value"],
+)
+group.values_changed.connect(on_span_changed)   # on_span_changed(changes: dict[str, Any])
+```
+
+Batching
+--------
+All hooks of one nexus transaction react synchronously inside the submitting
+call. The group collects these reactions and emits once on the next
+event-loop turn (zero-delay single-shot QTimer). Changes from several
+transactions within the same turn are merged; the latest value per key wins.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Generic, Iterable, Mapping, Optional, TypeVar
+from logging import Logger
+
+from PySide6.QtCore import QObject, QThread, QTimer, Qt, Signal
+
+from nexpy import Hook
+from nexpy.core import NexusManager, HookBase
+from nexpy import default as nexpy_default
+from nexpy.foundations.carries_some_hooks_protocol import CarriesSomeHooksProtocol
+
+K = TypeVar("K", bound=str)
+
+
+class _GroupMemberHook(HookBase[Any]):
+    """Member hook of an IQtSignalHookGroup; forwards its reactions to the group."""
+
+    def __init__(
+        self,
+        key: Any,
+        initial_value: Any,
+        on_changed: Callable[[Any, Any], None],
+        *,
+        logger: Optional[Logger],
+        nexus_manager: NexusManager,
+    ) -> None:
+        self._key = key
+        self._on_changed = on_changed
+        HookBase.__init__( # type: ignore
+            self,
+            value_or_nexus=initial_value,
+            nexus_manager=nexus_manager,
+            logger=logger
+        )
+
+    def react_to_value_changed(self) -> None:
+        self._on_changed(self._key, self.value)
+
+
+class IQtSignalHookGroup(QObject, Generic[K]):
+    """
+    Joins many hooks and emits one signal per nexus transaction with the changed keys and values.
+
+    Signals:
+        values_changed(dict[K, Any]) - Emitted once per event-loop turn with all changes since the last emission
+    """
+
+    values_changed = Signal(object)
+
+    # Internal: marshals emission scheduling to the thread that owns the timer
+    _schedule_requested = Signal()
+
+    def __init__(
+        self,
+        initial_values_or_hooks: Mapping[K, Any | Hook[Any]],
+        *,
+        logger: Optional[Logger] = None,
+        nexus_manager: NexusManager = nexpy_default.NEXUS_MANAGER,
+    ) -> None:
+        """
+        Initialize the group.
+
+        Parameters
+        ----------
+        initial_values_or_hooks : Mapping[K, Any | Hook[Any]]
+            For each key, an initial value or a hook to join with.
+        logger : Logger, optional
+            Logger instance for debugging.
+        nexus_manager : NexusManager, optional
+            The nexus manager to use.
+        """
+        QObject.__init__(self)
+
+        self._logger: Optional[Logger] = logger
+        self._nexus_manager: NexusManager = nexus_manager
+        self._pending_changes: dict[K, Any] = {}
+        self._emission_count: int = 0
+        self._change_count: int = 0
+        self._initializing: bool = True
+
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(0)
+        self._emit_timer.timeout.connect(self.flush)
+        self._schedule_requested.connect(self._emit_timer.start, Qt.ConnectionType.QueuedConnection)
+
+        self._hooks: dict[K, _GroupMemberHook] = {}
+        for key, value_or_hook in initial_values_or_hooks.items():
+            self._add(key, value_or_hook)
+
+        self._initializing = False
+
+    @classmethod
+    def from_hook_carrier(
+        cls,
+        carrier: CarriesSomeHooksProtocol[Any, Any],
+        keys: Optional[Iterable[K]] = None,
+        *,
+        logger: Optional[Logger] = None,
+        nexus_manager: NexusManager = nexpy_default.NEXUS_MANAGER,
+    ) -> "IQtSignalHookGroup[K]":
+        """
+        Create a group joined to hooks of a controller (or any other hook carrier).
+
+        Parameters
+        ----------
+        carrier : CarriesSomeHooksProtocol
+            The controller or X object owning the hooks.
+        keys : Iterable[K], optional
+            The hook keys to join. Default is all hook keys of the carrier.
+        """
+        if keys is None:
+            keys = carrier._get_hook_keys() # type: ignore
+        return cls(
+            {key: carrier._get_hook_by_key(key) for key in keys}, # type: ignore
+            logger=logger,
+            nexus_manager=nexus_manager,
+        )
+
+    ###########################################################################
+    # Public API
+    ###########################################################################
+
+    def keys(self) -> set[K]:
+        """Get the keys of the group."""
+        return set(self._hooks)
+
+    def hook(self, key: K) -> Hook[Any]:
+        """Get the member hook for a key, e.g. to join it with further hooks."""
+        return self._hooks[key] # type: ignore
+
+    @property
+    def values(self) -> dict[K, Any]:
+        """Get the current values of all member hooks."""
+        return {key: hook.value for key, hook in self._hooks.items()}
+
+    @property
+    def emission_count(self) -> int:
+        """Number of emitted `values_changed` signals."""
+        return self._emission_count
+
+    @property
+    def change_count(self) -> int:
+        """Number of member hook reactions folded into those emissions."""
+        return self._change_count
+
+    def join(self, key: K, value_or_hook: Any | Hook[Any]) -> None:
+        """Add a key to the group (or re-join an existing one) with an initial value or a hook."""
+        if key in self._hooks:
+            self._hooks[key].isolate()
+            del self._hooks[key]
+        self._add(key, value_or_hook)
+
+    def flush(self) -> None:
+        """Emit pending changes (if any) immediately."""
+        self._emit_timer.stop()
+        if not self._pending_changes:
+            return
+        changes = self._pending_changes
+        self._pending_changes = {}
+        self._emission_count += 1
+        self.values_changed.emit(changes)
+
+    def dispose(self) -> None:
+        """Isolate all member hooks and clean up Qt resources."""
+        try:
+            self._emit_timer.stop()
+        except RuntimeError:
+            # Timer may have been deleted already
+            pass
+        self._pending_changes.clear()
+        for hook in self._hooks.values():
+            try:
+                hook.isolate()
+            except Exception:
+                # Hook may already be disconnected or in an invalid state
+                pass
+        self._hooks.clear()
+        try:
+            self.deleteLater()
+        except RuntimeError:
+            # Qt object may have been deleted already
+            pass
+
+    ###########################################################################
+    # Internal methods
+    ###########################################################################
+
+    def _add(self, key: K, value_or_hook: Any | Hook[Any]) -> None:
+        initial_value: Any = value_or_hook.value if isinstance(value_or_hook, Hook) else value_or_hook # type: ignore
+        member = _GroupMemberHook(
+            key,
+            initial_value,
+            self._on_member_changed,
+            logger=self._logger,
+            nexus_manager=self._nexus_manager,
+        )
+        self._hooks[key] = member
+        if isinstance(value_or_hook, Hook):
+            member.join(value_or_hook, initial_sync_mode="use_target_value") # type: ignore
+
+    def _on_member_changed(self, key: K, value: Any) -> None:
+        if self._initializing:
+            return
+        self._pending_changes[key] = value
+        self._change_count += 1
+        if QThread.currentThread() is self.thread():
+            if not self._emit_timer.isActive():
+                self._emit_timer.start()
+        else:
+            self._schedule_requested.emit()
@@ -0,0 +1,44 @@
+"""PEP 562 helpers for lazily resolved package attributes."""
+
+from importlib import import_module
+from typing import Any, Callable, Mapping
+
+
+def lazy_module_attributes(
+    package: str,
+    module_globals: dict[str, Any],
+    attributes: Mapping[str, tuple[str, str]],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build module-level ``__getattr__`` and ``__dir__`` functions for lazy exports.
+
+    Parameters
+    ----------
+    package : str
+        The ``__name__`` of the module exporting the attributes. Relative module
+        paths in ``attributes`` are resolved against it.
+    module_globals : dict[str, Any]
+        The ``globals()`` of the exporting module. Resolved attributes are cached
+        there, so each attribute is imported at most once.
+    attributes : Mapping[str, tuple[str, str]]
+        Maps each exported name to ``(module_path, attribute_name)``.
+
+    Returns
+    -------
+    tuple[Callable[[str], Any], Callable[[], list[str]]]
+        The ``__getattr__`` and ``__dir__`` functions to assign in the module.
+    """
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module_path, attribute_name = attributes[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        value = getattr(import_module(module_path, package), attribute_name)
+        module_globals[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(module_globals) | set(attributes))
+
+    return __getattr__, __dir__
@@ -0,0 +1,233 @@
+"""
+Live-object registry and leak detection
+=======================================
+
+When live tracking is enabled, every controller and controlled widget created
+afterwards is registered through a weak reference, together with the place in
+application code that created it. The registry never keeps an object alive, so
+the objects it reports are the ones something else still references (e.g. a
+forgotten `keep_alive`, a parent QObject or a closure in a hook listener).
+
+Usage
+-----
+
+```python
+from integrated_widgets.core import start_live_tracking, stop_live_tracking
+
+registry = start_live_tracking()
+before = registry.snapshot()
+...  # swap layouts, dispose old widgets
+after = registry.snapshot()
+for (class_name, site), grown in after.diff(before).items():
+    print(f"{grown:+d} {class_name} created at {site}")
+```
+
+In tests:
+
+```python
+assert registry.snapshot().diff(before) == {}
+```
+
+Overhead
+--------
+While live tracking is disabled, `register()` returns immediately. While it is
+enabled, each registration captures a few stack frames to find the creation site.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Mapping, Optional
+import gc
+import os
+import sys
+import weakref
+
+_REGISTRY: Optional["LiveRegistry"] = None
+
+# Frames in these directories are library internals, not creation sites
+_PACKAGE_DIR: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + os.sep
+
+
+class _LiveEntry:
+
+    __slots__ = ("ref", "class_name", "site")
+
+    def __init__(self, ref: "weakref.ref[Any]", class_name: str, site: str) -> None:
+        self.ref = ref
+        self.class_name = class_name
+        self.site = site
+
+
+@dataclass(frozen=True)
+class LiveSnapshot:
+    """Numbers of live objects, keyed by ``(class name, creation site)``."""
+
+    counts: Mapping[tuple[str, str], int] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        """Number of live objects."""
+        return sum(self.counts.values())
+
+    def by_class(self) -> dict[str, int]:
+        """Numbers of live objects per class name."""
+        result: dict[str, int] = {}
+        for (class_name, _), count in self.counts.items():
+            result[class_name] = result.get(class_name, 0) + count
+        return result
+
+    def diff(self, earlier: "LiveSnapshot") -> dict[tuple[str, str], int]:
+        """
+        Get the change of the live-object counts since an earlier snapshot.
+
+        Returns
+        -------
+        dict[tuple[str, str], int]
+            Non-zero count changes keyed by ``(class name, creation site)``, largest growth first.
+        """
+        keys = set(self.counts) | set(earlier.counts)
+        changes = {key: self.counts.get(key, 0) - earlier.counts.get(key, 0) for key in keys}
+        return dict(sorted(((key, delta) for key, delta in changes.items() if delta != 0), key=lambda item: -item[1]))
+
+
+class LiveRegistry:
+    """
+    Weak registry of live controllers and controlled widgets. Use `start_live_tracking()` to install one.
+
+    Parameters
+    ----------
+    stack_depth : int, optional
+        Maximum number of frames searched for the creation site. Defaults to 20.
+    """
+
+    def __init__(self, stack_depth: int = 20) -> None:
+        self._stack_depth: int = stack_depth
+        self._entries: dict[int, _LiveEntry] = {}
+        self._registered_count: int = 0
+
+    def register(self, obj: Any) -> None:
+        """Track an object until it is garbage collected."""
+        key = id(obj)
+
+        def on_collected(_: "weakref.ref[Any]", key: int = key) -> None:
+            entry = self._entries.get(key)
+            if entry is not None and entry.ref() is None:
+                del self._entries[key]
+
+        try:
+            ref = weakref.ref(obj, on_collected)
+        except TypeError:
+            # Not weak-referenceable
+            return
+        self._entries[key] = _LiveEntry(ref, type(obj).__name__, self._creation_site())
+        self._registered_count += 1
+
+    @property
+    def registered_count(self) -> int:
+        """Number of objects registered since the registry was created (live or not)."""
+        return self._registered_count
+
+    def live_objects(self, cls: Optional[type] = None) -> list[Any]:
+        """Get the live objects (of a class), oldest first."""
+        objects: list[Any] = []
+        for entry in list(self._entries.values()):
+            obj = entry.ref()
+            if obj is not None and (cls is None or isinstance(obj, cls)):
+                objects.append(obj)
+        return objects
+
+    def creation_site(self, obj: Any) -> Optional[str]:
+        """Get where a tracked object was created, e.g. ``app/forms.py:42 in build_detail_panel``."""
+        entry = self._entries.get(id(obj))
+        if entry is None or entry.ref() is not obj:
+            return None
+        return entry.site
+
+    def counts(self) -> dict[str, int]:
+        """Numbers of live objects per class name."""
+        return self.snapshot(collect=False).by_class()
+
+    def approximate_memory(self) -> dict[str, int]:
+        """
+        Approximate memory of the live objects per class name, in bytes.
+
+        Counts the object and its instance dictionary (shallow). Widgets and the Qt
+        objects they own are not included beyond their Python wrapper.
+        """
+        memory: dict[str, int] = {}
+        for entry in list(self._entries.values()):
+            obj = entry.ref()
+            if obj is None:
+                continue
+            size = sys.getsizeof(obj)
+            instance_dict = getattr(obj, "__dict__", None)
+            if instance_dict is not None:
+                size += sys.getsizeof(instance_dict)
+            memory[entry.class_name] = memory.get(entry.class_name, 0) + size
+        return memory
+
+    def snapshot(self, *, collect: bool = True) -> LiveSnapshot:
+        """
+        Count the live objects by class name and creation site.
+
+        Parameters
+        ----------
+        collect : bool, optional
+            Run the garbage collector first, so that unreachable reference cycles do not
+            show up as live. Defaults to True.
+        """
+        if collect:
+            gc.collect()
+        counts: dict[tuple[str, str], int] = {}
+        for entry in list(self._entries.values()):
+            if entry.ref() is None:
+                continue
+            key = (entry.class_name, entry.site)
+            counts[key] = counts.get(key, 0) + 1
+        return LiveSnapshot(counts)
+
+    def clear(self) -> None:
+        """Stop tracking all registered objects."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return sum(1 for entry in list(self._entries.values()) if entry.ref() is not None)
+
+    def _creation_site(self) -> str:
+        """Find the innermost frame outside integrated_widgets."""
+        frame = sys._getframe(1)
+        for _ in range(self._stack_depth):
+            if frame is None:
+                break
+            filename = frame.f_code.co_filename
+            if not filename.startswith(_PACKAGE_DIR):
+                return f"{filename}:{frame.f_lineno} in {frame.f_code.co_name}"
+            frame = frame.f_back
+        return "<integrated_widgets>"
+
+
+def register(obj: Any) -> None:
+    """Register a controller or controlled widget if live tracking is enabled."""
+    registry = _REGISTRY
+    if registry is not None:
+        registry.register(obj)
+
+
+def start_live_tracking(stack_depth: int = 20) -> LiveRegistry:
+    """Enable live tracking with a new registry and return it. Only objects created afterwards are tracked."""
+    global _REGISTRY
+    _REGISTRY = LiveRegistry(stack_depth)
+    return _REGISTRY
+
+
+def stop_live_tracking() -> Optional[LiveRegistry]:
+    """Disable live tracking and return the registry that was active (if any). It keeps its entries."""
+    global _REGISTRY
+    registry, _REGISTRY = _REGISTRY, None
+    return registry
+
+
+def get_live_registry() -> Optional[LiveRegistry]:
+    """Get the active registry, or None if live tracking is disabled."""
+    return _REGISTRY
@@ -0,0 +1,47 @@
+"""
+asyncio on the Qt event loop
+============================
+
+Controllers commit debounced submissions from Qt timers, so coroutines awaiting
+`submit_values_async` / `submit_async` need an asyncio event loop that also
+runs the Qt event loop. `run_async` runs a coroutine on such a loop
+(`PySide6.QtAsyncio`) and returns its result:
+
+```python
+async def apply_preset() -> None:
+    await gain.controller.submit_async(2.0)
+    await offset.controller.submit_async(0.5)   # runs after the gain is committed
+
+run_async(apply_preset())
+```
+
+Alternatively, run the coroutines on an asyncio event loop in another thread:
+submissions are marshalled to the GUI thread and the commit futures resolve
+thread-safely.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Coroutine, TypeVar
+
+from PySide6.QtCore import QCoreApplication
+
+T = TypeVar("T")
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine on the Qt event loop until it completes and return its result.
+
+    The QApplication keeps running afterwards. Must be called from the GUI thread and
+    not from within a running event loop.
+
+    Raises:
+        RuntimeError: If there is no QApplication.
+    """
+    if QCoreApplication.instance() is None:
+        coro.close()
+        raise RuntimeError("run_async requires a QApplication")
+
+    from PySide6 import QtAsyncio
+    return QtAsyncio.run(coro, keep_running=False, quit_qapp=False) # type: ignore
@@ -0,0 +1,248 @@
+"""
+Event-loop latency and GUI stall monitor
+========================================
+
+**`StallMonitor`** measures the lag of the Qt event loop with a heartbeat timer.
+When a heartbeat arrives more than ``threshold_ms`` late, the GUI thread was
+blocked, and the monitor records a `StallReport`. The report attributes the stall
+to the controller invalidations, commits and layout rebuilds that ran during
+it. These come from the tracing instrumentation (see `tracing`). If none ran,
+the stall happened in application code.
+
+Usage
+-----
+
+```python
+monitor = StallMonitor(threshold_ms=200)
+monitor.stallDetected.connect(lambda report: print(report))
+monitor.start()
+...
+for report in monitor.reports(min_duration_ms=500):
+    print(report.duration_ms, report.culprit)
+```
+
+If tracing is not enabled when the monitor starts, the monitor enables it with a
+small ring buffer and disables it again when stopped.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+import threading
+import time
+
+from PySide6.QtCore import QObject, QTimer, Qt, Signal
+
+from . import tracing
+from .tracing import TraceEvent
+
+# Ring buffer size of the tracer the monitor enables if tracing is off
+_MONITOR_TRACE_CAPACITY: int = 10_000
+
+
+@dataclass(frozen=True)
+class StallReport:
+    """A stall of the GUI thread and the instrumented work that ran during it."""
+
+    start_ns: int
+    """Start of the stall (``time.perf_counter_ns()``)."""
+    duration_ms: float
+    """How long the event loop was blocked (heartbeat lag)."""
+    spans: tuple[TraceEvent, ...]
+    """Instrumented spans that overlapped the stall, longest overlap first."""
+
+    @property
+    def culprit(self) -> Optional[TraceEvent]:
+        """The span with the longest overlap with the stall, or None if the stall was outside integrated_widgets."""
+        return self.spans[0] if self.spans else None
+
+    def __str__(self) -> str:
+        culprit = self.culprit
+        if culprit is None:
+            return f"Stall of {self.duration_ms:.1f} ms outside integrated_widgets"
+        keys = f" keys={list(culprit.keys)}" if culprit.keys else ""
+        return f"Stall of {self.duration_ms:.1f} ms in '{culprit.name}' of {culprit.subject}{keys} ({culprit.duration_ns / 1e6:.1f} ms)"
+
+
+class StallMonitor(QObject):
+    """
+    Heartbeat-based monitor of the GUI event loop.
+
+    Signals:
+        stallDetected(StallReport) - Emitted for every stall longer than the threshold
+
+    Parameters
+    ----------
+    interval_ms : int, optional
+        Heartbeat interval. Defaults to 50 ms.
+    threshold_ms : float, optional
+        Minimum heartbeat lag reported as a stall. Defaults to 200 ms.
+    history_size : int, optional
+        Maximum number of stall reports kept. Defaults to 100.
+    parent : QObject, optional
+        Parent QObject.
+    """
+
+    stallDetected = Signal(object)
+
+    def __init__(
+        self,
+        *,
+        interval_ms: int = 50,
+        threshold_ms: float = 200.0,
+        history_size: int = 100,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        if interval_ms <= 0:
+            raise ValueError(f"interval_ms must be positive, got {interval_ms}")
+        if threshold_ms <= 0:
+            raise ValueError(f"threshold_ms must be positive, got {threshold_ms}")
+
+        self._interval_ms: int = interval_ms
+        self._threshold_ms: float = threshold_ms
+        self._history: deque[StallReport] = deque(maxlen=history_size)
+        self._last_tick_ns: Optional[int] = None
+        self._last_lag_ms: float = 0.0
+        self._max_lag_ms: float = 0.0
+        self._tick_count: int = 0
+        # The tracer enabled by start(), if tracing was off
+        self._own_tracer: Optional[tracing.Tracer] = None
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._on_heartbeat)
+
+    ###########################################################################
+    # Public API
+    ###########################################################################
+
+    def start(self) -> None:
+        """Start the heartbeat (enabling tracing if it is off)."""
+        if self._timer.isActive():
+            return
+        if tracing.get_tracer() is None:
+            self._own_tracer = tracing.start_tracing(_MONITOR_TRACE_CAPACITY)
+        self._last_tick_ns = time.perf_counter_ns()
+        self._timer.start()
+
+    def stop(self) -> None:
+        """Stop the heartbeat (and the tracing enabled by `start()`, unless another tracer replaced it)."""
+        self._timer.stop()
+        self._last_tick_ns = None
+        if self._own_tracer is not None and tracing.get_tracer() is self._own_tracer:
+            tracing.stop_tracing()
+        self._own_tracer = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._timer.isActive()
+
+    @property
+    def threshold_ms(self) -> float:
+        return self._threshold_ms
+
+    @threshold_ms.setter
+    def threshold_ms(self, value: float) -> None:
+        if value <= 0:
+            raise ValueError(f"threshold_ms must be positive, got {value}")
+        self._threshold_ms = value
+
+    @property
+    def last_lag_ms(self) -> float:
+        """Lag of the latest heartbeat."""
+        return self._last_lag_ms
+
+    @property
+    def max_lag_ms(self) -> float:
+        """Largest heartbeat lag since start (or `clear()`)."""
+        return self._max_lag_ms
+
+    @property
+    def tick_count(self) -> int:
+        """Number of heartbeats received."""
+        return self._tick_count
+
+    def reports(self, *, min_duration_ms: float = 0.0, subject: Optional[str] = None) -> list[StallReport]:
+        """
+        Get the recorded stall reports, oldest first.
+
+        Parameters
+        ----------
+        min_duration_ms : float, optional
+            Only reports of stalls at least this long.
+        subject : str, optional
+            Only reports attributed to this controller or widget (see `tracing.subject_id`).
+        """
+        return [
+            report for report in self._history
+            if report.duration_ms >= min_duration_ms
+            and (subject is None or (report.culprit is not None and report.culprit.subject == subject))
+        ]
+
+    def clear(self) -> None:
+        """Drop all reports and reset the lag statistics."""
+        self._history.clear()
+        self._last_lag_ms = 0.0
+        self._max_lag_ms = 0.0
+        self._tick_count = 0
+
+    def dispose(self) -> None:
+        """Stop the monitor and clean up Qt resources."""
+        self.stop()
+        try:
+            self.deleteLater()
+        except RuntimeError:
+            # Qt object may have been deleted already
+            pass
+
+    ###########################################################################
+    # Internal methods
+    ###########################################################################
+
+    def _on_heartbeat(self) -> None:
+        now_ns = time.perf_counter_ns()
+        last_tick_ns = self._last_tick_ns
+        self._last_tick_ns = now_ns
+        if last_tick_ns is None:
+            return
+
+        self._tick_count += 1
+        lag_ms = max(0.0, (now_ns - last_tick_ns) / 1e6 - self._interval_ms)
+        self._last_lag_ms = lag_ms
+        self._max_lag_ms = max(self._max_lag_ms, lag_ms)
+        if lag_ms < self._threshold_ms:
+            return
+
+        stall_start_ns = now_ns - int(lag_ms * 1e6)
+        report = StallReport(stall_start_ns, lag_ms, self._attribute(stall_start_ns, now_ns))
+        self._history.append(report)
+        self.stallDetected.emit(report)
+
+    def _attribute(self, stall_start_ns: int, stall_end_ns: int) -> tuple[TraceEvent, ...]:
+        """Find the GUI-thread spans that overlapped the stall, longest overlap first."""
+        tracer = tracing.get_tracer()
+        if tracer is None:
+            return ()
+        gui_thread_id = threading.get_ident()
+
+        overlapping: list[tuple[int, TraceEvent]] = []
+        # Spans still in progress (e.g. a nested event loop inside a commit) ...
+        candidates = tracer.open_spans(gui_thread_id)
+        # ... and spans that ended during the stall (events are recorded in order of their end)
+        for event in reversed(tracer.events()):
+            if event.end_ns < stall_start_ns:
+                break
+            candidates.append(event)
+
+        for event in candidates:
+            if event.phase != "X" or event.thread_id != gui_thread_id:
+                continue
+            overlap = min(event.end_ns, stall_end_ns) - max(event.start_ns, stall_start_ns)
+            if overlap > 0:
+                overlapping.append((overlap, event))
+        overlapping.sort(key=lambda item: item[0], reverse=True)
+        return tuple(event for _, event in overlapping)
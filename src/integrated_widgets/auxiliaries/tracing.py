@@ -0,0 +1,282 @@
+"""
+Tracing of controller activity (Chrome trace / Perfetto)
+========================================================
+
+When tracing is enabled, controllers and widgets record spans into an in-memory
+ring buffer, for example debounce scheduling, commits, nexus submissions, widget
+invalidations and layout rebuilds. Each span carries the controller id and
+the hook keys involved. The buffer can be exported as Chrome trace-event JSON and
+opened in ``chrome://tracing`` or https://ui.perfetto.dev.
+
+Usage
+-----
+
+```python
+from integrated_widgets.core import start_tracing, stop_tracing
+
+tracer = start_tracing(capacity=200_000)
+...  # interact with the application
+stop_tracing()
+tracer.export_chrome_trace("trace.json")
+```
+
+Overhead
+--------
+While tracing is disabled, `span()` returns a shared no-op context manager and
+`instant()` returns immediately. Span arguments are passed as references and
+formatted only when tracing is enabled.
+
+Recorded events
+---------------
+* ``debounce`` (instant): a submission was staged, with its debounce delay
+* ``commit``: `BaseController._commit_staged_widget_value`
+* ``commit_elided`` (instant): a commit was skipped because the values were unchanged
+* ``nexus_submit``: the nexus manager submission inside a commit
+* ``invalidation_requested`` (instant): a widget invalidation was queued, e.g. after nexus propagation reached a controller
+* ``invalidate``: widget invalidation
+* ``read_widgets``: reading the widgets of a composite controller
+* ``rebuild``: `IQtWidgetBase._rebuild`
+* ``rebind``: `BaseController._rebind_hooks` (``rebind()`` of singleton and composite controllers)
+* ``invalidation_slice``: one time-budgeted slice of `InvalidationScheduler` (see ``default.INVALIDATION_FRAME_BUDGET_MS``)
+* ``thaw``: `IQtWidgetBase.thaw`, applying the invalidations collected while the widget tree was frozen
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, ContextManager, Iterable, Optional
+import json
+import os
+import threading
+import time
+
+_TRACER: Optional["Tracer"] = None
+
+_NULL_SPAN: ContextManager[None] = nullcontext()
+
+
+def subject_id(subject: Any) -> str:
+    """Get the id of a controller or widget as shown in traces, e.g. ``FloatEntryController#7f3a2c``."""
+    return f"{type(subject).__name__}#{id(subject):x}"
+
+
+class TraceEvent:
+    """A recorded span (``phase == "X"``) or instant event (``phase == "i"``). Times in nanoseconds."""
+
+    __slots__ = ("name", "phase", "start_ns", "duration_ns", "thread_id", "subject", "keys", "args")
+
+    def __init__(
+        self,
+        name: str,
+        phase: str,
+        start_ns: int,
+        duration_ns: int,
+        thread_id: int,
+        subject: Optional[str],
+        keys: Optional[tuple[str, ...]],
+        args: Optional[dict[str, Any]],
+    ) -> None:
+        self.name = name
+        self.phase = phase
+        self.start_ns = start_ns
+        self.duration_ns = duration_ns
+        self.thread_id = thread_id
+        self.subject = subject
+        self.keys = keys
+        self.args = args
+
+    @property
+    def end_ns(self) -> int:
+        return self.start_ns + self.duration_ns
+
+    def __repr__(self) -> str:
+        return f"TraceEvent({self.name!r}, subject={self.subject!r}, duration_ms={self.duration_ns / 1e6:.3f})"
+
+
+class Tracer:
+    """
+    Ring buffer of trace events. Use `start_tracing()` to install a tracer.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        Maximum number of events kept; the oldest events are dropped first. Defaults to 100000.
+    """
+
+    def __init__(self, capacity: int = 100_000) -> None:
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self._events: deque[TraceEvent] = deque(maxlen=capacity)
+        self._dropped: int = 0
+        self._open_spans: dict[int, list["_Span"]] = {}
+
+    @property
+    def capacity(self) -> int:
+        return self._events.maxlen # type: ignore
+
+    @property
+    def dropped_count(self) -> int:
+        """Number of events dropped because the buffer was full."""
+        return self._dropped
+
+    def events(self) -> list[TraceEvent]:
+        """Get the recorded events, oldest first."""
+        return list(self._events)
+
+    def open_spans(self, thread_id: Optional[int] = None) -> list[TraceEvent]:
+        """
+        Get the spans currently in progress on a thread (outermost first), with their duration so far.
+
+        Parameters
+        ----------
+        thread_id : int, optional
+            The thread to inspect. Defaults to the main thread.
+        """
+        if thread_id is None:
+            thread_id = threading.main_thread().ident # type: ignore
+        now = time.perf_counter_ns()
+        return [span._to_event(now) for span in list(self._open_spans.get(thread_id, ()))] # type: ignore
+
+    def clear(self) -> None:
+        self._events.clear()
+        self._dropped = 0
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Convert the recorded events into the Chrome trace-event format."""
+        pid = os.getpid()
+        trace_events: list[dict[str, Any]] = []
+        for event in self._events:
+            args: dict[str, Any] = {}
+            if event.subject is not None:
+                args["controller"] = event.subject
+            if event.keys is not None:
+                args["keys"] = list(event.keys)
+            if event.args:
+                args.update(event.args)
+            trace_event: dict[str, Any] = {
+                "name": event.name,
+                "cat": "integrated_widgets",
+                "ph": event.phase,
+                "ts": event.start_ns / 1000.0,
+                "pid": pid,
+                "tid": event.thread_id,
+                "args": args,
+            }
+            if event.phase == "X":
+                trace_event["dur"] = event.duration_ns / 1000.0
+            else:
+                trace_event["s"] = "t"
+            trace_events.append(trace_event)
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str | Path) -> None:
+        """Write the recorded events as Chrome trace-event JSON."""
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_chrome_trace(), file, default=str)
+
+    def _record(self, event: TraceEvent) -> None:
+        if len(self._events) == self._events.maxlen:
+            self._dropped += 1
+        self._events.append(event)
+
+
+class _Span:
+
+    __slots__ = ("_tracer", "_name", "_subject", "_keys", "_args", "_start_ns", "_thread_id")
+
+    def __init__(self, tracer: Tracer, name: str, subject: Any, keys: Optional[Iterable[Any]], args: Optional[dict[str, Any]]) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._subject = subject
+        self._keys = keys
+        self._args = args
+        self._start_ns = 0
+        self._thread_id = 0
+
+    def __enter__(self) -> "_Span":
+        self._thread_id = threading.get_ident()
+        self._tracer._open_spans.setdefault(self._thread_id, []).append(self)
+        self._start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        end_ns = time.perf_counter_ns()
+        stack = self._tracer._open_spans.get(self._thread_id)
+        if stack and stack[-1] is self:
+            stack.pop()
+        self._tracer._record(self._to_event(end_ns))
+
+    def _to_event(self, end_ns: int) -> TraceEvent:
+        return TraceEvent(
+            self._name,
+            "X",
+            self._start_ns,
+            end_ns - self._start_ns,
+            self._thread_id,
+            None if self._subject is None else subject_id(self._subject),
+            None if self._keys is None else tuple(str(key) for key in self._keys),
+            self._args,
+        )
+
+
+###########################################################################
+# Instrumentation API
+###########################################################################
+
+def span(name: str, subject: Any = None, keys: Optional[Iterable[Any]] = None, args: Optional[dict[str, Any]] = None) -> ContextManager[Any]:
+    """
+    Record a span around a block if tracing is enabled.
+
+    Parameters
+    ----------
+    name : str
+        The span name, e.g. ``"commit"``.
+    subject : Any, optional
+        The controller or widget doing the work.
+    keys : Iterable, optional
+        The hook keys involved.
+    args : dict, optional
+        Further arguments shown in the trace viewer.
+    """
+    tracer = _TRACER
+    if tracer is None:
+        return _NULL_SPAN
+    return _Span(tracer, name, subject, keys, args)
+
+
+def instant(name: str, subject: Any = None, keys: Optional[Iterable[Any]] = None, args: Optional[dict[str, Any]] = None) -> None:
+    """Record an instant event if tracing is enabled."""
+    tracer = _TRACER
+    if tracer is None:
+        return
+    tracer._record(TraceEvent(
+        name,
+        "i",
+        time.perf_counter_ns(),
+        0,
+        threading.get_ident(),
+        None if subject is None else subject_id(subject),
+        None if keys is None else tuple(str(key) for key in keys),
+        args,
+    ))
+
+
+def start_tracing(capacity: int = 100_000) -> Tracer:
+    """Enable tracing with a new ring buffer and return its tracer."""
+    global _TRACER
+    _TRACER = Tracer(capacity)
+    return _TRACER
+
+
+def stop_tracing() -> Optional[Tracer]:
+    """Disable tracing and return the tracer that was active (if any)."""
+    global _TRACER
+    tracer, _TRACER = _TRACER, None
+    return tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Get the active tracer, or None if tracing is disabled."""
+    return _TRACER
@@ -0,0 +1,119 @@
+"""
+Memoized validation of complete controller values
+=================================================
+
+Composite controllers validate the complete set of primary values on every
+submission and nexus propagation. During drags and oscillating feeds, the same
+states come back again and again. A validator marked with `pure_validator`
+promises that its result only depends on the values it is given, so the
+controller may cache its results in a bounded LRU cache keyed by those values.
+
+```python
+@pure_validator
+def span_is_valid(values: Mapping[str, Any]) -> tuple[bool, str]:
+    lower, upper = values["span"]
+    return (lower < upper, "Lower bound must be below upper bound")
+
+controller = RangeSliderController(..., custom_validator=span_is_valid)
+```
+
+The cache key is the mapping of hook keys to ``(type, value)`` pairs, so ``1``
+and ``1.0`` are distinct states. Sets and mappings (e.g. the unit options of a
+`RealUnitedScalarController`) are frozen into the key; other values that are not
+hashable (e.g. lists) are validated without the cache. Set ``default.VALIDATION_CACHE_SIZE = 0`` to
+disable caching globally.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Set as AbstractSet
+from typing import Any, Callable, Hashable, Mapping, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_PURE_ATTRIBUTE: str = "__integrated_widgets_pure_validator__"
+
+
+def pure_validator(validator: F) -> F:
+    """Mark a validator as pure: its result only depends on the values it is given."""
+    setattr(validator, _PURE_ATTRIBUTE, True)
+    return validator
+
+
+def is_pure_validator(validator: Optional[Callable[..., Any]]) -> bool:
+    """Check whether a validator has been marked with `pure_validator`."""
+    return validator is not None and getattr(validator, _PURE_ATTRIBUTE, False) is True
+
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable ``(type, value)`` stand-in for a value: sets become frozensets, mappings frozensets of frozen items."""
+    if isinstance(value, AbstractSet):
+        return type(value), frozenset(value)
+    if isinstance(value, Mapping):
+        return type(value), frozenset((key, _freeze(item)) for key, item in value.items())
+    return type(value), value
+
+
+class CachedValidator:
+    """
+    LRU-memoizing wrapper of a pure validator of complete values.
+
+    Parameters
+    ----------
+    validator : Callable[[Mapping[str, Any]], tuple[bool, str]]
+        The pure validator.
+    maxsize : int
+        Maximum number of cached results (least recently used results are dropped first).
+    """
+
+    __slots__ = ("_validator", "_maxsize", "_results", "_hits", "_misses", "_uncacheable")
+
+    def __init__(self, validator: Callable[[Mapping[Any, Any]], tuple[bool, str]], maxsize: int) -> None:
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self._validator = validator
+        self._maxsize: int = maxsize
+        self._results: OrderedDict[Hashable, tuple[bool, str]] = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._uncacheable: int = 0
+
+    def __call__(self, values: Mapping[Any, Any]) -> tuple[bool, str]:
+        try:
+            key = frozenset((hook_key, _freeze(value)) for hook_key, value in values.items())
+            result = self._results.get(key)
+        except TypeError:
+            # Unhashable value
+            self._uncacheable += 1
+            return self._validator(values)
+
+        if result is not None:
+            self._hits += 1
+            self._results.move_to_end(key)
+            return result
+
+        self._misses += 1
+        result = self._validator(values)
+        self._results[key] = result
+        if len(self._results) > self._maxsize:
+            self._results.popitem(last=False)
+        return result
+
+    @property
+    def validator(self) -> Callable[[Mapping[Any, Any]], tuple[bool, str]]:
+        return self._validator
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._results.clear()
+
+    def info(self) -> dict[str, int]:
+        """Get the cache statistics."""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "uncacheable": self._uncacheable,
+            "size": len(self._results),
+            "maxsize": self._maxsize,
+        }
@@ -0,0 +1,544 @@
+"""
+Snapshot and restore of whole widget trees
+==========================================
+
+A snapshot captures the values of every controller reachable from a layout
+payload (or an `IQtWidgetBase` holding one) and restores them with one batched
+nexus submission per nexus manager instead of one commit per controller.
+
+Usage
+-----
+
+```python
+snapshot = capture_snapshot(main_widget)
+data = snapshot.to_bytes()
+
+restore_snapshot(main_widget, WidgetSnapshot.from_bytes(data))
+```
+
+Controllers are addressed by their path in the payload tree, e.g.
+``"settings.temperature"`` or ``"rows[3]"``, so a snapshot can be restored into
+a freshly built tree of the same shape.
+
+Binary format
+-------------
+Little-endian, starting with the magic ``b"IWS1"``:
+
+* string table (all strings, paths, keys; each stored once)
+* unit table and dimension table (indices into the string table); every
+  distinct unit is parsed only once when loading
+* one record per controller: path, then ``key -> value`` pairs
+
+Values are tagged; supported are None, bool, int, float, str, bytes, Path,
+tuple, list, set, frozenset, dict, Unit, Dimension and RealUnitedScalar.
+
+Preset libraries
+----------------
+`write_snapshot_library` stores many named snapshots in one file;
+`SnapshotLibrary` memory-maps it and decodes a snapshot only when it is
+accessed.
+"""
+
+from __future__ import annotations
+
+from dataclasses import fields, is_dataclass
+from pathlib import Path
+from typing import Any, Iterator, Mapping, Optional
+from logging import Logger
+import mmap
+import struct
+
+from united_system import RealUnitedScalar, Unit, Dimension
+
+from nexpy.core import Nexus, NexusManager
+
+from ..controllers.core.base_controller import BaseController
+from .resources import log_msg
+
+MAGIC: bytes = b"IWS1"
+LIBRARY_MAGIC: bytes = b"IWL1"
+
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_SCALAR = struct.Struct("<dI")
+_LIBRARY_ENTRY = struct.Struct("<IQQ")
+
+_INT64_MIN: int = -(2 ** 63)
+_INT64_MAX: int = 2 ** 63 - 1
+
+# Value tags
+_NONE, _TRUE, _FALSE = b"N", b"T", b"F"
+_INT, _BIG_INT, _FLOAT = b"i", b"I", b"f"
+_STR, _BYTES, _PATH = b"s", b"b", b"p"
+_TUPLE, _LIST, _SET, _FROZENSET, _DICT = b"t", b"l", b"S", b"Z", b"d"
+_UNIT, _DIMENSION, _SCALAR_TAG = b"u", b"D", b"r"
+
+
+class WidgetSnapshot:
+    """
+    Values of the controllers in a widget tree, keyed by controller path and hook key.
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(self, values: Mapping[str, Mapping[str, Any]]) -> None:
+        self._values: dict[str, dict[str, Any]] = {path: dict(hook_values) for path, hook_values in values.items()}
+
+    @property
+    def values(self) -> dict[str, dict[str, Any]]:
+        """Get the captured values as ``{controller_path: {hook_key: value}}``."""
+        return self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, WidgetSnapshot) and self._values == other._values
+
+    def __repr__(self) -> str:
+        return f"WidgetSnapshot(controllers={len(self._values)})"
+
+    def to_bytes(self) -> bytes:
+        """Encode the snapshot into the compact binary format."""
+        return _Encoder().encode(self._values)
+
+    @classmethod
+    def from_bytes(cls, data: bytes | bytearray | memoryview) -> "WidgetSnapshot":
+        """Decode a snapshot from the compact binary format."""
+        return cls(_Decoder(data).decode())
+
+
+###########################################################################
+# Capture and restore
+###########################################################################
+
+def collect_controllers(root: Any) -> dict[str, BaseController[Any, Any]]:
+    """
+    Collect the controllers of a widget tree, keyed by their path in the payload tree.
+
+    Parameters
+    ----------
+    root : LayoutPayloadBase | IQtWidgetBase
+        A payload, or a widget holding one. Nested widgets holding payloads are walked as well.
+
+    Returns
+    -------
+    dict[str, BaseController]
+        The controllers in payload field order.
+    """
+    controllers: dict[str, BaseController[Any, Any]] = {}
+    _walk(root, "", controllers, set())
+    return controllers
+
+
+def capture_snapshot(root: Any) -> WidgetSnapshot:
+    """
+    Capture the values of all controllers of a widget tree.
+
+    Uses the serialization protocol (``get_values_for_serialization``) of the controllers.
+    """
+    values: dict[str, dict[str, Any]] = {}
+    for path, controller in collect_controllers(root).items():
+        values[path] = dict(controller.get_values_for_serialization()) # type: ignore
+    return WidgetSnapshot(values)
+
+
+def restore_snapshot(
+    root: Any,
+    snapshot: WidgetSnapshot,
+    *,
+    strict: bool = False,
+    logger: Optional[Logger] = None,
+) -> tuple[bool, str]:
+    """
+    Restore a snapshot into a widget tree with one batched submission per nexus manager.
+
+    Controllers that share a nexus manager (usually all of them, via nexpy's default manager)
+    are restored in one validated submission: all or nothing. Controllers of different managers
+    are submitted separately, so a restore can be partial: if a manager rejects its values, the
+    controllers of the other managers stay restored, and the message names the paths that were
+    not restored.
+
+    Only the primary values of composite controllers are submitted; secondary (computed)
+    values in the snapshot are ignored and recomputed from them.
+
+    Pending (debounced) user edits of the restored controllers are dropped, and their
+    commit futures are cancelled.
+
+    Parameters
+    ----------
+    root : LayoutPayloadBase | IQtWidgetBase
+        The widget tree to restore into.
+    snapshot : WidgetSnapshot
+        The snapshot to restore.
+    strict : bool, optional
+        If True, raise a KeyError if the snapshot and the tree do not contain the same controllers.
+        Otherwise controllers missing on either side are skipped. Defaults to False.
+    logger : Logger, optional
+        Logger instance for debugging.
+
+    Returns
+    -------
+    tuple[bool, str]
+        Whether all submissions succeeded, and a message.
+    """
+    controllers = collect_controllers(root)
+    if strict and set(controllers) != set(snapshot.values):
+        missing = sorted(set(snapshot.values) - set(controllers))
+        unexpected = sorted(set(controllers) - set(snapshot.values))
+        raise KeyError(f"Snapshot does not match the widget tree (missing: {missing}, not in snapshot: {unexpected})")
+
+    submissions: dict[NexusManager, dict[Nexus[Any], Any]] = {}
+    paths_by_manager: dict[NexusManager, list[str]] = {}
+    controllers_by_manager: dict[NexusManager, list[BaseController[Any, Any]]] = {}
+    for path, hook_values in snapshot.values.items():
+        controller = controllers.get(path)
+        if controller is None or controller._is_disposed: # type: ignore
+            continue
+        nexus_and_values = submissions.setdefault(controller._nexus_manager, {}) # type: ignore
+        primary_hooks = getattr(controller, "_primary_hooks", None)
+        for key, value in hook_values.items():
+            if primary_hooks is not None and key not in primary_hooks:
+                continue
+            nexus_and_values[controller._get_hook_by_key(key)._get_nexus()] = value # type: ignore
+        controller._discard_pending_submission() # type: ignore
+        paths_by_manager.setdefault(controller._nexus_manager, []).append(path) # type: ignore
+        controllers_by_manager.setdefault(controller._nexus_manager, []).append(controller) # type: ignore
+
+    restored: list[BaseController[Any, Any]] = []
+    failed_paths: list[str] = []
+    messages: list[str] = []
+    for nexus_manager, nexus_and_values in submissions.items():
+        success, msg = nexus_manager.submit_values(nexus_and_values, logger=logger)
+        if success:
+            restored.extend(controllers_by_manager[nexus_manager])
+        else:
+            failed_paths.extend(paths_by_manager[nexus_manager])
+            messages.append(msg)
+
+    for controller in restored:
+        controller._notify_content_changed() # type: ignore
+    if failed_paths:
+        msg = f"Restored {len(restored)} controllers; not restored: {failed_paths} ({'; '.join(messages)})"
+        log_msg(snapshot, "restore_snapshot", logger, f"Failed to restore snapshot: {msg}")
+        return False, msg
+    log_msg(snapshot, "restore_snapshot", logger, f"Restored {len(restored)} controllers")
+    return True, f"Restored {len(restored)} controllers"
+
+
+def _walk(obj: Any, path: str, controllers: dict[str, BaseController[Any, Any]], seen: set[int]) -> None:
+    if id(obj) in seen:
+        return
+    seen.add(id(obj))
+
+    # Controlled widgets reference their controller as well; keep the outermost path
+    controller = getattr(obj, "_controller", None)
+    if isinstance(controller, BaseController) and id(controller) not in seen:
+        seen.add(id(controller))
+        controllers[path] = controller
+
+    payload = getattr(obj, "_payload", None)
+    if payload is not None:
+        _walk(payload, path, controllers, seen)
+        return
+
+    if not is_dataclass(obj) or isinstance(obj, type):
+        return
+    for field_info in fields(obj):
+        value = getattr(obj, field_info.name)
+        field_path = field_info.name if path == "" else f"{path}.{field_info.name}"
+        if isinstance(value, Mapping):
+            for key, item in value.items(): # type: ignore
+                _walk(item, f"{field_path}[{key!r}]", controllers, seen)
+        elif isinstance(value, (list, tuple)):
+            for index, item in enumerate(value): # type: ignore
+                _walk(item, f"{field_path}[{index}]", controllers, seen)
+        else:
+            _walk(value, field_path, controllers, seen)
+
+
+###########################################################################
+# Preset libraries
+###########################################################################
+
+def write_snapshot_library(path: str | Path, snapshots: Mapping[str, WidgetSnapshot]) -> None:
+    """
+    Write named snapshots into one library file that can be opened with `SnapshotLibrary`.
+
+    Layout: magic, entry count, then per entry the name length and the offset and length
+    of its encoded snapshot, followed by the names and the snapshot data.
+    """
+    names = [name.encode("utf-8") for name in snapshots]
+    blobs = [snapshot.to_bytes() for snapshot in snapshots.values()]
+
+    header_size = len(LIBRARY_MAGIC) + _U32.size + _LIBRARY_ENTRY.size * len(blobs)
+    offset = header_size + sum(len(name) for name in names)
+    parts: list[bytes] = [LIBRARY_MAGIC, _U32.pack(len(blobs))]
+    for name, blob in zip(names, blobs):
+        parts.append(_LIBRARY_ENTRY.pack(len(name), offset, len(blob)))
+        offset += len(blob)
+    parts.extend(names)
+    parts.extend(blobs)
+
+    with open(path, "wb") as file:
+        file.write(b"".join(parts))
+
+
+class SnapshotLibrary(Mapping[str, WidgetSnapshot]):
+    """
+    Read-only, memory-mapped library of named snapshots.
+
+    Only the index is read when opening; snapshots are decoded on access.
+    Use as a context manager or call `close()` to release the mapping.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            self._file.close()
+            raise ValueError(f"Not a snapshot library: {path}")
+        self._entries: dict[str, tuple[int, int]] = {}
+
+        view = memoryview(self._mmap)
+        try:
+            if bytes(view[:len(LIBRARY_MAGIC)]) != LIBRARY_MAGIC:
+                raise ValueError(f"Not a snapshot library: {path}")
+            (count,) = _U32.unpack_from(view, len(LIBRARY_MAGIC))
+            entry_offset = len(LIBRARY_MAGIC) + _U32.size
+            name_offset = entry_offset + _LIBRARY_ENTRY.size * count
+            for _ in range(count):
+                name_length, data_offset, data_length = _LIBRARY_ENTRY.unpack_from(view, entry_offset)
+                entry_offset += _LIBRARY_ENTRY.size
+                name = bytes(view[name_offset:name_offset + name_length]).decode("utf-8")
+                name_offset += name_length
+                self._entries[name] = (data_offset, data_length)
+        except Exception:
+            view.release()
+            self.close()
+            raise
+        view.release()
+
+    def __getitem__(self, name: str) -> WidgetSnapshot:
+        data_offset, data_length = self._entries[name]
+        with memoryview(self._mmap) as view:
+            return WidgetSnapshot.from_bytes(view[data_offset:data_offset + data_length])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def close(self) -> None:
+        """Release the memory mapping and the file."""
+        if not self._mmap.closed:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "SnapshotLibrary":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+
+###########################################################################
+# Binary encoding
+###########################################################################
+
+class _Encoder:
+
+    def __init__(self) -> None:
+        self._strings: dict[str, int] = {}
+        self._units: dict[str, int] = {}
+        self._dimensions: dict[str, int] = {}
+        self._body: list[bytes] = []
+
+    def encode(self, values: Mapping[str, Mapping[str, Any]]) -> bytes:
+        body = self._body
+        body.append(_U32.pack(len(values)))
+        for path, hook_values in values.items():
+            body.append(_U32.pack(self._string(path)))
+            body.append(_U32.pack(len(hook_values)))
+            for key, value in hook_values.items():
+                body.append(_U32.pack(self._string(key)))
+                self._value(value)
+
+        head: list[bytes] = [MAGIC, _U32.pack(len(self._strings))]
+        for string in self._strings:
+            encoded = string.encode("utf-8")
+            head.append(_U32.pack(len(encoded)))
+            head.append(encoded)
+        for table in (self._units, self._dimensions):
+            head.append(_U32.pack(len(table)))
+            head.extend(_U32.pack(self._strings[text]) for text in table)
+        return b"".join(head + body)
+
+    def _string(self, string: str) -> int:
+        index = self._strings.get(string)
+        if index is None:
+            index = self._strings[string] = len(self._strings)
+        return index
+
+    def _interned(self, table: dict[str, int], text: str) -> int:
+        self._string(text)
+        index = table.get(text)
+        if index is None:
+            index = table[text] = len(table)
+        return index
+
+    def _sequence(self, tag: bytes, items: Any) -> None:
+        self._body.append(tag + _U32.pack(len(items)))
+        for item in items:
+            self._value(item)
+
+    def _value(self, value: Any) -> None:
+        body = self._body
+        if value is None:
+            body.append(_NONE)
+        elif value is True:
+            body.append(_TRUE)
+        elif value is False:
+            body.append(_FALSE)
+        elif isinstance(value, int):
+            if _INT64_MIN <= value <= _INT64_MAX:
+                body.append(_INT + _I64.pack(value))
+            else:
+                body.append(_BIG_INT + _U32.pack(self._string(str(value))))
+        elif isinstance(value, float):
+            body.append(_FLOAT + _F64.pack(value))
+        elif isinstance(value, str):
+            body.append(_STR + _U32.pack(self._string(value)))
+        elif isinstance(value, RealUnitedScalar):
+            body.append(_SCALAR_TAG + _SCALAR.pack(value.value(), self._interned(self._units, str(value.unit))))
+        elif isinstance(value, Unit):
+            body.append(_UNIT + _U32.pack(self._interned(self._units, str(value))))
+        elif isinstance(value, Dimension):
+            body.append(_DIMENSION + _U32.pack(self._interned(self._dimensions, str(value))))
+        elif isinstance(value, Path):
+            body.append(_PATH + _U32.pack(self._string(str(value))))
+        elif isinstance(value, (bytes, bytearray)):
+            body.append(_BYTES + _U32.pack(len(value)) + bytes(value))
+        elif isinstance(value, tuple):
+            self._sequence(_TUPLE, value)
+        elif isinstance(value, list):
+            self._sequence(_LIST, value)
+        elif isinstance(value, frozenset):
+            self._sequence(_FROZENSET, value)
+        elif isinstance(value, set):
+            self._sequence(_SET, value)
+        elif isinstance(value, Mapping):
+            body.append(_DICT + _U32.pack(len(value))) # type: ignore
+            for key, item in value.items(): # type: ignore
+                self._value(key)
+                self._value(item)
+        else:
+            raise TypeError(f"Cannot encode value of type {type(value).__name__} in a widget snapshot")
+
+
+class _Decoder:
+
+    def __init__(self, data: bytes | bytearray | memoryview) -> None:
+        self._data = data
+        self._offset = 0
+        self._strings: list[str] = []
+        self._unit_names: list[str] = []
+        self._dimension_names: list[str] = []
+        self._units: dict[int, Unit] = {}
+        self._dimensions: dict[int, Dimension] = {}
+
+    def decode(self) -> dict[str, dict[str, Any]]:
+        data = self._data
+        if bytes(data[:len(MAGIC)]) != MAGIC:
+            raise ValueError("Not a widget snapshot")
+        self._offset = len(MAGIC)
+
+        for _ in range(self._u32()):
+            length = self._u32()
+            self._strings.append(bytes(data[self._offset:self._offset + length]).decode("utf-8"))
+            self._offset += length
+        self._unit_names = [self._strings[self._u32()] for _ in range(self._u32())]
+        self._dimension_names = [self._strings[self._u32()] for _ in range(self._u32())]
+
+        values: dict[str, dict[str, Any]] = {}
+        for _ in range(self._u32()):
+            path = self._strings[self._u32()]
+            hook_values: dict[str, Any] = {}
+            for _ in range(self._u32()):
+                key = self._strings[self._u32()]
+                hook_values[key] = self._value()
+            values[path] = hook_values
+        return values
+
+    def _u32(self) -> int:
+        (value,) = _U32.unpack_from(self._data, self._offset)
+        self._offset += _U32.size
+        return value
+
+    def _unit(self, index: int) -> Unit:
+        unit = self._units.get(index)
+        if unit is None:
+            unit = self._units[index] = Unit(self._unit_names[index])
+        return unit
+
+    def _dimension(self, index: int) -> Dimension:
+        dimension = self._dimensions.get(index)
+        if dimension is None:
+            dimension = self._dimensions[index] = Dimension(self._dimension_names[index])
+        return dimension
+
+    def _value(self) -> Any:
+        tag = bytes(self._data[self._offset:self._offset + 1])
+        self._offset += 1
+        if tag == _NONE:
+            return None
+        if tag == _TRUE:
+            return True
+        if tag == _FALSE:
+            return False
+        if tag == _INT:
+            (value,) = _I64.unpack_from(self._data, self._offset)
+            self._offset += _I64.size
+            return value
+        if tag == _BIG_INT:
+            return int(self._strings[self._u32()])
+        if tag == _FLOAT:
+            (value,) = _F64.unpack_from(self._data, self._offset)
+            self._offset += _F64.size
+            return value
+        if tag == _STR:
+            return self._strings[self._u32()]
+        if tag == _SCALAR_TAG:
+            float_value, unit_index = _SCALAR.unpack_from(self._data, self._offset)
+            self._offset += _SCALAR.size
+            return RealUnitedScalar(float_value, self._unit(unit_index))
+        if tag == _UNIT:
+            return self._unit(self._u32())
+        if tag == _DIMENSION:
+            return self._dimension(self._u32())
+        if tag == _PATH:
+            return Path(self._strings[self._u32()])
+        if tag == _BYTES:
+            length = self._u32()
+            value = bytes(self._data[self._offset:self._offset + length])
+            self._offset += length
+            return value
+        if tag == _TUPLE:
+            return tuple(self._value() for _ in range(self._u32()))
+        if tag == _LIST:
+            return [self._value() for _ in range(self._u32())]
+        if tag == _SET:
+            return {self._value() for _ in range(self._u32())}
+        if tag == _FROZENSET:
+            return frozenset(self._value() for _ in range(self._u32()))
+        if tag == _DICT:
+            result: dict[Any, Any] = {}
+            for _ in range(self._u32()):
+                key = self._value()
+                result[key] = self._value()
+            return result
+        raise ValueError(f"Invalid value tag {tag!r} at offset {self._offset - 1}")
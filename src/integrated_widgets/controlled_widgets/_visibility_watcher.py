@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from typing import Optional
+from PySide6.QtCore import QObject, Qt, Signal, QEvent
+from PySide6.QtWidgets import QWidget
+
+_WINDOW_WATCHER_NAME: str = "_integrated_widgets_window_visibility_watcher"
+
+
+class _WindowVisibilityWatcher(QObject):
+    """
+    The single event filter of a top-level window, shared by all VisibilityWatchers of widgets in it.
+
+    Fans a window leaving the minimized state out to the registered watchers, so
+    events of the window pass through one Python filter however many widgets it holds.
+    """
+
+    def __init__(self, window: QWidget) -> None:
+        super().__init__(window)
+        self.setObjectName(_WINDOW_WATCHER_NAME)
+        self._window = window
+        self._watchers: dict[int, VisibilityWatcher] = {}
+        window.installEventFilter(self)
+
+    @classmethod
+    def of(cls, window: QWidget) -> "_WindowVisibilityWatcher":
+        """Get the watcher of a window, creating it on first use."""
+        watcher = window.findChild(cls, _WINDOW_WATCHER_NAME, Qt.FindChildOption.FindDirectChildrenOnly)
+        return watcher if watcher is not None else cls(window)
+
+    def register(self, watcher: "VisibilityWatcher") -> None:
+        self._watchers[id(watcher)] = watcher
+
+    def unregister(self, watcher: "VisibilityWatcher") -> None:
+        self._watchers.pop(id(watcher), None)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if watched is self._window and event.type() == QEvent.Type.WindowStateChange and not self._window.isMinimized():
+            for watcher in list(self._watchers.values()):
+                try:
+                    watcher.becameVisible.emit()
+                except RuntimeError:
+                    # Watcher already deleted
+                    self._watchers.pop(id(watcher), None)
+        return super().eventFilter(watched, event)
+
+
+class VisibilityWatcher(QObject):
+    """
+    Attach to any QWidget to get a signal whenever it may have become visible.
+
+    Emits on the widget's Show event and when its top-level window leaves the
+    minimized state. The top-level window is re-resolved on reparenting. Window
+    events are observed by one shared filter per window (see `_WindowVisibilityWatcher`).
+    """
+
+    becameVisible = Signal()
+
+    def __init__(self, target: QWidget, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent or target)
+        self._target = target
+        self._window_watcher: Optional[_WindowVisibilityWatcher] = None
+        target.installEventFilter(self)
+        self._watch_window()
+        target.destroyed.connect(self.dispose)
+
+    def _watch_window(self) -> None:
+        window = self._target.window()
+        window_watcher = None if window is self._target else _WindowVisibilityWatcher.of(window)
+        if window_watcher is self._window_watcher:
+            return
+        if self._window_watcher is not None:
+            try:
+                self._window_watcher.unregister(self)
+            except RuntimeError:
+                # Old window already deleted
+                pass
+        self._window_watcher = window_watcher
+        if window_watcher is not None:
+            window_watcher.register(self)
+
+    def dispose(self, *_: object) -> None:
+        """Stop watching the window. Called when the target is destroyed."""
+        if self._window_watcher is not None:
+            try:
+                self._window_watcher.unregister(self)
+            except RuntimeError:
+                # Window already deleted
+                pass
+            self._window_watcher = None
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if watched is self._target:
+            event_type = event.type()
+            if event_type == QEvent.Type.ParentChange:
+                self._watch_window()
+            elif event_type == QEvent.Type.Show:
+                self.becameVisible.emit()
+            elif event_type == QEvent.Type.WindowStateChange and self._window_watcher is None and not self._target.isMinimized():
+                # The target is a top-level window itself
+                self.becameVisible.emit()
+        return super().eventFilter(watched, event)
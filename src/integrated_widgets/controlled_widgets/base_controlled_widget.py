@@ -2,8 +2,10 @@ from typing import Optional, Any
 from logging import Logger
 
 from PySide6.QtCore import Signal
+from PySide6.QtWidgets import QWidget
 
 from integrated_widgets.controllers.core.base_controller import BaseController
+from integrated_widgets.auxiliaries import live_registry
 
 class BaseControlledWidget:
 
@@ -26,6 +28,11 @@ class BaseControlledWidget:
         self._controller = controller
         self._logger = logger
         self._internal_widget_update = False
+        live_registry.register(self)
+
+        # Let the controller track visibility of its widgets (QButtonGroup-based widgets are not QWidgets)
+        if isinstance(self, QWidget):
+            controller._register_controlled_widget(self) # type: ignore
 
     @property
     def controller(self) -> BaseController[Any, Any]:
@@ -34,28 +34,52 @@ Controllers that manage multiple related observable values:
 - **UnitSelectController**: Unit selection with dimension validation (no None allowed)
 """
 
-# Core base classes
-from .core.base_controller import BaseController as ControllerBase
-from .core.base_composite_controller import BaseCompositeController as CompositeControllerBase
-from .core.base_singleton_controller import BaseSingletonController as SingletonControllerBase
+from typing import TYPE_CHECKING
 
-# Singleton controllers
-from .singleton.check_box_controller import CheckBoxController
-from .singleton.display_value_controller import DisplayValueController
-from .singleton.float_entry_controller import FloatEntryController
-from .singleton.integer_entry_controller import IntegerEntryController
-from .singleton.optional_text_entry_controller import OptionalTextEntryController
-from .singleton.path_selector_controller import PathSelectorController
-from .singleton.text_entry_controller import TextEntryController
+from ..auxiliaries.lazy_imports import lazy_module_attributes
 
-# Composite controllers
-from .composite.double_set_select_controller import DoubleSetSelectController
-from .composite.range_slider_controller import RangeSliderController
-from .composite.real_united_scalar_controller import RealUnitedScalarController
-from .composite.single_set_optional_select_controller import SingleSetOptionalSelectController
-from .composite.single_set_select_controller import SingleSetSelectController
-from .composite.unit_optional_select_controller import UnitOptionalSelectController
-from .composite.unit_select_controller import UnitSelectController
+if TYPE_CHECKING:
+    # Core base classes
+    from .core.base_controller import BaseController as ControllerBase
+    from .core.base_composite_controller import BaseCompositeController as CompositeControllerBase
+    from .core.base_singleton_controller import BaseSingletonController as SingletonControllerBase
+    # Singleton controllers
+    from .singleton.check_box_controller import CheckBoxController
+    from .singleton.display_value_controller import DisplayValueController
+    from .singleton.float_entry_controller import FloatEntryController
+    from .singleton.integer_entry_controller import IntegerEntryController
+    from .singleton.optional_text_entry_controller import OptionalTextEntryController
+    from .singleton.path_selector_controller import PathSelectorController
+    from .singleton.text_entry_controller import TextEntryController
+    # Composite controllers
+    from .composite.double_set_select_controller import DoubleSetSelectController
+    from .composite.range_slider_controller import RangeSliderController
+    from .composite.real_united_scalar_controller import RealUnitedScalarController
+    from .composite.single_set_optional_select_controller import SingleSetOptionalSelectController
+    from .composite.single_set_select_controller import SingleSetSelectController
+    from .composite.unit_optional_select_controller import UnitOptionalSelectController
+    from .composite.unit_select_controller import UnitSelectController
+
+# Exported name -> (module, attribute); resolved on first access
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str]] = {
+    "ControllerBase": (".core.base_controller", "BaseController"),
+    "CompositeControllerBase": (".core.base_composite_controller", "BaseCompositeController"),
+    "SingletonControllerBase": (".core.base_singleton_controller", "BaseSingletonController"),
+    "CheckBoxController": (".singleton.check_box_controller", "CheckBoxController"),
+    "DisplayValueController": (".singleton.display_value_controller", "DisplayValueController"),
+    "FloatEntryController": (".singleton.float_entry_controller", "FloatEntryController"),
+    "IntegerEntryController": (".singleton.integer_entry_controller", "IntegerEntryController"),
+    "OptionalTextEntryController": (".singleton.optional_text_entry_controller", "OptionalTextEntryController"),
+    "PathSelectorController": (".singleton.path_selector_controller", "PathSelectorController"),
+    "TextEntryController": (".singleton.text_entry_controller", "TextEntryController"),
+    "DoubleSetSelectController": (".composite.double_set_select_controller", "DoubleSetSelectController"),
+    "RangeSliderController": (".composite.range_slider_controller", "RangeSliderController"),
+    "RealUnitedScalarController": (".composite.real_united_scalar_controller", "RealUnitedScalarController"),
+    "SingleSetOptionalSelectController": (".composite.single_set_optional_select_controller", "SingleSetOptionalSelectController"),
+    "SingleSetSelectController": (".composite.single_set_select_controller", "SingleSetSelectController"),
+    "UnitOptionalSelectController": (".composite.unit_optional_select_controller", "UnitOptionalSelectController"),
+    "UnitSelectController": (".composite.unit_select_controller", "UnitSelectController"),
+}
 
 __all__ = [
     # Core base classes
@@ -82,3 +106,4 @@ __all__ = [
     "UnitSelectController",
 ]
 
+__getattr__, __dir__ = lazy_module_attributes(__name__, globals(), _LAZY_ATTRIBUTES)
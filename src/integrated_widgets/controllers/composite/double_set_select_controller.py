@@ -12,6 +12,7 @@ from nexpy import default as nexpy_default
 
 from ...controlled_widgets.controlled_list_widget import ControlledListWidget
 from ...auxiliaries.default import default
+from ...auxiliaries.validation_cache import pure_validator
 from ..core.base_composite_controller import BaseCompositeController
 
 T = TypeVar("T")
@@ -38,6 +39,7 @@ class DoubleSetSelectController(BaseCompositeController[
         *,
         order_by_callable: Callable[[T], Any] = lambda x: str(x),
         debounce_ms: int|Callable[[], int] = default.DEFAULT_DEBOUNCE_MS,
+        headless: bool = False,
         custom_validator: Optional[Callable[[Mapping[Literal["selected_options", "available_options"], AbstractSet[T]]], tuple[bool, str]]] = None,
         nexus_manager: NexusManager = nexpy_default.NEXUS_MANAGER,
         logger: Optional[Logger] = None,
@@ -95,6 +97,7 @@ class DoubleSetSelectController(BaseCompositeController[
 
         #---------------------------------------------------- validate_complete_primary_values_callback ----------------------------------------------------
 
+        @pure_validator
         def validate_complete_primary_values_callback(x: Mapping[Literal["selected_options", "available_options"], Any]) -> tuple[bool, str]:
             # Verify both values are frozensets or sets
             selected: AbstractSet = x.get("selected_options", selected_options_initial_value) # type: ignore
@@ -120,6 +123,7 @@ class DoubleSetSelectController(BaseCompositeController[
             validate_complete_primary_values_callback=validate_complete_primary_values_callback,
             custom_validator=custom_validator,
             debounce_ms=debounce_ms,
+            headless=headless,
             nexus_manager=nexus_manager,
             logger=logger,
         )
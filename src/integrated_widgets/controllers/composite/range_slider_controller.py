@@ -16,6 +16,7 @@ from ...controlled_widgets.controlled_range_slider import ControlledRangeSlider
 from ...controlled_widgets.controlled_qlabel import ControlledQLabel
 from ...auxiliaries.resources import log_msg
 from ...auxiliaries.default import default
+from ...auxiliaries.validation_cache import pure_validator
 from ..core.base_composite_controller import BaseCompositeController
 
 T = TypeVar("T", bound=float|RealUnitedScalar)
@@ -125,6 +126,7 @@ class RangeSliderController(BaseCompositeController[PrimaryHookKeyType, Secondar
         *,
         custom_validator: Optional[Callable[[Mapping[PrimaryHookKeyType, Any]], tuple[bool, str]]] = None,
         debounce_ms: int|Callable[[], int] = default.DEFAULT_DEBOUNCE_MS,
+        headless: bool = False,
         nexus_manager: NexusManager = nexpy_default.NEXUS_MANAGER,
         logger: Optional[Logger] = None,
     ) -> None:
@@ -213,6 +215,7 @@ class RangeSliderController(BaseCompositeController[PrimaryHookKeyType, Secondar
 
         #---------------------------------------------------- verification_method ----------------------------------------------------
 
+        @pure_validator
         def validate_complete_primary_values_callback(x: Mapping[PrimaryHookKeyType, Any]) -> tuple[bool, str]:
 
             number_of_ticks: int = x["number_of_ticks"]
@@ -321,6 +324,7 @@ class RangeSliderController(BaseCompositeController[PrimaryHookKeyType, Secondar
             },
             custom_validator=custom_validator,
             debounce_ms=debounce_ms,
+            headless=headless,
             nexus_manager=nexus_manager,
             logger=logger,
         )
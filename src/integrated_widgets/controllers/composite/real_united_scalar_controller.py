@@ -19,6 +19,8 @@ from ...controlled_widgets.controlled_line_edit import ControlledLineEdit
 from ...controlled_widgets.controlled_editable_combobox import ControlledEditableComboBox
 from ...auxiliaries.resources import log_msg, DEFAULT_FLOAT_FORMAT_VALUE
 from ...auxiliaries.default import default
+from ...auxiliaries.validation_cache import pure_validator
+from ...auxiliaries.input_validators import float_input_validator, real_united_scalar_input_validator, unit_input_validator
 from ..core.base_composite_controller import BaseCompositeController
 
 class RealUnitedScalarController(BaseCompositeController[Literal["scalar_value", "unit_options", "unit", "float_value", "allowed_dimensions"], Literal["dimension", "selectable_units"], RealUnitedScalar|Mapping[Dimension, AbstractSet[Unit]]|Unit|float|AbstractSet[Dimension], Dimension|AbstractSet[Unit]]):
@@ -109,6 +111,8 @@ class RealUnitedScalarController(BaseCompositeController[Literal["scalar_value",
         allowed_dimensions: Optional[AbstractSet[Dimension]] | Hook[AbstractSet[Dimension]] | XSingleValueProtocol[Optional[AbstractSet[Dimension]]] = None,
         custom_validator: Optional[Callable[[Mapping[Literal["scalar_value", "unit_options", "unit", "float_value", "allowed_dimensions"], RealUnitedScalar | Mapping[Dimension, AbstractSet[Unit]] | Unit | float | AbstractSet[Dimension]]], tuple[bool, str]]] = None,
         debounce_ms: int|Callable[[], int] = default.DEFAULT_DEBOUNCE_MS,
+        headless: bool = False,
+        keystroke_validation: bool = False,
         nexus_manager: NexusManager = nexpy_default.NEXUS_MANAGER,
         logger: Optional[Logger] = None,
     ) -> None:
@@ -151,6 +155,14 @@ class RealUnitedScalarController(BaseCompositeController[Literal["scalar_value",
                 Example: `{length_dim, time_dim}` to allow only length and time.
                 None (default) allows all dimensions.
                 
+            headless: If True, no widgets are created and submissions are committed
+                synchronously. Useful for validating values without a Qt event loop.
+                
+            keystroke_validation: If True, the line edits reject text that can never parse
+                (checked against a unit token grammar) while it is typed. Incomplete text and
+                quantities outside the allowed dimensions are reverted when editing finishes,
+                without a commit.
+                
             logger: Optional logger instance for debugging and diagnostics.
                 
         Example Usage:
@@ -191,6 +203,7 @@ class RealUnitedScalarController(BaseCompositeController[Literal["scalar_value",
         self._value_formatter = value_formatter
         self._unit_formatter = unit_formatter
         self._unit_options_sorter = unit_options_sorter
+        self._keystroke_validation = keystroke_validation
 
         ###########################################################################
         # Determine the initial values and external hooks
@@ -279,6 +292,7 @@ class RealUnitedScalarController(BaseCompositeController[Literal["scalar_value",
 
         #---------------------------------------------------- validate_complete_primary_values_callback ----------------------------------------------------
 
+        @pure_validator
         def verification_method(x: Mapping[Literal["scalar_value", "unit_options", "unit", "float_value", "allowed_dimensions"], RealUnitedScalar | Mapping[Dimension, AbstractSet[Unit]] | Unit | float | AbstractSet[Dimension]]) -> tuple[bool, str]:
 
             scalar_value: RealUnitedScalar = x["scalar_value"] # type: ignore
@@ -521,6 +535,7 @@ class RealUnitedScalarController(BaseCompositeController[Literal["scalar_value",
             compute_missing_primary_values_callback=compute_missing_primary_values_callback, # type: ignore
             custom_validator=custom_validator,
             debounce_ms=debounce_ms,
+            headless=headless,
             logger=logger 
         )
 
@@ -585,6 +600,41 @@ class RealUnitedScalarController(BaseCompositeController[Literal["scalar_value",
         self._unit_editable_combobox.userInputFinishedSignal.connect(lambda text: self._on_unit_editable_combobox_text_edited(text)) # type: ignore
         self._unit_editable_combobox.userInputFinishedSignal.connect(lambda _i: self._on_unit_editable_combobox_index_changed()) # type: ignore
 
+        if self._keystroke_validation:
+            self._install_keystroke_validators()
+
+    def _install_keystroke_validators(self) -> None:
+        """Reject unparsable text while it is typed (see `keystroke_validation`)."""
+
+        def dimension_is_allowed(dimension: Dimension) -> tuple[bool, str]:
+            allowed_dimensions: Optional[AbstractSet[Dimension]] = self.value_by_key("allowed_dimensions") # type: ignore
+            if allowed_dimensions is not None and dimension not in allowed_dimensions:
+                return False, f"Dimension {dimension} not in allowed dimensions {allowed_dimensions}"
+            return True, "Dimension is allowed"
+
+        def unit_text() -> str:
+            return self._unit_formatter(self.value_by_key("unit")) # type: ignore
+
+        self._real_united_scalar_line_edit.setValidator(real_united_scalar_input_validator(
+            custom_validator=lambda scalar: dimension_is_allowed(scalar.dimension),
+            fallback_text=lambda: self._value_formatter(self.value_by_key("scalar_value")), # type: ignore
+            parent=self._real_united_scalar_line_edit,
+        ))
+        self._float_value_line_edit.setValidator(float_input_validator(
+            fallback_text=lambda: f"{self.value_by_key('float_value'):.3f}",
+            parent=self._float_value_line_edit,
+        ))
+        self._unit_line_edit.setValidator(unit_input_validator(
+            custom_validator=lambda unit: dimension_is_allowed(unit.dimension),
+            fallback_text=unit_text,
+            parent=self._unit_line_edit,
+        ))
+        self._unit_editable_combobox.setValidator(unit_input_validator(
+            custom_validator=lambda unit: dimension_is_allowed(unit.dimension),
+            fallback_text=unit_text,
+            parent=self._unit_editable_combobox,
+        ))
+
     def _read_widget_primary_values_impl(self) -> Optional[Mapping[Literal["scalar_value", "unit_options", "unit", "float_value", "allowed_dimensions"], Any]]:
         """
         Read the primary values from the real united scalar widgets.
@@ -19,6 +19,7 @@ from ...controlled_widgets.controlled_list_widget import ControlledListWidget
 from ...controlled_widgets.controlled_qlabel import ControlledQLabel
 from ...auxiliaries.resources import combo_box_find_data, list_widget_find_data
 from ...auxiliaries.default import default
+from ...auxiliaries.validation_cache import pure_validator
 from ..core.base_composite_controller import BaseCompositeController
 
 T = TypeVar("T")
@@ -40,6 +41,7 @@ class SingleSetOptionalSelectController(BaseCompositeController[Literal["selecte
         none_option_text: str = "-",
         custom_validator: Optional[Callable[[Mapping[Literal["selected_option", "available_options"], Any]], tuple[bool, str]]] = None,
         debounce_ms: int|Callable[[], int] = default.DEFAULT_DEBOUNCE_MS,
+        headless: bool = False,
         nexus_manager: NexusManager = nexpy_default.NEXUS_MANAGER,
         logger: Optional[Logger] = None,
     ) -> None:
@@ -108,6 +110,7 @@ class SingleSetOptionalSelectController(BaseCompositeController[Literal["selecte
 
         #---------------------------------------------------- validate_complete_primary_values_callback ----------------------------------------------------
 
+        @pure_validator
         def validate_complete_primary_values_callback(x: Mapping[Literal["selected_option", "available_options"], Any]) -> tuple[bool, str]:
             # Handle partial updates by getting current values for missing keys
             selected_option: Optional[T] = x.get("selected_option", selected_option_initial_value) # type: ignore
@@ -132,6 +135,7 @@ class SingleSetOptionalSelectController(BaseCompositeController[Literal["selecte
             validate_complete_primary_values_callback=validate_complete_primary_values_callback,
             custom_validator=custom_validator,
             debounce_ms=debounce_ms,
+            headless=headless,
             nexus_manager=nexus_manager,
             logger=logger
         )
@@ -19,6 +19,7 @@ from ...controlled_widgets.controlled_radio_button_group import ControlledRadioB
 from ...auxiliaries.resources import combo_box_find_data, list_widget_find_data
 from ...controlled_widgets.controlled_qlabel import ControlledQLabel
 from ...auxiliaries.default import default
+from ...auxiliaries.validation_cache import pure_validator
 from ..core.base_composite_controller import BaseCompositeController
 
 T = TypeVar("T")
@@ -40,6 +41,7 @@ class SingleSetSelectController(BaseCompositeController[Literal["selected_option
         sorter: Callable[[T], Any] = lambda item: str(item),
         custom_validator: Optional[Callable[[Mapping[Literal["selected_option", "available_options"], Any]], tuple[bool, str]]] = None,
         debounce_ms: int|Callable[[], int] = default.DEFAULT_DEBOUNCE_MS,
+        headless: bool = False,
         nexus_manager: NexusManager = nexpy_default.NEXUS_MANAGER,
         logger: Optional[Logger] = None,
     ) -> None:
@@ -106,6 +108,7 @@ class SingleSetSelectController(BaseCompositeController[Literal["selected_option
 
         #---------------------------------------------------- validate_complete_primary_values_callback ----------------------------------------------------
 
+        @pure_validator
         def validate_complete_primary_values_callback(x: Mapping[Literal["selected_option", "available_options"], Any]) -> tuple[bool, str]:
             # Handle partial updates by getting current values for missing keys
             selected_option: T = x.get("selected_option", selected_option_initial_value) # type: ignore
@@ -130,6 +133,7 @@ class SingleSetSelectController(BaseCompositeController[Literal["selected_option
             validate_complete_primary_values_callback=validate_complete_primary_values_callback,
             custom_validator=custom_validator,
             debounce_ms=debounce_ms,
+            headless=headless,
             nexus_manager=nexus_manager,
             logger=logger
         )
@@ -26,6 +26,7 @@ from ...controlled_widgets.controlled_editable_combobox import ControlledEditabl
 from ...controlled_widgets.controlled_line_edit import ControlledLineEdit
 from ...controlled_widgets.controlled_combobox import ControlledComboBox
 from ...auxiliaries.default import default
+from ...auxiliaries.validation_cache import pure_validator
 from ..core.base_composite_controller import BaseCompositeController
 
 class UnitSelectController(BaseCompositeController[Literal["selected_unit", "available_units", "allowed_dimensions"], Any, Unit|dict[Dimension, AbstractSet[Unit]]|Optional[AbstractSet[Dimension]], Any]):
@@ -39,6 +40,7 @@ class UnitSelectController(BaseCompositeController[Literal["selected_unit", "ava
         formatter: Callable[[Unit], str] = lambda u: u.format_string(as_fraction=True),
         custom_validator: Optional[Callable[[Mapping[Literal["selected_unit", "available_units", "allowed_dimensions"], Any]], tuple[bool, str]]] = None,
         debounce_ms: int|Callable[[], int] = default.DEFAULT_DEBOUNCE_MS,
+        headless: bool = False,
         nexus_manager: NexusManager = nexpy_default.NEXUS_MANAGER,
         logger: Optional[Logger] = None,
     ) -> None:
@@ -117,6 +119,7 @@ class UnitSelectController(BaseCompositeController[Literal["selected_unit", "ava
 
         #---------------------------------------------------- verification_method ----------------------------------------------------
 
+        @pure_validator
         def verification_method(x: Mapping[Literal["selected_unit", "available_units", "allowed_dimensions"], Any]) -> tuple[bool, str]:
             # Handle partial updates by getting current values for missing keys
             selected_unit: Unit = x["selected_unit"] # type: ignore
@@ -193,6 +196,7 @@ class UnitSelectController(BaseCompositeController[Literal["selected_unit", "ava
             validate_complete_primary_values_callback= verification_method, # type: ignore
             custom_validator=custom_validator,
             debounce_ms=debounce_ms,
+            headless=headless,
             nexus_manager=nexus_manager,
             logger=logger
         )
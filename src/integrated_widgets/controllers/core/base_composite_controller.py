@@ -7,13 +7,15 @@ from abc import abstractmethod
 from logging import Logger
 
 # BAB imports
-from nexpy import XCompositeBase, UpdateFunctionValues
+from nexpy import XBase, XCompositeBase, UpdateFunctionValues, XSingleValueProtocol
 from nexpy.core import NexusManager
 from nexpy import default as nexpy_default
 
 # Local imports
 from ...auxiliaries.resources import log_msg
 from ...auxiliaries.default import default
+from ...auxiliaries import tracing
+from ...auxiliaries.validation_cache import CachedValidator, is_pure_validator
 from .base_controller import BaseController
 
 PHK = TypeVar("PHK", bound=str)
@@ -75,11 +77,31 @@ class BaseCompositeController(BaseController[PHK|SHK, PHV|SHV], XCompositeBase[P
         compute_missing_primary_values_callback: Optional[Callable[[Self, UpdateFunctionValues[PHK, PHV]], Mapping[PHK, PHV]]] = None,
         custom_validator: Optional[Callable[[Mapping[PHK, PHV]], tuple[bool, str]]] = None,
         debounce_ms: int|Callable[[], int] = default.DEFAULT_DEBOUNCE_MS,
+        headless: bool = False,
+        validation_cache_size: Optional[int] = None,
         logger: Optional[Logger] = None,
         nexus_manager: NexusManager = nexpy_default.NEXUS_MANAGER,
 
     ) -> None:
 
+        # ------------------------------------------------------------------------------------------------
+        # Memoize validators marked with pure_validator (see default.VALIDATION_CACHE_SIZE)
+        # ------------------------------------------------------------------------------------------------
+
+        cache_size: int = default.VALIDATION_CACHE_SIZE if validation_cache_size is None else validation_cache_size
+        self._validation_caches: dict[str, CachedValidator] = {}
+        if cache_size > 0:
+            if is_pure_validator(validate_complete_primary_values_callback):
+                validate_complete_primary_values_callback = self._validation_caches.setdefault(
+                    "validate_complete_primary_values_callback",
+                    CachedValidator(validate_complete_primary_values_callback, cache_size), # type: ignore
+                )
+            if is_pure_validator(custom_validator):
+                custom_validator = self._validation_caches.setdefault(
+                    "custom_validator",
+                    CachedValidator(custom_validator, cache_size), # type: ignore
+                )
+
         # ------------------------------------------------------------------------------------------------
         # Prepare the initialization of BaseController and CarriesHooksBase
         # ------------------------------------------------------------------------------------------------
@@ -89,7 +111,7 @@ class BaseCompositeController(BaseController[PHK|SHK, PHV|SHV], XCompositeBase[P
             if self is not None: # type: ignore
                 import traceback
                 caller_info = ''.join(traceback.format_stack()[-3:-1])
-                self._widget_invalidation_signal.trigger.emit(f"Hook system callback: {caller_info}")
+                self._request_invalidation(f"Hook system callback: {caller_info}")
 
         # ------------------------------------------------------------------------------------------------
         # Initialize BaseController and CarriesHooksBase
@@ -99,6 +121,7 @@ class BaseCompositeController(BaseController[PHK|SHK, PHV|SHV], XCompositeBase[P
             self,
             nexus_manager=nexus_manager,
             debounce_ms=debounce_ms,
+            headless=headless,
             logger=logger
         )
 
@@ -118,10 +141,11 @@ class BaseCompositeController(BaseController[PHK|SHK, PHV|SHV], XCompositeBase[P
         # Initialize widgets
         # ------------------------------------------------------------------------------------------------
 
-        with self._internal_update():
-            self._signals_blocked = True
-            self._initialize_widgets_impl()
-            self._signals_blocked = False
+        if not headless:
+            with self._internal_update():
+                self._signals_blocked = True
+                self._initialize_widgets_impl()
+                self._signals_blocked = False
 
         # ------------------------------------------------------------------------------------------------
         # Initialize is done
@@ -146,7 +170,8 @@ class BaseCompositeController(BaseController[PHK|SHK, PHV|SHV], XCompositeBase[P
         Returns:
             A mapping of the values from the controlled widgets, or None if the values are invalid and the controller should revert to the last valid value.
         """
-        primary_values = self._read_widget_primary_values_impl()
+        with tracing.span("read_widgets", self):
+            primary_values = self._read_widget_primary_values_impl()
         if not primary_values:
             return None
         else:
@@ -166,20 +191,29 @@ class BaseCompositeController(BaseController[PHK|SHK, PHV|SHV], XCompositeBase[P
     # Lifecycle Management
     ###########################################################################
 
+    def _hooks_for_disposal(self) -> list[Hook[Any]]:
+        return list[Hook[Any]](self._primary_hooks.values()) + list[Hook[Any]](self._secondary_hooks.values())
+
     @final
     def dispose_impl(self) -> None:
         """Dispose of the controller and clean up resources."""
+
+        # The hooks have already been isolated by BaseController.dispose_many()
+        if self._hooks_isolated:
+            return
         
         # Check if we're in a safe state for cleanup
         # During garbage collection, some objects may be in an unstable state
-        try:
-            from PySide6.QtWidgets import QApplication
-            if QApplication.instance() is None:
-                # Qt application has been destroyed, skip cleanup that might use Qt
+        # Headless controllers own no Qt objects and can always isolate their hooks
+        if not self._headless:
+            try:
+                from PySide6.QtWidgets import QApplication
+                if QApplication.instance() is None:
+                    # Qt application has been destroyed, skip cleanup that might use Qt
+                    return
+            except (ImportError, RuntimeError):
+                # Qt is shutting down or unavailable
                 return
-        except (ImportError, RuntimeError):
-            # Qt is shutting down or unavailable
-            return
         
         # Disconnect all hooks first to prevent further updates
         try:
@@ -206,4 +240,52 @@ class BaseCompositeController(BaseController[PHK|SHK, PHV|SHV], XCompositeBase[P
     ###########################################################################
 
     def submit_primary_values(self, values: Mapping[PHK, PHV], *, debounce_ms: Optional[int] = None, raise_submission_error_flag: bool = True) -> None:
-        return BaseController.submit_values(self, values, debounce_ms=debounce_ms, raise_submission_error_flag=raise_submission_error_flag) # type: ignore
\ No newline at end of file
+        return BaseController.submit_values(self, values, debounce_ms=debounce_ms, raise_submission_error_flag=raise_submission_error_flag) # type: ignore
+
+    def validation_cache_info(self) -> dict[str, dict[str, int]]:
+        """Get the hit/miss statistics of the memoized validators, keyed by validator parameter name."""
+        return {name: cache.info() for name, cache in self._validation_caches.items()}
+
+    def clear_validation_cache(self) -> None:
+        """Drop the cached validation results (e.g. after changing what a validator closes over)."""
+        for cache in self._validation_caches.values():
+            cache.clear()
+
+    def rebind(self, hooks: Mapping[PHK|SHK, Any]) -> None:
+        """
+        Bind some or all hooks of the controller to different hooks or observables, reusing its widgets.
+
+        The given hooks are detached from their current external hooks, the new primary values are
+        applied in one validated submission (so e.g. a value and its unit options may change together),
+        and the hooks join their new external hooks. Hooks that are not given keep their binding.
+        Pending (debounced) user edits are dropped, and the widgets are invalidated exactly once.
+
+        Args:
+            hooks: Per hook key a Hook, a XSingleValueProtocol, or a plain value (detaches the hook and
+                sets the value; primary hooks only).
+
+        Raises:
+            RuntimeError: If the controller has been disposed.
+            ValueError: If a key is unknown, a plain value is given for a secondary hook, or an
+                X object other than a XSingleValueProtocol is given (pass its hook instead).
+            SubmissionError: If the new values are rejected (the given hooks are left detached with their previous values).
+        """
+        external_hooks: dict[PHK|SHK, Optional[Hook[Any]]] = {}
+        values: dict[PHK|SHK, Any] = {}
+        for key, hook_or_value in hooks.items():
+            if isinstance(hook_or_value, XSingleValueProtocol):
+                external_hook: Optional[Hook[Any]] = hook_or_value.value_hook # type: ignore
+            elif isinstance(hook_or_value, Hook):
+                external_hook = hook_or_value # type: ignore
+            elif isinstance(hook_or_value, XBase):
+                raise ValueError(f"Pass a hook of the {hook_or_value.__class__.__name__} for '{key}'") # type: ignore
+            else:
+                external_hook = None
+            if key in self._primary_hooks:
+                values[key] = external_hook.value if external_hook is not None else hook_or_value
+            elif key not in self._secondary_hooks:
+                raise ValueError(f"Unknown hook key: {key}")
+            elif external_hook is None:
+                raise ValueError(f"Secondary hook '{key}' is computed and can only be joined to a hook")
+            external_hooks[key] = external_hook
+        self._rebind_hooks(external_hooks, values)
\ No newline at end of file
@@ -2,13 +2,18 @@ from __future__ import annotations
 
 # Standard library imports
 from abc import abstractmethod
+from concurrent.futures import Future
 from contextlib import contextmanager
-from typing import Optional, final, Callable, Mapping, Any, TypeVar, Generic
+from typing import Optional, final, Callable, Iterable, Mapping, Any, TypeVar, Generic, TYPE_CHECKING
 from logging import Logger
+import asyncio
+import math
+import time
 import warnings
 import traceback
 
 from PySide6.QtCore import QObject, Qt, Signal, QThread
+from PySide6.QtWidgets import QApplication, QWidget
 from PySide6.QtCore import QTimer
 
 #BAB imports
@@ -18,6 +23,16 @@ from nexpy.foundations.carries_some_hooks_protocol import CarriesSomeHooksProtoc
 # Local imports
 from ...auxiliaries.resources import log_msg
 from ...auxiliaries.default import default
+from ...auxiliaries import live_registry, tracing
+from ...auxiliaries.invalidation_scheduler import get_invalidation_scheduler, discard_scheduled_invalidation, PRIORITY_FOCUSED, PRIORITY_VISIBLE, PRIORITY_HIDDEN
+from ...auxiliaries.debounce import AdaptiveDebounce, DebouncePolicy, TRAILING_ONLY
+from ...auxiliaries.equality import ValueEquality, values_equal
+
+if TYPE_CHECKING:
+    from ...auxiliaries.commit_journal import CommitJournal
+
+# Bound on the cached commit plans per controller (key sets are few; this only guards misuse)
+_MAX_COMMIT_PLANS: int = 64
 
 class _WidgetInvalidationSignal(QObject):
     """Internal QObject used to marshal widget invalidation requests to the Qt event loop.
@@ -46,6 +61,17 @@ class _GuiExecutor(QObject):
             # Swallow exceptions to avoid breaking the Qt event loop; rely on caller's logging
             pass
 
+
+def _resolve_commit_futures(futures: list[Future[None]], error: Optional[BaseException]) -> None:
+    """Resolve the futures waiting for a commit (skipping those cancelled by their waiters)."""
+    for future in futures:
+        if future.done():
+            continue
+        if error is None:
+            future.set_result(None)
+        else:
+            future.set_exception(error)
+
 HK = TypeVar("HK", bound=str)
 HV = TypeVar("HV")
 C = TypeVar("C", bound="BaseController[Any, Any]")
@@ -82,6 +108,23 @@ class BaseController(CarriesSomeHooksProtocol[HK, HV], Generic[HK, HV]):
     HV : Any
         Type of hook values
 
+    Headless Mode:
+    -------------
+    With ``headless=True`` the controller runs the full hook, validation and
+    commit pipeline without any Qt objects: no widgets are created, no helper
+    QObjects or QTimer exist, and submissions are committed synchronously
+    (debouncing is ignored). Invalidation requests are dropped. This allows
+    reusing controller logic (validators, computed values) in worker processes
+    without a QApplication or an event loop.
+
+    Visibility-Aware Invalidation:
+    -----------------------------
+    With ``default.DEFER_HIDDEN_INVALIDATION = True``, invalidations of a
+    controller whose controlled widgets are all hidden (hidden tab, collapsed
+    group box, minimized window) only set a pending flag. The pending update is
+    applied once when a controlled widget is shown again, or before `evaluate()`
+    reads the widgets.
+
     Subclassing:
     -----------
     Subclasses must implement:
@@ -98,11 +141,13 @@ class BaseController(CarriesSomeHooksProtocol[HK, HV], Generic[HK, HV]):
         *,
         nexus_manager: NexusManager,
         debounce_ms: int|Callable[[], int] = default.DEFAULT_DEBOUNCE_MS,
+        headless: bool = False,
         logger: Optional[Logger] = None,
         ) -> None:
 
         # Store callback reference for internal use and debounce ms
         self._nexus_manager = nexus_manager
+        self._headless: bool = headless
 
         # Initialize internal state first (before creating Qt objects)
         self._signals_blocked: bool = False
@@ -110,9 +155,52 @@ class BaseController(CarriesSomeHooksProtocol[HK, HV], Generic[HK, HV]):
         self._relayouting: bool = False
         self._internal_widget_update: bool = False
         self._is_disposed: bool = False
+        # Set by dispose_many() once the hooks have been isolated in bulk
+        self._hooks_isolated: bool = False
         self._debounce_ms: int|Callable[[], int] = debounce_ms
         self._content_changed_notifier: Optional[Callable[[], None]] = None
+        self._commit_journal: Optional["CommitJournal"] = None
         self._logger: Optional[Logger] = logger
+        live_registry.register(self)
+
+        # this set of objects is to keep other objects from being garbage collected while the controller is alive
+        self._keep_alive_objects = set[Any]()
+
+        # Staging state for widget-originated changes (see _submit_values_debounced)
+        self._pending_submission_values: Optional[Mapping[HK, HV]] = None
+        self._pending_submission_raise_error_flag: bool = False
+        self._raise_submission_error_flag: bool = True # The first submission should raise an error if it fails
+        self._committing: bool = False
+        # Set when values are staged for a commit while another commit is running (e.g. by a listener)
+        self._commit_requested_while_committing: bool = False
+        self._last_commit_ms: Optional[float] = None
+        # Resolved (key, hook) pairs per submitted key sequence (see _commit_plan)
+        self._commit_plans: dict[tuple[HK, ...], tuple[tuple[HK, Any], ...]] = {}
+        # No-op commit elision (see default.ELIDE_UNCHANGED_COMMITS)
+        self._value_equality: Optional[ValueEquality] = None
+        self._commit_count: int = 0
+        self._elided_commit_count: int = 0
+        # Start of the current burst of staged submissions (see DebouncePolicy)
+        self._debounce_burst_start: Optional[float] = None
+        # Whether the submit timer was armed for the max-wait deadline of the burst (it may fire slightly early)
+        self._submit_timer_at_max_wait: bool = False
+        # Futures of submit_values_future()/submit_values_async() waiting for the next commit
+        self._commit_futures: list[Future[None]] = []
+
+        # Visibility tracking for deferred invalidation (see default.DEFER_HIDDEN_INVALIDATION)
+        self._controlled_widgets: list[QWidget] = []
+        self._unwatched_widgets: list[QWidget] = []
+        self._invalidation_pending: bool = False
+        # Set inside _single_invalidation(): requests are collapsed into one at the end of the block
+        self._invalidation_held: bool = False
+        # Nesting depth of freeze(); invalidations while frozen are applied once by the last thaw()
+        self._freeze_count: int = 0
+        self._frozen_dirty: bool = False
+
+        if headless:
+            # No Qt objects at all: commits are synchronous and invalidations are dropped
+            log_msg(self, f"{self.__class__.__name__} initialized", self._logger, "BaseController initialized (headless)")
+            return
 
         # Create a QObject to handle Qt parent-child relationships
         self._qt_object = QObject()
@@ -132,24 +220,18 @@ class BaseController(CarriesSomeHooksProtocol[HK, HV], Generic[HK, HV]):
 
         # Connect the widget invalidation signal to the _invalidate_widgets method
         # Use lambda and call it on the base controller to avoid Qt signal handler issues
-        self._widget_invalidation_signal.trigger.connect(lambda caller_info: BaseController._invalidate_widgets(self, caller_info=caller_info), Qt.ConnectionType.QueuedConnection) # type: ignore
+        self._widget_invalidation_signal.trigger.connect(lambda caller_info: BaseController._on_invalidation_signal(self, caller_info), Qt.ConnectionType.QueuedConnection) # type: ignore
       
         # Queue initial widget invalidation (will execute after full initialization completes)
         # This ensures widgets reflect initial values once construction finishes
         self._widget_invalidation_signal.trigger.emit("Initial invalidation")
 
-        # this set of objects is to keep other objects from being garbage collected while the controller is alive
-        self._keep_alive_objects = set[Any]()
-
         ###########################################################################
-        # Staging & commit control for widget-originated changes
+        # Debounce timer for widget-originated changes
         ###########################################################################
-        self._pending_submission_values: Optional[Mapping[HK, HV]] = None
-        self._raise_submission_error_flag: bool = True # The first submission should raise an error if it fails
-        self._committing: bool = False
         self._submit_timer: QTimer = QTimer() # type: ignore
         self._submit_timer.setSingleShot(True)
-        self._submit_timer.timeout.connect(self._commit_staged_widget_value)
+        self._submit_timer.timeout.connect(self._on_submit_timer)
         ###########################################################################
         
         log_msg(self, f"{self.__class__.__name__} initialized", self._logger, "BaseController initialized, initial invalidation queued")
@@ -164,6 +246,12 @@ class BaseController(CarriesSomeHooksProtocol[HK, HV], Generic[HK, HV]):
     def logger(self, logger: Optional[Logger]) -> None:
         self._logger = logger
     
+    @property
+    @final
+    def is_headless(self) -> bool:
+        """Whether the controller runs without widgets and Qt helper objects."""
+        return self._headless
+
     @property
     @final
     def qt_object(self) -> QObject:
@@ -181,7 +269,12 @@ class BaseController(CarriesSomeHooksProtocol[HK, HV], Generic[HK, HV]):
         
         Returns:
             The internal QObject that manages Qt resources for this controller.
+
+        Raises:
+            RuntimeError: If the controller is headless.
         """
+        if self._headless:
+            raise RuntimeError("Headless controllers have no Qt object")
         return self._qt_object
 
     ###########################################################################
@@ -260,6 +353,50 @@ class BaseController(CarriesSomeHooksProtocol[HK, HV], Generic[HK, HV]):
         self._submit_values_debounced(values, debounce_ms=debounce_ms, raise_submission_error_flag=raise_submission_error_flag)
         return True, "Values submitted"
 
+    def submit_values_future(self, values: Mapping[HK, HV], *, debounce_ms: Optional[int] = None) -> Future[None]:
+        """
+        Submit values to the controller and get a future for the (debounced) commit.
+
+        The future resolves once the values are committed, or fails with a SubmissionError if the
+        commit fails. If newer values are submitted within the debounce window, the future resolves
+        with the commit of the newer values. If the submission is dropped (e.g. the controller is
+        disposed first, or submissions are blocked during a batch evaluation), the future is
+        cancelled. Can be called from any thread.
+
+        Args:
+            values: The values to submit.
+            debounce_ms: The debounce time in milliseconds. If None, the default debounce time is used.
+        """
+        future: Future[None] = Future()
+
+        def stage() -> None:
+            if self._is_disposed or self._is_blocked_for_batch_submission:
+                future.cancel()
+                return
+            self._commit_futures.append(future)
+            self._submit_values_debounced(values, debounce_ms=debounce_ms, raise_submission_error_flag=False)
+
+        # Register the future on the GUI thread, so that it waits for the commit of these values
+        if self._headless or QThread.currentThread().isMainThread(): # type: ignore
+            stage()
+        else:
+            self.gui_invoke(stage)
+        return future
+
+    async def submit_values_async(self, values: Mapping[HK, HV], *, debounce_ms: Optional[int] = None) -> None:
+        """
+        Submit values to the controller and wait for the (debounced) commit.
+
+        The awaiting event loop must not block the Qt event loop, which runs the debounce timer:
+        use an event loop running in another thread, or run the coroutine on the Qt event loop
+        with `integrated_widgets.run_async`.
+
+        Raises:
+            SubmissionError: If the commit fails.
+            asyncio.CancelledError: If the submission is dropped before it is committed.
+        """
+        await asyncio.wrap_future(self.submit_values_future(values, debounce_ms=debounce_ms))
+
     def submit_value(self, key: HK, value: HV, *, debounce_ms: Optional[int] = None, raise_submission_error_flag: bool = False, logger: Optional[Logger] = None) -> tuple[bool, str]:
         """
         Submits a value to the controller.
@@ -289,6 +426,14 @@ class BaseController(CarriesSomeHooksProtocol[HK, HV], Generic[HK, HV]):
             warnings.warn("Controller has been disposed, skipping evaluation", RuntimeWarning)
             return
 
+        if self._headless:
+            # There are no widgets to read from
+            return
+
+        if self._invalidation_pending and QThread.currentThread().isMainThread(): # type: ignore
+            # Never read (and submit) stale widget values of a deferred invalidation
+            self._apply_invalidation("Deferred invalidation (evaluate)")
+
         if not QThread.currentThread().isMainThread(): # type: ignore
             # If somehow called from a non-GUI thread, use gui_invoke for safety
             self.gui_invoke(lambda: self.evaluate(debounce_ms=debounce_ms, raise_submission_error_flag=raise_submission_error_flag))
@@ -318,6 +463,10 @@ class BaseController(CarriesSomeHooksProtocol[HK, HV], Generic[HK, HV]):
         2. The timer is started (the timer is reset when the value is changed)
         3. The value is committed when the timer expires
 
+        The debounce policy (``debounce_ms`` if it is a DebouncePolicy, else ``default.DEBOUNCE_POLICY``)
+        can additionally commit the first change of a burst immediately (leading edge), drop the trailing
+        commit, and shorten the timer so that a commit happens at least every ``max_wait_ms``.
+
         NOTE: This method must be called from the GUI thread (Qt signal handlers).
 
         Args:
@@ -333,35 +482,77 @@ class BaseController(CarriesSomeHooksProtocol[HK, HV], Generic[HK, HV]):
         if self._is_blocked_for_batch_submission:
             return None
 
+        if self._headless:
+            # No timer and no GUI thread: commit synchronously on the calling thread
+            self._pending_submission_values = dict(values)
+            self._pending_submission_raise_error_flag = raise_submission_error_flag
+            self._commit_staged_widget_value()
+            return
+
         # Ensure we're on the GUI thread (Qt signal handlers are guaranteed to be on GUI thread)
         if not QThread.currentThread().isMainThread(): # type: ignore
             # If somehow called from a non-GUI thread, use gui_invoke for safety
             self.gui_invoke(lambda: self._submit_values_debounced(values, debounce_ms, raise_submission_error_flag))
             return
+
+        if self._pending_submission_values is None and self._is_unchanged(values):
+            # E.g. focus left an unedited field: no timer, no commit, no invalidation
+            self._elide_commit(values)
+            return
         
-        self._pending_submission_values = values
+        self._pending_submission_values = dict(values)
         self._pending_submission_raise_error_flag = raise_submission_error_flag
-        if debounce_ms is not None:
-            deb_ms: int = debounce_ms
-        else:
-            if callable(self._debounce_ms):
-                deb_ms = self._debounce_ms()
-            else:
-                deb_ms = self._debounce_ms
-                
+        deb_ms: int = debounce_ms if debounce_ms is not None else self._resolve_debounce_ms()
         interval = 0 if deb_ms <= 0 else deb_ms
+        tracing.instant("debounce", self, values, {"delay_ms": interval})
 
         if interval == 0:
             # Immediate commit - call directly since we're on GUI thread
+            self._debounce_burst_start = None
+            self._submit_timer.stop()
             self._commit_staged_widget_value()
+            return
+
+        policy = self._debounce_policy()
+        now = time.monotonic()
+        if self._debounce_burst_start is None:
+            # First change of a burst
+            self._debounce_burst_start = now
+            if policy.leading:
+                self._commit_staged_widget_value()
+            self._submit_timer_at_max_wait = policy.max_wait_ms is not None and policy.max_wait_ms <= interval
+        elif policy.max_wait_ms is not None:
+            # Fire no later than the max-wait deadline of the burst
+            remaining_ms = policy.max_wait_ms - (now - self._debounce_burst_start) * 1000.0
+            self._submit_timer_at_max_wait = remaining_ms <= interval
+            interval = max(0, min(interval, math.ceil(remaining_ms)))
         else:
-            # Set up timer directly since we're already on the GUI thread
-            self._submit_timer.setInterval(interval)
-            self._submit_timer.start()
+            self._submit_timer_at_max_wait = False
+
+        # Set up timer directly since we're already on the GUI thread
+        self._submit_timer.setInterval(interval)
+        self._submit_timer.start()
+
+    def _on_submit_timer(self) -> None:
+        """Timer slot: end the burst and commit the staged values according to the debounce policy."""
+        self._debounce_burst_start = None
+        # Trust the deadline the timer was armed for: a coarse timer may fire a little early
+        max_wait_reached, self._submit_timer_at_max_wait = self._submit_timer_at_max_wait, False
+        if self._pending_submission_values is None:
+            # Nothing staged since a leading-edge commit
+            return
+
+        policy = self._debounce_policy()
+        if policy.trailing or max_wait_reached:
+            self._commit_staged_widget_value()
+        else:
+            # Leading-edge only: changes after the first one of a burst are dropped
+            self._discard_pending_submission()
+            self.invalidate_widgets()
 
     def _commit_staged_widget_value(self) -> None:
         """
-        Timer slot: commit the last staged value if present.
+        Commit the last staged value if present (called by the submit timer slot).
 
         Args:
             raise_submission_error_flag: If True, raise a SubmissionError if the submission fails.
@@ -377,40 +568,192 @@ class BaseController(CarriesSomeHooksProtocol[HK, HV], Generic[HK, HV]):
             raise RuntimeError("Controller has been disposed")
 
         if self._is_blocked_for_batch_submission:
+            # The batch evaluation supersedes the staged values
+            self._discard_pending_submission()
             return None
 
         if self._committing:
+            # Committed once the running commit has finished
+            self._commit_requested_while_committing = True
             return None
         self._committing = True
 
-        try:
-            if self._is_disposed:
-                raise RuntimeError("Controller has been disposed")
-            values_to_submit = dict[HK, HV](self._pending_submission_values)
-            self._pending_submission_values = None
-
-            nexus_and_values: dict[Nexus[Any], Any] = {}
-            for key, value in values_to_submit.items():
-                nexus_and_values[self._get_hook_by_key(key)._get_nexus()] = value # type: ignore
-            success, msg = self._nexus_manager.submit_values(
-                nexus_and_values,
-                logger=self._logger
-            )
+        with tracing.span("commit", self, self._pending_submission_values):
+            try:
+                if self._is_disposed:
+                    raise RuntimeError("Controller has been disposed")
+                values_to_submit: Mapping[HK, HV] = self._pending_submission_values
+                self._pending_submission_values = None
+                plan = self._commit_plan(values_to_submit)
+
+                if self._is_unchanged(values_to_submit, plan):
+                    # The staged values were edited back to the current values
+                    self._elide_commit(values_to_submit)
+                    return None
+
+                commit_futures, self._commit_futures = self._commit_futures, []
+                self._commit_count += 1
+
+                nexus_and_values: dict[Nexus[Any], Any] = {hook._get_nexus(): values_to_submit[key] for key, hook in plan}
+                journal = self._commit_journal
+                previous_values: dict[Any, Any] = {}
+                submitted_values: dict[Any, Any] = {}
+                if journal is not None:
+                    for key, hook in plan:
+                        previous_values[hook] = hook.value
+                        submitted_values[hook] = values_to_submit[key]
+                try:
+                    commit_start = time.perf_counter()
+                    with tracing.span("nexus_submit", self, values_to_submit):
+                        success, msg = self._nexus_manager.submit_values(
+                            nexus_and_values,
+                            logger=self._logger
+                        )
+                    self._record_commit_duration((time.perf_counter() - commit_start) * 1000.0)
+                except Exception as e:
+                    _resolve_commit_futures(commit_futures, e)
+                    raise
 
-            if success:
-                log_msg(self, "_commit_staged_widget_value", self._logger, f"Successfully committed staged value: {values_to_submit}")
-                # Notify widget that content has changed (after successful commit)
-                self._notify_content_changed()
-            else:
-                log_msg(self, "_commit_staged_widget_value", self._logger, f"Failed to commit staged value '{values_to_submit}': {msg}")
-                # Reset the state of the widget (reflect model's last committed value)
-                self.invalidate_widgets()
+                if success:
+                    log_msg(self, "_commit_staged_widget_value", self._logger, f"Successfully committed staged value: {values_to_submit}")
+                    if journal is not None:
+                        journal.record(self._nexus_manager, previous_values, submitted_values)
+                    # Notify widget that content has changed (after successful commit)
+                    self._notify_content_changed()
+                else:
+                    log_msg(self, "_commit_staged_widget_value", self._logger, f"Failed to commit staged value '{values_to_submit}': {msg}")
+                    # Reset the state of the widget (reflect model's last committed value)
+                    self.invalidate_widgets()
 
-            if not success and self._pending_submission_raise_error_flag:
-                raise SubmissionError(msg, values_to_submit)
+                _resolve_commit_futures(commit_futures, None if success else SubmissionError(msg, values_to_submit))
 
-        finally:
-            self._committing = False
+                if not success and self._pending_submission_raise_error_flag:
+                    raise SubmissionError(msg, values_to_submit)
+
+            finally:
+                self._committing = False
+                if self._commit_requested_while_committing:
+                    self._commit_requested_while_committing = False
+                    # Queued on the GUI thread (immediate for headless controllers)
+                    self.gui_invoke(self._commit_staged_widget_value)
+
+    def set_value_equality(self, equality: Optional[ValueEquality]) -> None:
+        """
+        Set how submitted values are compared with the current values to elide no-op commits.
+
+        Args:
+            equality: Called as ``equality(current, new)`` per submitted hook value, or None for
+                the type-aware `values_equal` (float tolerance, RealUnitedScalar and set equality).
+        """
+        self._value_equality = equality
+
+    def _commit_plan(self, values: Mapping[HK, HV]) -> tuple[tuple[HK, Any], ...]:
+        """
+        Get the resolved ``(key, hook)`` pairs for the keys of *values*.
+
+        This is a cache of hook lookups per key sequence. The hook objects of a controller
+        never change (joining, isolating and rebinding only change their nexus), so a plan
+        stays valid until the controller is disposed. The nexus of a hook is not cached: it
+        changes whenever its group is joined, also from outside the controller, so it is
+        read at submission time.
+
+        Raises:
+            Exception: Whatever `_get_hook_by_key` raises for an unknown key.
+        """
+        keys = tuple(values)
+        plan = self._commit_plans.get(keys)
+        if plan is not None:
+            return plan
+        plan = tuple((key, self._get_hook_by_key(key)) for key in keys) # type: ignore
+        if len(self._commit_plans) >= _MAX_COMMIT_PLANS:
+            self._commit_plans.clear()
+        self._commit_plans[keys] = plan
+        return plan
+
+    def _is_unchanged(self, values: Mapping[HK, HV], plan: Optional[tuple[tuple[HK, Any], ...]] = None) -> bool:
+        """Whether all values equal the current hook values, so that committing them is a no-op."""
+        if not values or not default.ELIDE_UNCHANGED_COMMITS:
+            return False
+        equality = self._value_equality if self._value_equality is not None else values_equal
+        try:
+            if plan is None:
+                plan = self._commit_plan(values)
+            return all(equality(hook.value, values[key]) for key, hook in plan)
+        except Exception:
+            # E.g. an unknown key: let the commit report it
+            return False
+
+    def _elide_commit(self, values: Mapping[HK, HV]) -> None:
+        """Skip the commit of unchanged values; waiting commit futures resolve as committed."""
+        self._elided_commit_count += 1
+        tracing.instant("commit_elided", self, values)
+        log_msg(self, "_elide_commit", self._logger, f"Skipped commit of unchanged values: {values}")
+        commit_futures, self._commit_futures = self._commit_futures, []
+        _resolve_commit_futures(commit_futures, None)
+        try:
+            exact = all(self._get_hook_by_key(key).value == value for key, value in values.items()) # type: ignore
+        except Exception:
+            exact = False
+        if not exact:
+            # Equal only within tolerance: show the current values instead of the typed ones
+            self.invalidate_widgets()
+
+    def _resolve_debounce_ms(self) -> int:
+        """Get the debounce delay configured for this controller (calling it if it is a callable)."""
+        if callable(self._debounce_ms):
+            return self._debounce_ms()
+        return self._debounce_ms
+
+    def _debounce_policy(self) -> DebouncePolicy:
+        """Get the debounce policy of this controller: its own, the global one, or trailing-edge only."""
+        if isinstance(self._debounce_ms, DebouncePolicy):
+            return self._debounce_ms
+        policy = default.DEBOUNCE_POLICY
+        return policy if policy is not None else TRAILING_ONLY
+
+    def _adaptive_debounce(self) -> Optional[AdaptiveDebounce]:
+        """Get the AdaptiveDebounce of this controller (also when wrapped in a DebouncePolicy), if any."""
+        delay = self._debounce_ms.delay_ms if isinstance(self._debounce_ms, DebouncePolicy) else self._debounce_ms
+        return delay if isinstance(delay, AdaptiveDebounce) else None
+
+    def _record_commit_duration(self, duration_ms: float) -> None:
+        """Store the duration of a nexus submission (including propagation) and feed an adaptive debounce."""
+        self._last_commit_ms = duration_ms
+        adaptive_debounce = self._adaptive_debounce()
+        if adaptive_debounce is not None:
+            adaptive_debounce.record_commit(duration_ms)
+
+    def debounce_diagnostics(self) -> dict[str, Any]:
+        """
+        Get the debounce delay currently chosen for this controller and the measured commit cost.
+
+        Returns:
+            A dict with "debounce_ms", "last_commit_ms" (None before the first commit), and the
+            numbers of "commits" and of "elided_commits" (skipped because the values were unchanged).
+            For an `AdaptiveDebounce`, also its moving average, sample count and bounds.
+        """
+        adaptive_debounce = self._adaptive_debounce()
+        if adaptive_debounce is not None:
+            diagnostics = adaptive_debounce.diagnostics()
+        else:
+            diagnostics = {"debounce_ms": self._resolve_debounce_ms()}
+        diagnostics["last_commit_ms"] = self._last_commit_ms
+        diagnostics["commits"] = self._commit_count
+        diagnostics["elided_commits"] = self._elided_commit_count
+        policy = self._debounce_policy()
+        if policy is not TRAILING_ONLY:
+            diagnostics["leading"] = policy.leading
+            diagnostics["trailing"] = policy.trailing
+            diagnostics["max_wait_ms"] = policy.max_wait_ms
+        return diagnostics
+
+    def _discard_pending_submission(self) -> None:
+        """Drop the staged (not yet committed) values; waiting commit futures are cancelled."""
+        self._pending_submission_values = None
+        self._debounce_burst_start = None
+        commit_futures, self._commit_futures = self._commit_futures, []
+        for future in commit_futures:
+            future.cancel()
 
     ###########################################################################
     # Content Change Notification
@@ -445,6 +788,18 @@ class BaseController(CarriesSomeHooksProtocol[HK, HV], Generic[HK, HV]):
             )
         self._content_changed_notifier = notifier
 
+    def set_commit_journal(self, journal: Optional["CommitJournal"]) -> None:
+        """Set the journal that records the commits of this controller for undo/redo, or None to stop recording.
+
+        See `CommitJournal.attach` to attach a journal to many controllers at once.
+        """
+        self._commit_journal = journal
+
+    @property
+    def commit_journal(self) -> Optional["CommitJournal"]:
+        """Get the journal recording the commits of this controller, if any."""
+        return self._commit_journal
+
     def _notify_content_changed(self) -> None:
         """Internal method to notify the registered callback that content has changed.
         
@@ -493,6 +848,11 @@ class BaseController(CarriesSomeHooksProtocol[HK, HV], Generic[HK, HV]):
         self._relayouting = False
         self.invalidate_widgets()
 
+    @property
+    def has_pending_invalidation(self) -> bool:
+        """Whether a widget invalidation was deferred because all controlled widgets are hidden."""
+        return self._invalidation_pending
+
     def invalidate_widgets(self) -> None:
         """Invalidate the widgets to reflect current hook values.
         
@@ -512,7 +872,7 @@ class BaseController(CarriesSomeHooksProtocol[HK, HV], Generic[HK, HV]):
             return
         # Capture caller information for debugging
         caller_info = ''.join(traceback.format_stack()[-2:-1])
-        self._widget_invalidation_signal.trigger.emit(caller_info)
+        self._request_invalidation(caller_info)
 
     #---------------------------------------------------------------------------
     # Internal Methods
@@ -528,6 +888,141 @@ class BaseController(CarriesSomeHooksProtocol[HK, HV], Generic[HK, HV]):
         finally:
             self._internal_widget_update = False
 
+    @final
+    def _request_invalidation(self, caller_info: str) -> None:
+        """
+        Queue a widget invalidation through the Qt event loop.
+
+        This is the single entry point for invalidation requests, used by invalidate_widgets()
+        and by the hook system callbacks. Headless controllers have no widgets, so the request is dropped.
+
+        Args:
+            caller_info: Information about where the invalidation was triggered from (for debugging).
+        """
+        if self._headless or self._invalidation_held:
+            return
+        if self._freeze_count > 0:
+            self._frozen_dirty = True
+            return
+        tracing.instant("invalidation_requested", self)
+        if default.INVALIDATION_FRAME_BUDGET_MS is not None and QThread.currentThread().isMainThread(): # type: ignore
+            get_invalidation_scheduler().schedule(self, caller_info)
+            return
+        self._widget_invalidation_signal.trigger.emit(caller_info)
+
+    def _on_invalidation_signal(self, caller_info: str) -> None:
+        """Slot of the queued invalidation signal (on the GUI thread)."""
+        if default.INVALIDATION_FRAME_BUDGET_MS is not None:
+            if not self._is_disposed:
+                get_invalidation_scheduler().schedule(self, caller_info)
+            return
+        self._invalidate_widgets(caller_info=caller_info)
+
+    def _invalidation_priority(self) -> int:
+        """Priority of this controller in time-sliced invalidation flushing: focused, then visible, then hidden."""
+        for widget in list(self._controlled_widgets):
+            try:
+                if widget.hasFocus():
+                    return PRIORITY_FOCUSED
+            except RuntimeError:
+                # Widget already deleted
+                continue
+        return PRIORITY_VISIBLE if self._has_visible_controlled_widget() else PRIORITY_HIDDEN
+
+    @contextmanager
+    def _single_invalidation(self, caller_info: str):
+        """Context manager that drops all invalidation requests inside the block and queues exactly one at its end."""
+        if self._invalidation_held:
+            # Nested: the outermost block queues the invalidation
+            yield
+            return
+        self._invalidation_held = True
+        try:
+            yield
+        finally:
+            self._invalidation_held = False
+            if not self._is_disposed:
+                self._request_invalidation(caller_info)
+
+    @property
+    def is_frozen(self) -> bool:
+        """Whether widget invalidation is suspended by `freeze()`."""
+        return self._freeze_count > 0
+
+    @final
+    def freeze(self) -> None:
+        """
+        Suspend widget invalidation until the matching `thaw()`.
+
+        Hook values keep changing while frozen; only the widgets are not updated.
+        Calls can be nested. Use `IQtWidgetBase.freeze()` to freeze a whole widget tree.
+        """
+        self._freeze_count += 1
+
+    @final
+    def thaw(self) -> None:
+        """
+        End a `freeze()`. The outermost thaw applies a single invalidation if any was requested while frozen.
+
+        The invalidation is applied synchronously, so widgets frozen together are
+        updated before their repaint is re-enabled.
+
+        Raises:
+            RuntimeError: If the controller is not frozen.
+        """
+        if self._freeze_count == 0:
+            raise RuntimeError("thaw() called without matching freeze()")
+        self._freeze_count -= 1
+        if self._freeze_count > 0 or not self._frozen_dirty:
+            return
+        self._frozen_dirty = False
+        if not self._headless:
+            self._invalidate_widgets(caller_info="thaw")
+
+    @final
+    def _rebind_hooks(self, external_hooks: Mapping[HK, Optional[Any]], values: Mapping[HK, Any]) -> None:
+        """
+        Move hooks of the controller from their current external hooks to new ones.
+
+        1. The hooks are isolated from their current external hooks
+        2. The new values are applied in one validated nexus submission
+        3. The hooks are joined to the new external hooks (which already hold these values)
+
+        Pending (debounced) user edits belong to the old binding and are dropped. The widgets
+        are reused and invalidated exactly once.
+
+        Args:
+            external_hooks: The new external hook per hook key, or None to stay detached.
+            values: The new values to submit (the primary hooks among the rebound ones).
+
+        Raises:
+            RuntimeError: If the controller has been disposed.
+            SubmissionError: If the new values are rejected. The hooks are left detached with their previous values.
+        """
+        if self._is_disposed:
+            raise RuntimeError("Controller has been disposed")
+
+        with self._single_invalidation("rebind"), tracing.span("rebind", self, external_hooks):
+            if not self._headless:
+                self._submit_timer.stop()
+            self._discard_pending_submission()
+
+            hooks = {key: self._get_hook_by_key(key) for key in external_hooks} # type: ignore
+            for hook in hooks.values():
+                hook.isolate()
+
+            if values:
+                nexus_and_values: dict[Nexus[Any], Any] = {hooks[key]._get_nexus(): value for key, value in values.items()} # type: ignore
+                success, msg = self._nexus_manager.submit_values(nexus_and_values, logger=self._logger)
+                if not success:
+                    raise SubmissionError(msg, values)
+
+            for key, external_hook in external_hooks.items():
+                if external_hook is not None:
+                    hooks[key].join(external_hook, initial_sync_mode="use_target_value") # type: ignore
+
+        log_msg(self, "rebind", self._logger, f"Rebound hooks {list(external_hooks)}")
+
     @final
     def _invalidate_widgets(self, *, caller_info: str = "") -> None:
         """
@@ -547,12 +1042,31 @@ class BaseController(CarriesSomeHooksProtocol[HK, HV], Generic[HK, HV]):
         """
         if self._is_disposed:
             return  # Silently return if disposed to avoid errors during cleanup
-        
+
+        if self._freeze_count > 0:
+            # Queued before freeze(): applied by thaw()
+            self._frozen_dirty = True
+            return
+
+        if default.DEFER_HIDDEN_INVALIDATION and not self._has_visible_controlled_widget(watch=True):
+            # Collapse into a single pending update, applied when a widget becomes visible
+            self._invalidation_pending = True
+            return
+
+        self._apply_invalidation(caller_info)
+
+    @final
+    def _apply_invalidation(self, caller_info: str) -> None:
+        """Run _invalidate_widgets_impl() in the internal update context and clear any pending invalidation."""
+        if self._is_disposed:
+            return
+        self._invalidation_pending = False
+
         # Log caller information for debugging
         if caller_info:
             log_msg(self, "_invalidate_widgets", self._logger, f"Invalidation triggered from: {caller_info}")
         
-        with self._internal_update():
+        with tracing.span("invalidate", self), self._internal_update():
             self._signals_blocked = True
 
             try:
@@ -566,6 +1080,57 @@ class BaseController(CarriesSomeHooksProtocol[HK, HV], Generic[HK, HV]):
             finally:
                 self._signals_blocked = False
 
+    ###########################################################################
+    # Visibility Tracking
+    ###########################################################################
+
+    @final
+    def _register_controlled_widget(self, widget: QWidget) -> None:
+        """Register a controlled widget for visibility tracking. Called by BaseControlledWidget."""
+        self._controlled_widgets.append(widget)
+        self._unwatched_widgets.append(widget)
+
+    def _install_visibility_watchers(self) -> None:
+        """Install a VisibilityWatcher on every registered widget that has none yet."""
+        if not self._unwatched_widgets:
+            return
+        # Imported here: the controlled widgets package imports this module
+        from ...controlled_widgets._visibility_watcher import VisibilityWatcher
+        for widget in self._unwatched_widgets:
+            try:
+                watcher = VisibilityWatcher(widget)
+                watcher.becameVisible.connect(self._on_controlled_widget_became_visible)
+            except RuntimeError:
+                # Widget already deleted
+                pass
+        self._unwatched_widgets.clear()
+
+    def _has_visible_controlled_widget(self, watch: bool = False) -> bool:
+        """
+        Whether any controlled widget is visible on screen. Controllers without widgets count as visible.
+
+        With ``watch=True`` (deferring an invalidation), visibility watchers are installed first,
+        so the deferred invalidation is applied when a widget becomes visible.
+        """
+        if watch:
+            self._install_visibility_watchers()
+        for widget in list(self._controlled_widgets):
+            try:
+                if widget.isVisible() and not widget.window().isMinimized():
+                    return True
+            except RuntimeError:
+                # Widget already deleted by Qt, stop tracking it
+                self._controlled_widgets.remove(widget)
+        return not self._controlled_widgets
+
+    def _on_controlled_widget_became_visible(self) -> None:
+        """Apply a deferred invalidation in one pass as soon as a controlled widget is shown."""
+        if self._invalidation_pending and not self._is_disposed:
+            if self._freeze_count > 0:
+                self._frozen_dirty = True
+                return
+            self._apply_invalidation("Deferred invalidation (controlled widget became visible)")
+
     ###########################################################################
     # Lifecycle Management
     ###########################################################################
@@ -586,6 +1151,10 @@ class BaseController(CarriesSomeHooksProtocol[HK, HV], Generic[HK, HV]):
     def dispose_impl(self) -> None:
         ...
 
+    def _hooks_for_disposal(self) -> list[Any]:
+        """Get the hooks to isolate when the controller is disposed (used by `dispose_many`)."""
+        return []
+
     def dispose(self, *, from_del: bool = False) -> None:
         """Dispose of the controller and clean up resources.
         
@@ -632,12 +1201,92 @@ class BaseController(CarriesSomeHooksProtocol[HK, HV], Generic[HK, HV]):
                 # QTimer may have been deleted by Qt's parent-child mechanism
                 pass
 
+        # Staged values will never be committed, and the widgets will not be updated again
+        self._discard_pending_submission()
+        discard_scheduled_invalidation(self)
+
         # Call the implementation dispose method (for hook-specific cleanup)
         self.dispose_impl()
+
+        # Stop tracking controlled widgets
+        self._controlled_widgets.clear()
+        self._unwatched_widgets.clear()
+        self._commit_plans.clear()
         
         # Common disposal cleanup (shared by all controller types)
         self._dispose_common_cleanup(from_del=from_del)
     
+    @staticmethod
+    def dispose_many(controllers: Iterable["BaseController[Any, Any]"], *, logger: Optional[Logger] = None) -> int:
+        """Dispose of many controllers at once (e.g. all controllers of a window being closed).
+
+        Equivalent to calling `dispose()` on every controller, but cheaper for large numbers:
+        1. All controllers are marked as disposed and their debounce timers are stopped first,
+           so no commit or invalidation runs while the hooks are detached
+        2. The hooks of all controllers are isolated in one pass
+        3. The Qt helper objects are scheduled for deletion after a single QApplication check,
+           without disconnecting their signals one by one (their slots ignore disposed controllers)
+
+        Args:
+            controllers: The controllers to dispose. Already disposed controllers and duplicates are skipped.
+            logger: Optional logger for the summary message.
+
+        Returns:
+            The number of controllers that were disposed.
+        """
+        targets: list[BaseController[Any, Any]] = []
+        seen: set[int] = set()
+        for controller in controllers:
+            if controller._is_disposed or id(controller) in seen:
+                continue
+            seen.add(id(controller))
+            targets.append(controller)
+        if not targets:
+            return 0
+
+        with tracing.span("dispose_many", args={"controllers": len(targets)}):
+            for controller in targets:
+                controller._is_disposed = True
+                if not controller._headless:
+                    try:
+                        controller._submit_timer.stop()
+                    except RuntimeError:
+                        # QTimer may have been deleted by Qt's parent-child mechanism
+                        pass
+                controller._discard_pending_submission()
+                discard_scheduled_invalidation(controller)
+
+            for controller in targets:
+                for hook in controller._hooks_for_disposal():
+                    try:
+                        hook.isolate()
+                    except Exception as e:
+                        log_msg(controller, "dispose_many", controller._logger, f"Error isolating hook '{hook}': {e}")
+                controller._hooks_isolated = True
+
+            qt_is_running = QApplication.instance() is not None
+            for controller in targets:
+                # Subclass cleanup (the base implementations skip the already isolated hooks)
+                controller.dispose_impl()
+                controller._controlled_widgets.clear()
+                controller._unwatched_widgets.clear()
+                controller._commit_plans.clear()
+                controller._content_changed_notifier = None
+                if not controller._headless and qt_is_running:
+                    controller._delete_qt_helpers()
+
+        log_msg(BaseController.__name__, "dispose_many", logger, f"Disposed {len(targets)} controllers")
+        return len(targets)
+
+    def _delete_qt_helpers(self) -> None:
+        """Schedule the Qt helper objects and the Qt object of the controller for deletion (signals are dropped with them)."""
+        for qt_helper in (self._widget_invalidation_signal, self._gui_executor, self._submit_timer, self._qt_object):
+            try:
+                qt_helper.deleteLater()
+            except RuntimeError:
+                # Qt object may have been deleted already
+                pass
+
     def close(self) -> None:
         """Qt-friendly alias for dispose().
         
@@ -657,6 +1306,12 @@ class BaseController(CarriesSomeHooksProtocol[HK, HV], Generic[HK, HV]):
         # as they may crash due to inconsistent object state
         if from_del:
             return
+
+        # Headless controllers own no Qt objects, so no QApplication is needed for cleanup
+        if self._headless:
+            self._content_changed_notifier = None
+            log_msg(self, f"{self.__class__.__name__} disposed", self._logger, "Controller disposed (headless)")
+            return
         
         # Check if Qt application is still running before attempting Qt cleanup
         # This prevents crashes during interpreter shutdown or garbage collection
@@ -740,7 +1395,11 @@ class BaseController(CarriesSomeHooksProtocol[HK, HV], Generic[HK, HV]):
     def gui_invoke(self, func: Callable[[], None]) -> None:
         """Schedule *func* to run on the GUI thread via a queued connection.
         Safe to call from worker threads. No-op if controller is disposed.
+        Headless controllers have no GUI thread and run *func* immediately.
         """
         if self._is_disposed:
             return
+        if self._headless:
+            func()
+            return
         self._gui_executor.execute.emit(func)
\ No newline at end of file
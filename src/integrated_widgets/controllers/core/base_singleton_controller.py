@@ -42,6 +42,9 @@ class BaseSingletonController(BaseController[Literal["value"], T], XBase[Literal
         Optional validation function that returns (is_valid, error_message)
     debounce_ms : int | Callable[[], int]
         Debounce delay in milliseconds, or callable that returns the delay
+    headless : bool
+        If True, no widgets or Qt helper objects are created and submissions are
+        committed synchronously (see BaseController)
     logger : Optional[Logger]
         Logger for debugging and error reporting
     nexus_manager : NexusManager
@@ -80,6 +83,7 @@ class BaseSingletonController(BaseController[Literal["value"], T], XBase[Literal
         verification_method: Optional[Callable[[T], tuple[bool, str]]] = None,
         custom_validator: Optional[Callable[[T], tuple[bool, str]]] = None,
         debounce_ms: int|Callable[[], int] = default.DEFAULT_DEBOUNCE_MS,
+        headless: bool = False,
         logger: Optional[Logger] = None,
         nexus_manager: NexusManager = nexpy_default.NEXUS_MANAGER,
         ) -> None:
@@ -164,7 +168,7 @@ class BaseSingletonController(BaseController[Literal["value"], T], XBase[Literal
                 if self is not None: # type: ignore
                     import traceback
                     caller_info = ''.join(traceback.format_stack()[-3:-1])
-                    self._widget_invalidation_signal.trigger.emit(f"Hook system callback: {caller_info}")
+                    self._request_invalidation(f"Hook system callback: {caller_info}")
                 else:
                     return False, "Controller has been garbage collected"
 
@@ -181,6 +185,7 @@ class BaseSingletonController(BaseController[Literal["value"], T], XBase[Literal
             self,
             nexus_manager=nexus_manager,
             debounce_ms=debounce_ms,
+            headless=headless,
             logger=logger
         )
 
@@ -196,10 +201,11 @@ class BaseSingletonController(BaseController[Literal["value"], T], XBase[Literal
         # Initialize widgets
         # ------------------------------------------------------------------------------------------------       
 
-        with self._internal_update():
-            self._signals_blocked = True
-            self._initialize_widgets_impl()
-            self._signals_blocked = False
+        if not headless:
+            with self._internal_update():
+                self._signals_blocked = True
+                self._initialize_widgets_impl()
+                self._signals_blocked = False
 
         # ------------------------------------------------------------------------------------------------
         # Connect hooks, if provided
@@ -252,19 +258,28 @@ class BaseSingletonController(BaseController[Literal["value"], T], XBase[Literal
     # Lifecycle Management
     ###########################################################################
 
+    def _hooks_for_disposal(self) -> list[Hook[Any]]:
+        return [self.value_hook]
+
     def dispose_impl(self) -> None:
         """Dispose of the controller and clean up resources."""
+
+        # The hook has already been isolated by BaseController.dispose_many()
+        if self._hooks_isolated:
+            return
         
         # Check if we're in a safe state for cleanup
         # During garbage collection, some objects may be in an unstable state
-        try:
-            from PySide6.QtWidgets import QApplication
-            if QApplication.instance() is None:
-                # Qt application has been destroyed, skip cleanup that might use Qt
+        # Headless controllers own no Qt objects and can always isolate their hooks
+        if not self._headless:
+            try:
+                from PySide6.QtWidgets import QApplication
+                if QApplication.instance() is None:
+                    # Qt application has been destroyed, skip cleanup that might use Qt
+                    return
+            except (ImportError, RuntimeError):
+                # Qt is shutting down or unavailable
                 return
-        except (ImportError, RuntimeError):
-            # Qt is shutting down or unavailable
-            return
         
         # Disconnect value hook
         try:
@@ -291,6 +306,39 @@ class BaseSingletonController(BaseController[Literal["value"], T], XBase[Literal
         """
         self._submit_values_debounced({"value": value}, debounce_ms=debounce_ms, raise_submission_error_flag=raise_submission_error_flag)
 
+    async def submit_async(self, value: T, *, debounce_ms: Optional[int] = None) -> None:
+        """
+        Submit the single value of this single hook controller and wait for the (debounced) commit. (Shortcut for submit_values_async({"value": value}, debounce_ms=debounce_ms))
+
+        Raises:
+            SubmissionError: If the commit fails.
+        """
+        await self.submit_values_async({"value": value}, debounce_ms=debounce_ms)
+
+    def rebind(self, value: T | Hook[T] | XSingleValueProtocol[T]) -> None:
+        """
+        Bind the controller to a different hook or observable, reusing its widgets.
+
+        The value hook is detached from its current external hook, takes the new value in one
+        validated submission and joins the new hook. A plain value detaches the controller and
+        sets the value. Pending (debounced) user edits are dropped, and the widgets are
+        invalidated exactly once.
+
+        Raises:
+            RuntimeError: If the controller has been disposed.
+            SubmissionError: If the new value is rejected (the controller is left detached with its previous value).
+        """
+        if isinstance(value, XSingleValueProtocol):
+            external_hook: Optional[Hook[T]] = value.value_hook # type: ignore
+        elif isinstance(value, Hook):
+            external_hook = value # type: ignore
+        elif isinstance(value, XBase):
+            raise ValueError(f"value must be a value, a hook or a XSingleValueProtocol, got a non-supported XObject: {value.__class__.__name__}") # type: ignore
+        else:
+            external_hook = None
+        new_value: T = external_hook.value if external_hook is not None else value # type: ignore
+        self._rebind_hooks({"value": external_hook}, {"value": new_value})
+
     ###########################################################################
     # Serialization protocol implementation
     ###########################################################################
@@ -0,0 +1,166 @@
+"""Background filesystem helpers for PathSelectorController (path checks and directory completion)."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import AbstractSet, Callable, Literal, Optional
+import os
+import threading
+import time
+
+# Shared by all path selectors; filesystem calls on network mounts can block for seconds
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+MAX_DIRECTORY_ENTRIES: int = 2000
+MAX_CACHED_DIRECTORIES: int = 256
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="integrated_widgets_path")
+        return _EXECUTOR
+
+
+def normalize_extensions(extensions: None | str | AbstractSet[str]) -> Optional[frozenset[str]]:
+    """Normalize extensions to a lower-case set without leading dots (None means all allowed)."""
+    if extensions is None:
+        return None
+    if isinstance(extensions, str):
+        extensions = {extensions}
+    normalized = frozenset(ext.lower().lstrip(".") for ext in extensions)
+    return normalized if normalized else None
+
+
+def check_path(path: Path, mode: Literal["file", "directory"], allowed_extensions: Optional[frozenset[str]]) -> tuple[bool, str]:
+    """Check that a path exists, has the right type and (for files) an allowed extension. Blocking."""
+    try:
+        if not path.exists():
+            return False, f"Path does not exist: {path}"
+        if mode == "directory":
+            if not path.is_dir():
+                return False, f"Path is not a directory: {path}"
+        else:
+            if not path.is_file():
+                return False, f"Path is not a file: {path}"
+            if allowed_extensions is not None and path.suffix.lower().lstrip(".") not in allowed_extensions:
+                return False, f"File extension '{path.suffix}' is not allowed"
+    except OSError as e:
+        return False, f"Cannot access path {path}: {e}"
+    return True, "Path check passed"
+
+
+class AsyncPathChecker:
+    """
+    Runs check_path() in the shared thread pool and delivers results on the GUI thread.
+
+    Only the result of the most recent request is delivered: every new request (and
+    cancel()) bumps a generation counter, and results of older generations are dropped.
+    """
+
+    def __init__(self, invoke: Callable[[Callable[[], None]], None]) -> None:
+        self._invoke = invoke
+        self._generation: int = 0
+        self._future: Optional[Future[tuple[bool, str]]] = None
+
+    def check(
+        self,
+        path: Path,
+        mode: Literal["file", "directory"],
+        allowed_extensions: Optional[frozenset[str]],
+        callback: Callable[[Path, bool, str], None],
+    ) -> None:
+        self.cancel()
+        generation = self._generation
+
+        def deliver(future: Future[tuple[bool, str]]) -> None:
+            if future.cancelled():
+                return
+            try:
+                ok, msg = future.result()
+            except Exception as e:
+                ok, msg = False, f"Path check failed: {e}"
+            self._invoke(lambda: self._deliver(generation, path, ok, msg, callback))
+
+        self._future = _executor().submit(check_path, path, mode, allowed_extensions)
+        self._future.add_done_callback(deliver)
+
+    def cancel(self) -> None:
+        """Cancel the pending check (if not yet running) and drop its result."""
+        self._generation += 1
+        if self._future is not None:
+            self._future.cancel()
+            self._future = None
+
+    @property
+    def is_pending(self) -> bool:
+        return self._future is not None
+
+    def _deliver(self, generation: int, path: Path, ok: bool, msg: str, callback: Callable[[Path, bool, str], None]) -> None:
+        if generation != self._generation:
+            return
+        self._future = None
+        callback(path, ok, msg)
+
+
+class DirectoryIndex:
+    """
+    TTL- and size-bounded cache of directory listings, scanned in the background.
+
+    Entries are the child names of a directory; directory names end with os.sep.
+    """
+
+    def __init__(self, ttl_s: float = 5.0, max_directories: int = MAX_CACHED_DIRECTORIES) -> None:
+        self._ttl_s = ttl_s
+        self._max_directories = max_directories
+        self._entries: OrderedDict[Path, tuple[float, tuple[str, ...]]] = OrderedDict()
+        self._scanning: set[Path] = set()
+        self._lock = threading.Lock()
+
+    def lookup(self, directory: Path) -> Optional[tuple[str, ...]]:
+        """Get the cached listing of a directory, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(directory)
+            if entry is None:
+                return None
+            timestamp, names = entry
+            if time.monotonic() - timestamp > self._ttl_s:
+                del self._entries[directory]
+                return None
+            self._entries.move_to_end(directory)
+            return names
+
+    def request(self, directory: Path, invoke: Callable[[Callable[[], None]], None], callback: Callable[[Path, tuple[str, ...]], None]) -> None:
+        """Scan a directory in the background and deliver the listing via *invoke*. Concurrent requests are merged."""
+        with self._lock:
+            if directory in self._scanning:
+                return
+            self._scanning.add(directory)
+
+        def scan() -> None:
+            names: list[str] = []
+            try:
+                with os.scandir(directory) as iterator:
+                    for entry in iterator:
+                        try:
+                            names.append(entry.name + os.sep if entry.is_dir() else entry.name)
+                        except OSError:
+                            continue
+                        if len(names) >= MAX_DIRECTORY_ENTRIES:
+                            break
+            except OSError:
+                pass
+            listing = tuple(sorted(names, key=str.lower))
+            with self._lock:
+                self._scanning.discard(directory)
+                self._entries[directory] = (time.monotonic(), listing)
+                self._entries.move_to_end(directory)
+                while len(self._entries) > self._max_directories:
+                    self._entries.popitem(last=False)
+            invoke(lambda: callback(directory, listing))
+
+        _executor().submit(scan)
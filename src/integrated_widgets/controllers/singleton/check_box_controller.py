@@ -37,6 +37,8 @@ class CheckBoxController(BaseSingletonController[bool]):
         The label text to display next to the checkbox. Defaults to "" (no label).
     debounce_ms : int|Callable[[], int], optional
         The debounce time in milliseconds for the checkbox state changes. Defaults to None (no debounce).
+    headless : bool, optional
+        If True, no widgets are created and submissions are committed synchronously. Defaults to False.
     logger : Optional[Logger], optional
         Logger instance for debugging. Defaults to None.
     nexus_manager : NexusManager, optional
@@ -92,6 +94,7 @@ class CheckBoxController(BaseSingletonController[bool]):
         text: str = "",
         custom_validator: Optional[Callable[[bool], tuple[bool, str]]] = None,
         debounce_ms: int|Callable[[], int] = default.DEFAULT_DEBOUNCE_MS,
+        headless: bool = False,
         logger: Optional[Logger] = None,
         nexus_manager: NexusManager = nexpy_default.NEXUS_MANAGER,
     ) -> None:
@@ -105,6 +108,7 @@ class CheckBoxController(BaseSingletonController[bool]):
             verification_method=None,
             custom_validator=custom_validator,
             debounce_ms=debounce_ms,
+            headless=headless,
             logger=logger,
             nexus_manager=nexus_manager
         )
@@ -30,6 +30,7 @@ class DisplayValueController(BaseSingletonController[T], FormatterMixin[T], Gene
         formatter: Callable[[T], str] = lambda x: str(x),
         custom_validator: Optional[Callable[[T], tuple[bool, str]]] = None,
         debounce_ms: int|Callable[[], int] = default.DEFAULT_DEBOUNCE_MS,
+        headless: bool = False,
         logger: Optional[Logger] = None,
         nexus_manager: NexusManager = nexpy_default.NEXUS_MANAGER,
         ) -> None:
@@ -41,6 +42,7 @@ class DisplayValueController(BaseSingletonController[T], FormatterMixin[T], Gene
             value=value,
             custom_validator=custom_validator,
             debounce_ms=debounce_ms,
+            headless=headless,
             logger=logger,
             nexus_manager=nexus_manager
         )
@@ -6,6 +6,7 @@ from logging import Logger
 from ...controlled_widgets.controlled_line_edit import ControlledLineEdit
 from ...controlled_widgets.controlled_qlabel import ControlledQLabel
 from ...auxiliaries.default import default
+from ...auxiliaries.input_validators import float_input_validator
 from ..core.base_singleton_controller import BaseSingletonController
 from ..core.formatter_mixin import FormatterMixin
 
@@ -38,6 +39,10 @@ class FloatEntryController(BaseSingletonController[float], FormatterMixin[float]
         Defaults to None (no custom validation).
     parent_of_widgets : Optional[QWidget], optional
         The parent widget for the created UI widgets. Defaults to None.
+    keystroke_validation : bool, optional
+        If True, the entry rejects text that can never parse as a float while it is typed,
+        and text that is incomplete or fails validation is reverted when editing finishes,
+        without a commit. Defaults to False.
     logger : Optional[Logger], optional
         Logger instance for debugging. Defaults to None.
     
@@ -108,11 +113,14 @@ class FloatEntryController(BaseSingletonController[float], FormatterMixin[float]
         custom_validator: Optional[Callable[[float], tuple[bool, str]]] = None,
         formatter: Callable[[float], str] = lambda x: str(x),
         debounce_ms: int|Callable[[], int] = default.DEFAULT_DEBOUNCE_MS,
+        headless: bool = False,
+        keystroke_validation: bool = False,
         logger: Optional[Logger] = None,
         nexus_manager: NexusManager = nexpy_default.NEXUS_MANAGER,
     ) -> None:
         
         FormatterMixin.__init__(self, formatter=formatter, invalidate_widgets=self.invalidate_widgets) # type: ignore
+        self._keystroke_validation = keystroke_validation
 
         def verification_method(x: float) -> tuple[bool, str]:
             # Verify the value is a float
@@ -127,6 +135,7 @@ class FloatEntryController(BaseSingletonController[float], FormatterMixin[float]
             custom_validator=custom_validator,
             logger=logger,
             debounce_ms=debounce_ms,
+            headless=headless,
             nexus_manager=nexus_manager
         )
 
@@ -156,6 +165,13 @@ class FloatEntryController(BaseSingletonController[float], FormatterMixin[float]
         # Connect UI -> model
         self._line_edit.userInputFinishedSignal.connect(lambda: self.evaluate())
 
+        if self._keystroke_validation:
+            self._line_edit.setValidator(float_input_validator(
+                custom_validator=self._custom_validator,
+                fallback_text=lambda: repr(self.value),
+                parent=self._line_edit,
+            ))
+
     def _read_widget_single_value_impl(self) -> tuple[bool, float]:
         """
         Read the value from the float entry widget.
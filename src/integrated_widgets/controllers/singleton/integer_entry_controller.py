@@ -6,6 +6,7 @@ from logging import Logger
 from ...controlled_widgets.controlled_line_edit import ControlledLineEdit
 from ...controlled_widgets.controlled_qlabel import ControlledQLabel
 from ...auxiliaries.default import default
+from ...auxiliaries.input_validators import integer_input_validator
 from ..core.base_singleton_controller import BaseSingletonController
 from ..core.formatter_mixin import FormatterMixin
 
@@ -38,6 +39,10 @@ class IntegerEntryController(BaseSingletonController[int], FormatterMixin[int]):
         Defaults to None (no custom validation).
     parent_of_widgets : Optional[QWidget], optional
         The parent widget for the created UI widgets. Defaults to None.
+    keystroke_validation : bool, optional
+        If True, the entry rejects text that can never parse as an integer while it is typed,
+        and text that is incomplete or fails validation is reverted when editing finishes,
+        without a commit. Defaults to False.
     logger : Optional[Logger], optional
         Logger instance for debugging. Defaults to None.
     
@@ -103,11 +108,14 @@ class IntegerEntryController(BaseSingletonController[int], FormatterMixin[int]):
         custom_validator: Optional[Callable[[int], tuple[bool, str]]] = None,
         formatter: Callable[[int], str] = lambda x: str(x),
         debounce_ms: int|Callable[[], int] = default.DEFAULT_DEBOUNCE_MS,
+        headless: bool = False,
+        keystroke_validation: bool = False,
         logger: Optional[Logger] = None,
         nexus_manager: NexusManager = nexpy_default.NEXUS_MANAGER,
     ) -> None:
         
         FormatterMixin.__init__(self, formatter=formatter, invalidate_widgets=self.invalidate_widgets) # type: ignore
+        self._keystroke_validation = keystroke_validation
 
         def verification_method(x: int) -> tuple[bool, str]:
             
@@ -123,6 +131,7 @@ class IntegerEntryController(BaseSingletonController[int], FormatterMixin[int]):
             verification_method=verification_method,
             custom_validator=custom_validator,
             debounce_ms=debounce_ms,
+            headless=headless,
             logger=logger,
             nexus_manager=nexus_manager
         )
@@ -153,6 +162,13 @@ class IntegerEntryController(BaseSingletonController[int], FormatterMixin[int]):
         
         self._line_edit.userInputFinishedSignal.connect(self.evaluate)
 
+        if self._keystroke_validation:
+            self._line_edit.setValidator(integer_input_validator(
+                custom_validator=self._custom_validator,
+                fallback_text=lambda: str(self.value),
+                parent=self._line_edit,
+            ))
+
     def _read_widget_single_value_impl(self) -> tuple[bool, int]:
         """
         Read the value from the integer entry widget.
@@ -143,6 +143,7 @@ class OptionalTextEntryController(BaseSingletonController[Optional[str]], Format
         formatter: Callable[[Optional[str]], str] = lambda x: str(x),
         none_value: str = "",
         debounce_ms: int|Callable[[], int] = default.DEFAULT_DEBOUNCE_MS,
+        headless: bool = False,
         strip_whitespace: bool = True,
         logger: Optional[Logger] = None,
         nexus_manager: NexusManager = nexpy_default.NEXUS_MANAGER,
@@ -165,6 +166,7 @@ class OptionalTextEntryController(BaseSingletonController[Optional[str]], Format
             custom_validator=custom_validator,
             logger=logger,
             debounce_ms=debounce_ms,
+            headless=headless,
             nexus_manager=nexus_manager
         )
 
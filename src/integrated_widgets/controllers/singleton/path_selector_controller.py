@@ -4,10 +4,12 @@ from __future__ import annotations
 from typing import Optional, Literal, Callable
 from logging import Logger
 from pathlib import Path
-from PySide6.QtWidgets import QPushButton, QFileDialog, QMessageBox
+import os
+from PySide6.QtCore import QStringListModel, Qt
+from PySide6.QtWidgets import QPushButton, QFileDialog, QMessageBox, QCompleter
 
 from nexpy import Hook, XSingleValueProtocol
-from nexpy.core import NexusManager
+from nexpy.core import NexusManager, SubmissionError
 from nexpy import default as nexpy_default
 
 from ...controlled_widgets.controlled_line_edit import ControlledLineEdit
@@ -16,6 +18,7 @@ from ...controlled_widgets.controlled_push_button import ControlledPushButton
 from ...auxiliaries.resources import log_msg
 from ...auxiliaries.default import default
 from ..core.base_singleton_controller import BaseSingletonController
+from ._path_filesystem import AsyncPathChecker, DirectoryIndex, check_path, normalize_extensions
 
 class PathSelectorController(BaseSingletonController[Optional[Path]]):
     """
@@ -47,6 +50,18 @@ class PathSelectorController(BaseSingletonController[Optional[Path]]):
     allowed_file_extensions : None|str|set[str], optional
         Allowed file extensions for filtering. Can be a single extension string or a set.
         Only used in file mode. Defaults to None (all files allowed).
+    check_filesystem : bool, optional
+        If True, new paths (typed, chosen with the browse button or passed to `submit`)
+        are only committed after a check that the path exists, is a file (mode "file")
+        or directory (mode "directory"), and has an allowed extension. Checks run in a
+        thread pool (synchronously for headless controllers); a newer input cancels
+        older checks. Defaults to False.
+    enable_completion : bool, optional
+        If True, the path entry offers inline completion of directory contents. Listings
+        are scanned in the background and cached for ``completion_cache_ttl_s`` seconds.
+        Only absolute paths are completed. Defaults to False.
+    completion_cache_ttl_s : float, optional
+        Time-to-live of cached directory listings in seconds. Defaults to 5.0.
     parent_of_widgets : Optional[QWidget], optional
         The parent widget for the created UI widgets. Defaults to None.
     logger : Optional[Logger], optional
@@ -120,8 +135,12 @@ class PathSelectorController(BaseSingletonController[Optional[Path]]):
         suggested_file_title_without_extension: Optional[str] = None,
         suggested_file_extension: Optional[str] = None,
         allowed_file_extensions: None|str|set[str] = None,
+        check_filesystem: bool = False,
+        enable_completion: bool = False,
+        completion_cache_ttl_s: float = 5.0,
         custom_validator: Optional[Callable[[Optional[Path]], tuple[bool, str]]] = None,
         debounce_ms: int|Callable[[], int] = default.DEFAULT_DEBOUNCE_MS,
+        headless: bool = False,
         logger: Optional[Logger] = None,
         nexus_manager: NexusManager = nexpy_default.NEXUS_MANAGER,
     ) -> None:
@@ -139,6 +158,16 @@ class PathSelectorController(BaseSingletonController[Optional[Path]]):
         self._suggested_file_extension = suggested_file_extension
         self._allowed_file_extensions = allowed_file_extensions
 
+        # Background filesystem checks and completion (set up in _initialize_widgets_impl)
+        self._check_filesystem = check_filesystem
+        self._enable_completion = enable_completion
+        self._directory_index = DirectoryIndex(ttl_s=completion_cache_ttl_s)
+        self._path_checker: Optional[AsyncPathChecker] = None
+        self._path_check_message: Optional[str] = None
+        self._completer: Optional[QCompleter] = None
+        self._completion_model: Optional[QStringListModel] = None
+        self._completion_listing: Optional[tuple[Path, tuple[str, ...]]] = None
+
         log_msg(self, "__init__", logger, f"Dialog title: {dialog_title}, allowed extensions: {allowed_file_extensions}")
         
         def verification_method(x: Optional[Path]) -> tuple[bool, str]:
@@ -153,6 +182,7 @@ class PathSelectorController(BaseSingletonController[Optional[Path]]):
             verification_method=verification_method,
             custom_validator=custom_validator,
             debounce_ms=debounce_ms,
+            headless=headless,
             logger=logger,
             nexus_manager=nexus_manager
         )
@@ -170,8 +200,20 @@ class PathSelectorController(BaseSingletonController[Optional[Path]]):
         self._clear_button = ControlledPushButton(self, "Clear path")
 
         self._browse_button.userInputFinishedSignal.connect(self._on_browse)
-        self._path_entry.userInputFinishedSignal.connect(self.evaluate)
+        if self._check_filesystem:
+            self._path_checker = AsyncPathChecker(self.gui_invoke)
+            self._path_entry.userInputFinishedSignal.connect(self._on_path_entry_finished)
+        else:
+            self._path_entry.userInputFinishedSignal.connect(self.evaluate)
         self._clear_button.userInputFinishedSignal.connect(self._on_clear)
+
+        if self._enable_completion:
+            self._completion_model = QStringListModel(self._path_entry)
+            self._completer = QCompleter(self._completion_model, self._path_entry)
+            self._completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+            self._completer.setCompletionMode(QCompleter.CompletionMode.InlineCompletion)
+            self._path_entry.setCompleter(self._completer)
+            self._path_entry.textEdited.connect(self._on_path_text_edited)
         
         log_msg(self, "_initialize_widgets", self._logger, "Widgets created and signals connected")
 
@@ -192,10 +234,111 @@ class PathSelectorController(BaseSingletonController[Optional[Path]]):
         except ValueError:
             return False, self.value
 
-        if self._custom_validator is not None and not self._custom_validator(new_path):
+        if self._custom_validator is not None and not self._custom_validator(new_path)[0]:
             return False, self.value
         
         return True, new_path
+
+    ###########################################################################
+    # Background filesystem checks
+    ###########################################################################
+
+    def submit(self, value: Optional[Path], *, debounce_ms: Optional[int] = None, raise_submission_error_flag: bool = True) -> None:
+        """
+        Submit a path.
+
+        With ``check_filesystem``, a new path is checked first (in the background, unless the
+        controller is headless) and only committed if the check passes; otherwise the widgets
+        are reverted and `path_check_message` tells why.
+
+        Raises:
+            SubmissionError: If a headless controller's path fails the check (with ``raise_submission_error_flag``).
+        """
+        if not self._check_filesystem or value is None or value == self.value:
+            # Nothing to check: no checks configured, clearing the path, or no change
+            if self._path_checker is not None:
+                self._path_checker.cancel()
+            super().submit(value, debounce_ms=debounce_ms, raise_submission_error_flag=raise_submission_error_flag)
+            return
+        if self._path_checker is None:
+            # Headless: no GUI thread to deliver a background result to
+            ok, msg = check_path(value, self._mode, self._allowed_extensions_for_check())
+            self._on_path_check_finished(value, ok, msg)
+            if not ok and raise_submission_error_flag:
+                raise SubmissionError(msg, {"value": value})
+            return
+        log_msg(self, "submit", self._logger, f"Checking path in background: {value}")
+        self._path_checker.check(value, self._mode, self._allowed_extensions_for_check(), self._on_path_check_finished)
+
+    def _on_path_entry_finished(self, _: object = None) -> None:
+        """Submit the typed path; it is committed once the filesystem check passes."""
+        valid, path = self._read_widget_single_value_impl()
+        if not valid:
+            self.invalidate_widgets()
+            return
+        self.submit(path, raise_submission_error_flag=False)
+
+    def _allowed_extensions_for_check(self) -> Optional[frozenset[str]]:
+        return normalize_extensions(self._allowed_file_extensions) if self._mode == "file" else None
+
+    def _on_path_check_finished(self, path: Path, ok: bool, msg: str) -> None:
+        """GUI thread: commit a checked path, or revert the widgets if the check failed."""
+        if self._is_disposed:
+            return
+        log_msg(self, "_on_path_check_finished", self._logger, f"Path check for {path}: {msg}")
+        if ok:
+            self._path_check_message = None
+            super().submit(path, raise_submission_error_flag=False)
+        else:
+            self._path_check_message = msg
+            self.invalidate_widgets()
+
+    @property
+    def path_check_message(self) -> Optional[str]:
+        """Reason why the last typed path was rejected by the filesystem check, or None."""
+        return self._path_check_message
+
+    @property
+    def is_checking_path(self) -> bool:
+        """Whether a background filesystem check is in progress."""
+        return self._path_checker is not None and self._path_checker.is_pending
+
+    ###########################################################################
+    # Directory completion
+    ###########################################################################
+
+    def _on_path_text_edited(self, text: str) -> None:
+        """Offer the cached listing of the typed directory, scanning it in the background if needed."""
+        if not text:
+            return
+        directory = Path(text) if text.endswith(("/", os.sep)) else Path(text).parent
+        if not directory.is_absolute():
+            # A relative directory (e.g. "" or ".") would list the working directory of the process
+            return
+        names = self._directory_index.lookup(directory)
+        if names is None:
+            self._directory_index.request(directory, self.gui_invoke, self._on_directory_scanned)
+        else:
+            self._set_completions(directory, names)
+
+    def _on_directory_scanned(self, directory: Path, names: tuple[str, ...]) -> None:
+        """GUI thread: show a fresh listing if the user is still typing in that directory."""
+        if self._is_disposed or self._completer is None:
+            return
+        text = self._path_entry.text()
+        current = Path(text) if text.endswith(("/", os.sep)) else Path(text).parent
+        if current != directory:
+            return
+        self._set_completions(directory, names)
+        self._completer.complete()
+
+    def _set_completions(self, directory: Path, names: tuple[str, ...]) -> None:
+        if self._completion_model is None or self._completion_listing == (directory, names):
+            return
+        self._completion_listing = (directory, names)
+        if self._mode == "directory":
+            names = tuple(name for name in names if name.endswith(os.sep))
+        self._completion_model.setStringList([str(directory / name) + (os.sep if name.endswith(os.sep) else "") for name in names])
         
     def _on_clear(self) -> None:
         """Handle clear button click."""
@@ -297,6 +440,12 @@ class PathSelectorController(BaseSingletonController[Optional[Path]]):
         else:
             log_msg(self, "_on_browse", self._logger, "No path selected or dialog cancelled")
 
+    def dispose_impl(self) -> None:
+        """Drop pending background checks, then dispose the hooks."""
+        if self._path_checker is not None:
+            self._path_checker.cancel()
+        super().dispose_impl()
+
     def _invalidate_widgets_impl(self) -> None:
         path = self.value
         log_msg(self, "_invalidate_widgets_impl", self._logger, f"Updating widgets with path: {path}")
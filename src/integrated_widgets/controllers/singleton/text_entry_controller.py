@@ -122,6 +122,7 @@ class TextEntryController(BaseSingletonController[str], FormatterMixin[str]):
         formatter: Callable[[str], str] = lambda x: x,
         strip_whitespace: bool = True,
         debounce_ms: int|Callable[[], int] = default.DEFAULT_DEBOUNCE_MS,
+        headless: bool = False,
         nexus_manager: NexusManager = nexpy_default.NEXUS_MANAGER,
         logger: Optional[Logger] = None,
     ) -> None:
@@ -141,6 +142,7 @@ class TextEntryController(BaseSingletonController[str], FormatterMixin[str]):
             verification_method=verification_method,
             custom_validator=custom_validator,
             debounce_ms=debounce_ms,
+            headless=headless,
             nexus_manager=nexus_manager,
             logger=logger,
         )
@@ -23,6 +23,18 @@ Plus supporting protocols:
 - **LayoutStrategyBase**: Protocol for layout strategy callables
 - **LayoutPayloadBase**: Base class for immutable widget payload dataclasses
 
+And snapshot support for whole widget trees:
+- **capture_snapshot / restore_snapshot**: Capture all controller values of a payload tree and restore them in one batched submission
+- **WidgetSnapshot**: Captured values with a compact binary encoding
+- **SnapshotLibrary / write_snapshot_library**: Memory-mapped files of named snapshots (e.g. presets)
+
+And diagnostics:
+- **start_tracing / stop_tracing / Tracer**: Record controller activity into a ring buffer and export it as Chrome trace JSON
+- **StallMonitor / StallReport**: Detect GUI event-loop stalls and attribute them to controller work
+- **start_live_tracking / stop_live_tracking / LiveRegistry / LiveSnapshot**: Weak registry of live controllers and controlled widgets for leak detection
+- **get_invalidation_scheduler / InvalidationScheduler**: Time-sliced, prioritized invalidation flushing with backlog and latency counters
+- **InputRecorder / InputLog / replay_input / ReplayReport**: Record user input of a widget tree and replay it to measure commit latency, invalidations and frame times
+
 Most users should use top-level imports from `integrated_widgets` for standard widgets.
 Only import from `integrated_widgets.core` when building custom widgets or advanced compositions.
 
@@ -53,13 +65,56 @@ Creating a custom widget with controller lifecycle management:
             # Custom initialization here
 """
 
-from .iqt_widgets.foundation.iqt_widget_base import IQtWidgetBase
-from .iqt_widgets.foundation.iqt_controller_widget_base import IQtControllerWidgetBase
-from .iqt_widgets.foundation.iqt_composite_controller_widget_base import IQtCompositeControllerWidgetBase
-from .iqt_widgets.foundation.iqt_singleton_controller_widget_base import IQtSingletonControllerWidgetBase
-from .iqt_widgets.foundation.layout_strategy_base import LayoutStrategyBase
-from .iqt_widgets.foundation.layout_payload_base import LayoutPayloadBase
-from .controllers.utils import complete_available_unit, complete_available_units
+from typing import TYPE_CHECKING
+
+from .auxiliaries.lazy_imports import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from .iqt_widgets.foundation.iqt_widget_base import IQtWidgetBase
+    from .iqt_widgets.foundation.iqt_controller_widget_base import IQtControllerWidgetBase
+    from .iqt_widgets.foundation.iqt_composite_controller_widget_base import IQtCompositeControllerWidgetBase
+    from .iqt_widgets.foundation.iqt_singleton_controller_widget_base import IQtSingletonControllerWidgetBase
+    from .iqt_widgets.foundation.layout_strategy_base import LayoutStrategyBase
+    from .iqt_widgets.foundation.layout_payload_base import LayoutPayloadBase
+    from .controllers.utils import complete_available_unit, complete_available_units
+    from .auxiliaries.widget_snapshot import WidgetSnapshot, SnapshotLibrary, capture_snapshot, restore_snapshot, write_snapshot_library
+    from .auxiliaries.tracing import Tracer, start_tracing, stop_tracing
+    from .auxiliaries.stall_monitor import StallMonitor, StallReport
+    from .auxiliaries.live_registry import LiveRegistry, LiveSnapshot, start_live_tracking, stop_live_tracking
+    from .auxiliaries.invalidation_scheduler import InvalidationScheduler, get_invalidation_scheduler
+    from .auxiliaries.input_replay import InputRecorder, InputLog, ReplayReport, replay_input
+
+# Exported name -> (module, attribute); resolved on first access
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str]] = {
+    "IQtWidgetBase": (".iqt_widgets.foundation.iqt_widget_base", "IQtWidgetBase"),
+    "IQtControllerWidgetBase": (".iqt_widgets.foundation.iqt_controller_widget_base", "IQtControllerWidgetBase"),
+    "IQtCompositeControllerWidgetBase": (".iqt_widgets.foundation.iqt_composite_controller_widget_base", "IQtCompositeControllerWidgetBase"),
+    "IQtSingletonControllerWidgetBase": (".iqt_widgets.foundation.iqt_singleton_controller_widget_base", "IQtSingletonControllerWidgetBase"),
+    "LayoutStrategyBase": (".iqt_widgets.foundation.layout_strategy_base", "LayoutStrategyBase"),
+    "LayoutPayloadBase": (".iqt_widgets.foundation.layout_payload_base", "LayoutPayloadBase"),
+    "complete_available_unit": (".controllers.utils", "complete_available_unit"),
+    "complete_available_units": (".controllers.utils", "complete_available_units"),
+    "WidgetSnapshot": (".auxiliaries.widget_snapshot", "WidgetSnapshot"),
+    "SnapshotLibrary": (".auxiliaries.widget_snapshot", "SnapshotLibrary"),
+    "capture_snapshot": (".auxiliaries.widget_snapshot", "capture_snapshot"),
+    "restore_snapshot": (".auxiliaries.widget_snapshot", "restore_snapshot"),
+    "write_snapshot_library": (".auxiliaries.widget_snapshot", "write_snapshot_library"),
+    "Tracer": (".auxiliaries.tracing", "Tracer"),
+    "start_tracing": (".auxiliaries.tracing", "start_tracing"),
+    "stop_tracing": (".auxiliaries.tracing", "stop_tracing"),
+    "StallMonitor": (".auxiliaries.stall_monitor", "StallMonitor"),
+    "StallReport": (".auxiliaries.stall_monitor", "StallReport"),
+    "LiveRegistry": (".auxiliaries.live_registry", "LiveRegistry"),
+    "LiveSnapshot": (".auxiliaries.live_registry", "LiveSnapshot"),
+    "start_live_tracking": (".auxiliaries.live_registry", "start_live_tracking"),
+    "stop_live_tracking": (".auxiliaries.live_registry", "stop_live_tracking"),
+    "InvalidationScheduler": (".auxiliaries.invalidation_scheduler", "InvalidationScheduler"),
+    "get_invalidation_scheduler": (".auxiliaries.invalidation_scheduler", "get_invalidation_scheduler"),
+    "InputRecorder": (".auxiliaries.input_replay", "InputRecorder"),
+    "InputLog": (".auxiliaries.input_replay", "InputLog"),
+    "ReplayReport": (".auxiliaries.input_replay", "ReplayReport"),
+    "replay_input": (".auxiliaries.input_replay", "replay_input"),
+}
 
 __all__ = [
     "IQtCompositeControllerWidgetBase",
@@ -69,5 +124,27 @@ __all__ = [
     "LayoutStrategyBase",
     "LayoutPayloadBase",
     "complete_available_unit",
-    "complete_available_units"
-]
\ No newline at end of file
+    "complete_available_units",
+    "WidgetSnapshot",
+    "SnapshotLibrary",
+    "capture_snapshot",
+    "restore_snapshot",
+    "write_snapshot_library",
+    "Tracer",
+    "start_tracing",
+    "stop_tracing",
+    "StallMonitor",
+    "StallReport",
+    "LiveRegistry",
+    "LiveSnapshot",
+    "start_live_tracking",
+    "stop_live_tracking",
+    "InvalidationScheduler",
+    "get_invalidation_scheduler",
+    "InputRecorder",
+    "InputLog",
+    "ReplayReport",
+    "replay_input",
+]
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, globals(), _LAZY_ATTRIBUTES)
@@ -1,4 +1,4 @@
-from typing import Generic, TypeVar, Any, Optional
+from typing import Generic, Mapping, TypeVar, Any, Optional
 from logging import Logger
 
 from PySide6.QtWidgets import QWidget
@@ -143,4 +143,8 @@ class IQtCompositeControllerWidgetBase(IQtControllerWidgetBase[HK, HV, P, C], Ge
         controller : Access the controller directly
         get_hook : Get the hook itself instead of just its value
         """
-        return self._controller._get_value_by_key(key) # type: ignore
\ No newline at end of file
+        return self._controller._get_value_by_key(key) # type: ignore
+
+    def rebind(self, hooks: Mapping[HK, Any]) -> None:
+        """Bind some or all hooks of the widget to different hooks or observables (see `BaseCompositeController.rebind`)."""
+        self._controller.rebind(hooks) # type: ignore
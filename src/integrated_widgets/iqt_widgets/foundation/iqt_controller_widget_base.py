@@ -100,7 +100,7 @@ See Also
 - BaseLayoutPayload: Payload structure for widget management
 """
 
-from typing import Optional, TypeVar, Generic, Any
+from typing import Mapping, Optional, TypeVar, Generic, Any
 from logging import Logger
 
 from PySide6.QtWidgets import QWidget
@@ -604,3 +604,33 @@ class IQtControllerWidgetBase(IQtWidgetBase[P], Generic[HK, HV, P, C]):
         # Now evaluate once with all widgets in their "finished editing" state
         self._controller.evaluate(debounce_ms=debounce_ms, raise_submission_error_flag=raise_submission_error_flag)
 
+    @staticmethod
+    def rebind_many(bindings: Mapping["IQtControllerWidgetBase[Any, Any, P, Any]", Any]) -> None:
+        """
+        Rebind the widgets of a whole panel (e.g. a master-detail view switching records).
+
+        Each widget keeps its controller and child widgets; only the bindings change.
+        Every controller submits its new values once and invalidates its widgets once.
+
+        Parameters
+        ----------
+        bindings : Mapping[IQtControllerWidgetBase, Any]
+            Per widget the argument of its ``rebind()``: a hook, observable or value for
+            singleton widgets, a mapping of hook keys to those for composite widgets.
+
+        Raises
+        ------
+        SubmissionError
+            If the new values of a widget are rejected. The widgets before it are already rebound.
+
+        Examples
+        --------
+        >>> def show_record(record):
+        ...     IQtControllerWidgetBase.rebind_many({
+        ...         name_entry: record.name,
+        ...         mass_entry: {"scalar_value": record.mass},
+        ...     })
+        """
+        for widget, binding in bindings.items():
+            widget.rebind(binding) # type: ignore
+
@@ -1,9 +1,9 @@
-from typing import Generic, TypeVar, Any, Literal, Optional
+from typing import Callable, Generic, TypeVar, Any, Literal, Optional
 from logging import Logger
 
 from PySide6.QtWidgets import QWidget
 
-from nexpy import Hook
+from nexpy import Hook, XSingleValueProtocol
 
 from ...controllers.core.base_singleton_controller import BaseSingletonController
 from .iqt_controller_widget_base import IQtControllerWidgetBase
@@ -15,6 +15,15 @@ P = TypeVar("P", bound=LayoutPayloadBase)
 C = TypeVar("C", bound=BaseSingletonController[Any])
 
 
+def bool_validator(validator: Callable[[T], bool]) -> Callable[[T], tuple[bool, str]]:
+    """Adapt a widget's ``value -> bool`` validator to the ``custom_validator`` signature of controllers."""
+    def custom_validator(value: T) -> tuple[bool, str]:
+        if validator(value):
+            return True, "Value is valid"
+        return False, f"Invalid value: {value!r}"
+    return custom_validator
+
+
 class IQtSingletonControllerWidgetBase(IQtControllerWidgetBase[Literal["value"], T, P, C], Generic[T, P, C]):
     """
     Base class for IQT widgets that manage a single value through a controller.
@@ -88,4 +97,8 @@ class IQtSingletonControllerWidgetBase(IQtControllerWidgetBase[Literal["value"],
         self.controller.value = value
 
     def change_value(self, value: T) -> None:
-        self.controller.change_value(value)
\ No newline at end of file
+        self.controller.change_value(value)
+
+    def rebind(self, value: T | Hook[T] | XSingleValueProtocol[T]) -> None:
+        """Bind the widget to a different hook or observable (see `BaseSingletonController.rebind`)."""
+        self.controller.rebind(value)
\ No newline at end of file
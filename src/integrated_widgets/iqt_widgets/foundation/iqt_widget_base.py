@@ -194,7 +194,8 @@ See Also
 - LayoutStrategyBase: Protocol defining strategy signature
 """
 
-from typing import Optional, TypeVar, Generic, Any
+from typing import Optional, TypeVar, Generic, Any, Iterator
+from contextlib import contextmanager
 from logging import Logger
 
 from PySide6.QtWidgets import QWidget, QVBoxLayout
@@ -202,6 +203,7 @@ from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QSizePolicy
 
 from ...controllers.core.base_controller import BaseController
+from ...auxiliaries import tracing
 from .layout_payload_base import LayoutPayloadBase
 from .layout_strategy_base import LayoutStrategyBase
 
@@ -378,6 +380,11 @@ class IQtWidgetBase(QWidget, Generic[P]):
         self._content_root: QWidget | None = None  # Content widget returned by strategy
         self._placeholder: QWidget | None = None   # Persistent geometry holder during rebuilds
 
+        # freeze()/thaw() state: nesting depth and the controllers frozen by the outermost freeze()
+        self._freeze_count: int = 0
+        self._frozen_controllers: list[BaseController[Any, Any]] = []
+        self._updates_enabled_before_freeze: bool = True
+
         # Always call _build() - it will show a placeholder if no strategy is set
         self._build(**layout_strategy_kwargs)
 
@@ -396,14 +403,15 @@ class IQtWidgetBase(QWidget, Generic[P]):
             controller.relayouting_is_starting()
 
         try:
-            # Just clear current host and rebuild immediately
-            self._clear_host()
-            self._build(**layout_strategy_kwargs)
-
-            # Let Qt settle the layout once
-            self._host_layout.activate()
-            self.updateGeometry()
-            self.update()
+            with tracing.span("rebuild", self, args={"controllers": len(affected_controllers)}):
+                # Just clear current host and rebuild immediately
+                self._clear_host()
+                self._build(**layout_strategy_kwargs)
+
+                # Let Qt settle the layout once
+                self._host_layout.activate()
+                self.updateGeometry()
+                self.update()
         finally:
             for controller in affected_controllers:
                 controller.relayouting_has_ended()
@@ -944,4 +952,116 @@ class IQtWidgetBase(QWidget, Generic[P]):
             
             # Clean up the old set
             old_affected_controllers.clear()
-        
\ No newline at end of file
+        
+
+    def controllers_in_tree(self) -> list[BaseController[Any, Any]]:
+        """
+        Collect the controllers of this widget and of all IQt widgets nested in it.
+
+        Returns
+        -------
+        list[BaseController]
+            Each controller once, outermost widgets first.
+        """
+        controllers: dict[int, BaseController[Any, Any]] = {}
+        for widget in [self, *self.findChildren(IQtWidgetBase)]:
+            # Controller widgets own a controller that may not appear in their payload
+            owned_controller = getattr(widget, "_controller", None)
+            if isinstance(owned_controller, BaseController):
+                controllers.setdefault(id(owned_controller), owned_controller) # type: ignore
+            payload = widget._payload
+            for controlled_widget in payload.registered_controlled_widgets:
+                controller = controlled_widget.controller
+                controllers.setdefault(id(controller), controller)
+            for controller in payload.registered_controllers:
+                controllers.setdefault(id(controller), controller)
+        return list(controllers.values())
+
+    def freeze(self) -> None:
+        """
+        Suspend repaints and controller invalidation for this widget tree until the matching `thaw()`.
+
+        Use it around bulk programmatic updates (e.g. loading a dataset into many bound
+        hooks): the hook values change immediately, but no widget is updated or repainted
+        until `thaw()`. Calls can be nested; only the outermost pair takes effect.
+
+        The controllers are collected once with `controllers_in_tree()`. Controllers added
+        to the tree while it is frozen are not frozen.
+        """
+        self._freeze_count += 1
+        if self._freeze_count > 1:
+            return
+        self._frozen_controllers = self.controllers_in_tree()
+        for controller in self._frozen_controllers:
+            controller.freeze()
+        self._updates_enabled_before_freeze = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+
+    def thaw(self) -> None:
+        """
+        End a `freeze()`.
+
+        The outermost thaw applies exactly one invalidation per controller that changed
+        while frozen, then re-enables updates, which repaints the tree once.
+
+        Raises
+        ------
+        RuntimeError
+            If the widget is not frozen.
+        """
+        if self._freeze_count == 0:
+            raise RuntimeError("thaw() called without matching freeze()")
+        self._freeze_count -= 1
+        if self._freeze_count > 0:
+            return
+        controllers, self._frozen_controllers = self._frozen_controllers, []
+        with tracing.span("thaw", self, args={"controllers": len(controllers)}):
+            for controller in controllers:
+                if controller.is_frozen:
+                    controller.thaw()
+            self.setUpdatesEnabled(self._updates_enabled_before_freeze)
+
+    @contextmanager
+    def frozen(self) -> Iterator[None]:
+        """
+        Context manager around `freeze()` and `thaw()`.
+
+        Example
+        -------
+        >>> with form.frozen():
+        ...     for observable, value in dataset.items():
+        ...         observable.value = value
+        """
+        self.freeze()
+        try:
+            yield
+        finally:
+            self.thaw()
+
+    @property
+    def is_frozen(self) -> bool:
+        """Whether the widget tree is frozen by `freeze()`."""
+        return self._freeze_count > 0
+
+    def dispose_tree(self, *, delete_widget: bool = True) -> int:
+        """
+        Dispose of all controllers in this widget tree at once (see `BaseController.dispose_many`).
+
+        Much cheaper than letting every widget dispose its own controller when a large
+        form or window is torn down. The widgets themselves see their controllers as
+        disposed and only do the Qt cleanup.
+
+        Parameters
+        ----------
+        delete_widget : bool, optional
+            Schedule this widget for deletion afterwards. Defaults to True.
+
+        Returns
+        -------
+        int
+            The number of controllers that were disposed.
+        """
+        disposed_count = BaseController.dispose_many(self.controllers_in_tree())
+        if delete_widget:
+            self.deleteLater()
+        return disposed_count
@@ -4,7 +4,7 @@ Protocol and base class for layout payloads.
 A payload is any object that provides widgets to be laid out by a layout strategy.
 """
 
-from typing import Any, Sequence, Mapping
+from typing import Any, Sequence, Mapping, Literal, Optional
 from types import MappingProxyType
 from dataclasses import dataclass, fields
 
@@ -14,6 +14,92 @@ from integrated_widgets.controlled_widgets.base_controlled_widget import BaseCon
 from integrated_widgets.controllers.core.base_controller import BaseController
 
 
+_FieldKind = Literal["widget", "sequence", "mapping", "other"]
+
+_EMPTY_MAPPING: Mapping[Any, QWidget] = MappingProxyType({})
+
+# Caches shared by all payload classes. Payload classes are defined once per
+# process, so these stay small and are never evicted.
+_FIELD_NAMES_BY_CLASS: dict[type, tuple[str, ...]] = {}
+_KIND_BY_TYPE: dict[type, _FieldKind] = {}
+
+
+def _kind_of_type(value_type: type) -> _FieldKind:
+    """Classify a field value type the same way the discovery has always done it (cached per type)."""
+    kind = _KIND_BY_TYPE.get(value_type)
+    if kind is None:
+        # Check Mapping first (before Sequence, since some mappings might also match Sequence)
+        if issubclass(value_type, Mapping):
+            kind = "mapping"
+        # Check Sequence but exclude strings (strings are sequences too!)
+        elif issubclass(value_type, Sequence) and not issubclass(value_type, (str, bytes)):
+            kind = "sequence"
+        elif issubclass(value_type, (BaseControlledWidget, QWidget)):
+            kind = "widget"
+        else:
+            kind = "other"
+        _KIND_BY_TYPE[value_type] = kind
+    return kind
+
+
+@dataclass(frozen=True)
+class _PayloadPlan:
+    """
+    Pre-computed discovery plan for one payload class and one combination of field value types.
+
+    Records the positions of the scalar widget fields, the single sequence field and the
+    mapping fields, so that payload construction does not have to classify every field again.
+    """
+    widget_indices: tuple[int, ...]
+    sequence_index: Optional[int]
+    mapping_indices: tuple[int, ...]
+
+    @property
+    def has_collections(self) -> bool:
+        return self.sequence_index is not None or len(self.mapping_indices) > 0
+
+    @staticmethod
+    def build(field_types: tuple[type, ...]) -> "_PayloadPlan":
+        widget_indices: list[int] = []
+        mapping_indices: list[int] = []
+        sequence_index: Optional[int] = None
+        for index, value_type in enumerate(field_types):
+            kind = _kind_of_type(value_type)
+            if kind == "widget":
+                widget_indices.append(index)
+            elif kind == "mapping":
+                mapping_indices.append(index)
+            elif kind == "sequence":
+                if sequence_index is not None:
+                    raise ValueError("Only one sequence field is allowed")
+                sequence_index = index
+        return _PayloadPlan(tuple(widget_indices), sequence_index, tuple(mapping_indices))
+
+
+# Plans per payload class and field value types. Fields typed loosely (e.g. Any) can see
+# many value types, so the cache is bounded and simply cleared when it is full.
+_MAX_PLANS: int = 256
+_PLANS: dict[tuple[type, tuple[type, ...]], _PayloadPlan] = {}
+
+
+def _register_object(
+    obj: Any,
+    registered_controlled_widgets: set[BaseControlledWidget],
+    registered_controllers: set[BaseController[Any, Any]],
+    registered_widgets: set[QWidget]) -> None:
+    """Register object if it's a BaseControlledWidget, QWidget, or IQtControllerWidgetBase (extracts controller)."""
+    # Check if it's an IQtControllerWidgetBase and extract its controller
+    # Use getattr to safely check for _controller attribute without type errors
+    controller = getattr(obj, '_controller', None)
+    if isinstance(controller, BaseController):
+        registered_controllers.add(controller)  # type: ignore[arg-type]
+
+    if isinstance(obj, BaseControlledWidget):
+        registered_controlled_widgets.add(obj)
+    if isinstance(obj, QWidget):
+        registered_widgets.add(obj)
+
+
 @dataclass(frozen=True)
 class LayoutPayloadBase():
     """
@@ -112,65 +198,72 @@ class LayoutPayloadBase():
     ---------------
     Uses frozen=True for immutability but NOT slots=True, as we need to store
     internal attributes dynamically in __post_init__.
+
+    Field discovery is planned once per payload class (and per combination of field
+    value types) and cached. Payloads without sequence or mapping fields take a fast
+    path that only registers the scalar widget fields and shares empty collections.
     """
 
     def __post_init__(self) -> None:
         """Discover QWidget, BaseControlledWidget, and BaseController fields, create registries, and make collections immutable."""
 
+        cls = type(self)
+        field_names = _FIELD_NAMES_BY_CLASS.get(cls)
+        if field_names is None:
+            field_names = tuple(field_info.name for field_info in fields(self))
+            _FIELD_NAMES_BY_CLASS[cls] = field_names
+
+        field_values = tuple(getattr(self, name) for name in field_names)
+        field_types = tuple(type(value) for value in field_values)
+
+        # The plan only depends on the payload class and the types of its field values
+        plan = _PLANS.get((cls, field_types))
+        if plan is None:
+            plan = _PayloadPlan.build(field_types)
+            if len(_PLANS) >= _MAX_PLANS:
+                _PLANS.clear()
+            _PLANS[(cls, field_types)] = plan
+
         registered_controlled_widgets: set[BaseControlledWidget] = set()
         registered_controllers: set[BaseController[Any, Any]] = set()
         registered_widgets: set[QWidget] = set()
 
-        def register_object(obj: Any) -> None:
-            """Register object if it's a BaseControlledWidget, QWidget, or IQtControllerWidgetBase (extracts controller)."""
-            # Check if it's an IQtControllerWidgetBase and extract its controller
-            # Use getattr to safely check for _controller attribute without type errors
-            controller = getattr(obj, '_controller', None)
-            if isinstance(controller, BaseController):
-                registered_controllers.add(controller)  # type: ignore[arg-type]
-            
-            if isinstance(obj, BaseControlledWidget):
-                registered_controlled_widgets.add(obj)
-            if isinstance(obj, QWidget):
-                registered_widgets.add(obj)
+        # Scalar widget fields
+        for index in plan.widget_indices:
+            _register_object(field_values[index], registered_controlled_widgets, registered_controllers, registered_widgets)
+
+        if not plan.has_collections:
+            # Fast path: no sequence or mapping fields, share the empty collections
+            object.__setattr__(self, "_registered_controlled_widgets", registered_controlled_widgets)
+            object.__setattr__(self, "_registered_controllers", registered_controllers)
+            object.__setattr__(self, "_registered_widgets", registered_widgets)
+            object.__setattr__(self, "_list_of_widgets", ())
+            object.__setattr__(self, "_mapping_of_widgets", _EMPTY_MAPPING)
+            return
 
         list_of_widgets: list[QWidget] = []
         dict_of_widgets: dict[Any, QWidget] = {}
 
-        one_list_found = False
-
-        # Discover objects from fields
-        for field_info in fields(self):
+        # Mapping fields
+        for index in plan.mapping_indices:
+            for key, value in field_values[index].items(): # type: ignore
+                if isinstance(value, BaseControlledWidget):
+                    _register_object(value, registered_controlled_widgets, registered_controllers, registered_widgets)
+                    # For widget-specific collections, only add QWidgets
+                if isinstance(value, QWidget):
+                    if key not in dict_of_widgets:
+                        dict_of_widgets[key] = value
+                    else:
+                        raise ValueError(f"Duplicate key {key} in mapping of widgets")
 
-            field_value = getattr(self, field_info.name)
-
-            # Check Mapping first (before Sequence, since some mappings might also match Sequence)
-            if isinstance(field_value, Mapping):
-                for key, value in field_value.items(): # type: ignore
-                    if isinstance(value, BaseControlledWidget):
-                        register_object(value)
-                        # For widget-specific collections, only add QWidgets
-                    if isinstance(value, QWidget):
-                        if key not in dict_of_widgets:
-                            dict_of_widgets[key] = value
-                        else:
-                            raise ValueError(f"Duplicate key {key} in mapping of widgets")
-
-            # Check Sequence but exclude strings (strings are sequences too!)
-            elif isinstance(field_value, Sequence) and not isinstance(field_value, (str, bytes)):
-                if one_list_found:
-                    raise ValueError("Only one sequence field is allowed")
-                one_list_found = True
-                for item in field_value: # type: ignore
-                    if isinstance(item, BaseControlledWidget):
-                        register_object(item)
-                        # For widget-specific collections, only add QWidgets
-                    if isinstance(item, QWidget):
-                        list_of_widgets.append(item) # type: ignore
-
-            # Single field - register if it's a QWidget or BaseControlledWidget
-            elif isinstance(field_value, (BaseControlledWidget, QWidget)):
-                register_object(field_value)
+        # The single sequence field
+        if plan.sequence_index is not None:
+            for item in field_values[plan.sequence_index]: # type: ignore
+                if isinstance(item, BaseControlledWidget):
+                    _register_object(item, registered_controlled_widgets, registered_controllers, registered_widgets)
+                    # For widget-specific collections, only add QWidgets
+                if isinstance(item, QWidget):
+                    list_of_widgets.append(item) # type: ignore
 
         object.__setattr__(self, "_registered_controlled_widgets", registered_controlled_widgets)
         object.__setattr__(self, "_registered_controllers", registered_controllers)
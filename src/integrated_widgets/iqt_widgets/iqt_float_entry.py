@@ -10,7 +10,7 @@ from nexpy import default as nexpy_default
 
 from ..controllers.singleton.float_entry_controller import FloatEntryController
 from ..auxiliaries.default import default_debounce_ms
-from .foundation.iqt_singleton_controller_widget_base import IQtSingletonControllerWidgetBase
+from .foundation.iqt_singleton_controller_widget_base import IQtSingletonControllerWidgetBase, bool_validator
 from .foundation.layout_strategy_base import LayoutStrategyBase
 from .foundation.layout_payload_base import LayoutPayloadBase
 from ..controlled_widgets.controlled_line_edit import ControlledLineEdit
@@ -48,6 +48,7 @@ class IQtFloatEntry(IQtSingletonControllerWidgetBase[float, Controller_Payload,
         formatter: Callable[[float], str] = lambda x: str(x),
         layout_strategy: LayoutStrategyBase[Controller_Payload] = lambda payload, **_: payload.float_entry,
         debounce_ms: int|Callable[[], int] = default_debounce_ms,
+        keystroke_validation: bool = False,
         nexus_manager: NexusManager = nexpy_default.NEXUS_MANAGER,
         parent: Optional[QWidget] = None,
         logger: Optional[Logger] = None
@@ -65,6 +66,8 @@ class IQtFloatEntry(IQtSingletonControllerWidgetBase[float, Controller_Payload,
             Function to format the value for display. Default is str(value).
         layout_strategy : LayoutStrategyBase[Controller_Payload], optional
             Custom layout strategy for widget arrangement. Default is default layout.
+        keystroke_validation : bool, optional
+            Reject unparsable text while it is typed, and revert incomplete text when editing finishes. Default is False.
         parent : QWidget, optional
             The parent widget. Default is None.
         logger : Logger, optional
@@ -73,9 +76,10 @@ class IQtFloatEntry(IQtSingletonControllerWidgetBase[float, Controller_Payload,
 
         controller = FloatEntryController(
             value=value,
-            validator=validator,
+            custom_validator=None if validator is None else bool_validator(validator),
             formatter=formatter,
             debounce_ms=debounce_ms,
+            keystroke_validation=keystroke_validation,
             nexus_manager=nexus_manager,
             logger=logger
         )
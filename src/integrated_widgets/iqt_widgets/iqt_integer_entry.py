@@ -12,7 +12,7 @@ from ..controllers.singleton.integer_entry_controller import IntegerEntryControl
 from ..controlled_widgets.controlled_line_edit import ControlledLineEdit
 from ..controlled_widgets.controlled_qlabel import ControlledQLabel
 from ..auxiliaries.default import default_debounce_ms
-from .foundation.iqt_singleton_controller_widget_base import IQtSingletonControllerWidgetBase
+from .foundation.iqt_singleton_controller_widget_base import IQtSingletonControllerWidgetBase, bool_validator
 from .foundation.layout_strategy_base import LayoutStrategyBase
 from .foundation.layout_payload_base import LayoutPayloadBase
 
@@ -47,6 +47,7 @@ class IQtIntegerEntry(IQtSingletonControllerWidgetBase[int, Controller_Payload,
         formatter: Callable[[int], str] = lambda x: str(x),
         layout_strategy: LayoutStrategyBase[Controller_Payload] = lambda payload, **_: payload.integer_entry,
         debounce_ms: int|Callable[[], int] = default_debounce_ms,
+        keystroke_validation: bool = False,
         nexus_manager: NexusManager = nexpy_default.NEXUS_MANAGER,
         parent: Optional[QWidget] = None,
         logger: Optional[Logger] = None
@@ -66,6 +67,8 @@ class IQtIntegerEntry(IQtSingletonControllerWidgetBase[int, Controller_Payload,
             Custom layout strategy for widget arrangement. Default is default layout.
         debounce_ms: int|Callable[[], int] = default_debounce_ms,
         nexus_manager: NexusManager = nexpy_default.NEXUS_MANAGER,
+        keystroke_validation : bool, optional
+            Reject unparsable text while it is typed, and revert incomplete text when editing finishes. Default is False.
         parent : QWidget, optional
             The parent widget. Default is None.
         logger : Logger, optional
@@ -74,9 +77,10 @@ class IQtIntegerEntry(IQtSingletonControllerWidgetBase[int, Controller_Payload,
 
         controller = IntegerEntryController(
             value=value,
-            validator=validator,
+            custom_validator=None if validator is None else bool_validator(validator),
             formatter=formatter,
             debounce_ms=debounce_ms,
+            keystroke_validation=keystroke_validation,
             nexus_manager=nexus_manager,
             logger=logger
         )
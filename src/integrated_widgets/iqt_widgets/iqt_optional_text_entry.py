@@ -10,7 +10,7 @@ from nexpy import default as nexpy_default
 
 from ..controllers.singleton.optional_text_entry_controller import OptionalTextEntryController
 from ..auxiliaries.default import default_debounce_ms
-from .foundation.iqt_singleton_controller_widget_base import IQtSingletonControllerWidgetBase
+from .foundation.iqt_singleton_controller_widget_base import IQtSingletonControllerWidgetBase, bool_validator
 from .foundation.layout_strategy_base import LayoutStrategyBase
 from .foundation.layout_payload_base import LayoutPayloadBase
 from ..controlled_widgets.controlled_qlabel import ControlledQLabel
@@ -79,7 +79,7 @@ class IQtOptionalTextEntry(IQtSingletonControllerWidgetBase[Optional[str], Contr
 
         controller = OptionalTextEntryController(
             value=value,
-            validator=validator,
+            custom_validator=None if validator is None else bool_validator(validator),
             formatter=formatter,
             none_value=none_value,
             strip_whitespace=strip_whitespace,
@@ -76,6 +76,7 @@ class IQtRealUnitedScalarEntry(IQtCompositeControllerWidgetBase[Literal["value",
         allowed_dimensions: Optional[AbstractSet[Dimension]] = None,
         layout_strategy: LayoutStrategyBase[Controller_Payload] = lambda payload, **_: payload.real_united_scalar_label,
         debounce_ms: int|Callable[[], int] = default_debounce_ms,
+        keystroke_validation: bool = False,
         nexus_manager: NexusManager = nexpy_default.NEXUS_MANAGER,
         parent: Optional[QWidget] = None,
         logger: Optional[Logger] = None
@@ -101,6 +102,8 @@ class IQtRealUnitedScalarEntry(IQtCompositeControllerWidgetBase[Literal["value",
             Custom layout strategy for widget arrangement. If None, uses default vertical layout.
         debounce_ms: int|Callable[[], int] = default_debounce_ms,
         nexus_manager: NexusManager = nexpy_default.NEXUS_MANAGER,
+        keystroke_validation : bool, optional
+            Reject unparsable text while it is typed, and revert incomplete text when editing finishes. Default is False.
         parent : QWidget, optional
             The parent widget. Default is None.
         logger : Logger, optional
@@ -115,6 +118,7 @@ class IQtRealUnitedScalarEntry(IQtCompositeControllerWidgetBase[Literal["value",
             unit_options_sorter=unit_options_sorter,
             allowed_dimensions=allowed_dimensions,
             debounce_ms=debounce_ms,
+            keystroke_validation=keystroke_validation,
             nexus_manager=nexus_manager,
             logger=logger
         )
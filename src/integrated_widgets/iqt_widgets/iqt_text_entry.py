@@ -12,7 +12,7 @@ from integrated_widgets.controlled_widgets import ControlledLineEdit
 
 from ..controllers.singleton.text_entry_controller import TextEntryController
 from ..auxiliaries.default import default_debounce_ms
-from .foundation.iqt_singleton_controller_widget_base import IQtSingletonControllerWidgetBase
+from .foundation.iqt_singleton_controller_widget_base import IQtSingletonControllerWidgetBase, bool_validator
 from .foundation.layout_strategy_base import LayoutStrategyBase
 from .foundation.layout_payload_base import LayoutPayloadBase
 
@@ -77,7 +77,7 @@ class IQtTextEntry(IQtSingletonControllerWidgetBase[str, Controller_Payload, Tex
 
         controller = TextEntryController(
             value=value_or_hook_or_observable,
-            validator=validator,
+            custom_validator=None if validator is None else bool_validator(validator),
             formatter=formatter,
             strip_whitespace=strip_whitespace,
             debounce_ms=debounce_ms,
@@ -0,0 +1,429 @@
+"""
+IQtVirtualForm - Schema-driven, virtualized form of IQt entry widgets.
+
+Large parameter editors (thousands of rows) built from individual IQt widgets
+keep one controller, one payload and a handful of Qt widgets alive per row.
+IQtVirtualForm instead takes a declarative schema of typed fields, each bound
+to a nexpy hook or observable, and materializes controllers and widgets only
+for the rows that intersect the viewport.
+
+Row Lifecycle
+-------------
+- Offscreen rows exist only as their `FormField` entry, i.e. as the hook the
+  schema references. No controller, QObject or QWidget is bound to them.
+- When a row scrolls into view, a recycled row frame (label + editor slot) is
+  taken from a pool. The editor is taken from a per-kind editor pool as well
+  and rebound to the field's hook (see `IQtControllerWidgetBase.rebind`); a new
+  editor is only built when the pool is empty.
+- When a row scrolls out of view, its editor is detached from the row's hook
+  (rebound to a plain copy of its value) and goes back to the pool with the
+  row frame. Pooled editors stay alive, but follow no hook.
+- `close()` disposes all editors; showing the form again builds new ones.
+  `deleteLater()` disposes the form for good.
+
+Editors are pooled per kind and constructor arguments (``widget_kwargs``), so
+an editor is only reused for fields it could have been built for. Kinds with a
+custom factory but no binder are not pooled: their editors are disposed via
+`deleteLater()` when they leave the viewport.
+
+Example
+-------
+>>> from nexpy import XValue
+>>> fields = [
+...     FormField("Gain", "float", XValue(1.0)),
+...     FormField("Samples", "integer", XValue(100)),
+...     FormField("Name", "text", XValue("run-1")),
+...     FormField("Enabled", "check_box", XValue(True)),
+... ]
+>>> form = IQtVirtualForm(fields, row_height=28)
+>>> form.show()
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
+from logging import Logger
+from types import MappingProxyType
+from typing import Any, Callable, Literal, Mapping, Optional, Sequence
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QResizeEvent, QShowEvent
+from PySide6.QtWidgets import QAbstractScrollArea, QHBoxLayout, QLabel, QWidget
+
+from nexpy import Hook, XSingleValueProtocol
+from nexpy.core import SubmissionError
+
+from ..auxiliaries.resources import log_msg
+from .iqt_check_box import IQtCheckBox
+from .iqt_float_entry import IQtFloatEntry
+from .iqt_integer_entry import IQtIntegerEntry
+from .iqt_real_united_scalar_entry import IQtRealUnitedScalarEntry
+from .iqt_text_entry import IQtTextEntry
+
+FormFieldKind = Literal["float", "integer", "text", "check_box", "real_united_scalar"]
+
+
+@dataclass(frozen=True)
+class FormField:
+    """
+    Declarative description of one row of an IQtVirtualForm.
+
+    Parameters
+    ----------
+    label : str
+        Text shown in the label column.
+    kind : FormFieldKind
+        Which IQt editor to materialize for the row.
+    hook : Hook[Any] | XSingleValueProtocol[Any]
+        The hook or observable the editor binds to. This is the only object
+        the form keeps for a row while it is offscreen.
+    widget_kwargs : Mapping[str, Any], optional
+        Extra keyword arguments forwarded to the editor's constructor
+        (e.g. ``validator``, ``formatter`` or ``display_unit_options``).
+    """
+    label: str
+    kind: FormFieldKind
+    hook: Hook[Any] | XSingleValueProtocol[Any]
+    widget_kwargs: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
+
+
+EditorFactory = Callable[[FormField], QWidget]
+"""Builds a new editor for a field."""
+
+EditorBinder = Callable[[QWidget, FormField], None]
+"""
+Rebinds a pooled editor (built by the factory of the same kind) to another field.
+
+Also used to detach a released editor: the field's ``hook`` is then a plain value.
+"""
+
+_PoolKey = tuple[str, tuple[tuple[str, int], ...]]
+
+
+def _real_united_scalar_editor(form_field: FormField) -> QWidget:
+    kwargs = dict(form_field.widget_kwargs)
+    kwargs.setdefault("layout_strategy", lambda payload, **_: payload.real_united_scalar_line_edit) # type: ignore
+    return IQtRealUnitedScalarEntry(form_field.hook, **kwargs) # type: ignore
+
+
+DEFAULT_EDITOR_FACTORIES: Mapping[str, EditorFactory] = MappingProxyType({
+    "float": lambda f: IQtFloatEntry(f.hook, **f.widget_kwargs), # type: ignore
+    "integer": lambda f: IQtIntegerEntry(f.hook, **f.widget_kwargs), # type: ignore
+    "text": lambda f: IQtTextEntry(f.hook, **f.widget_kwargs), # type: ignore
+    "check_box": lambda f: IQtCheckBox(f.hook, **f.widget_kwargs), # type: ignore
+    "real_united_scalar": _real_united_scalar_editor,
+})
+
+
+def _rebind_singleton_editor(editor: QWidget, form_field: FormField) -> None:
+    editor.rebind(form_field.hook) # type: ignore
+
+
+DEFAULT_EDITOR_BINDERS: Mapping[str, EditorBinder] = MappingProxyType({
+    "float": _rebind_singleton_editor,
+    "integer": _rebind_singleton_editor,
+    "text": _rebind_singleton_editor,
+    "check_box": _rebind_singleton_editor,
+    "real_united_scalar": lambda editor, f: editor.rebind({"scalar_value": f.hook}), # type: ignore
+})
+
+
+def _pool_key(form_field: FormField) -> _PoolKey:
+    # Editors are interchangeable between fields with the same kind and the same constructor arguments
+    return form_field.kind, tuple(sorted((name, id(value)) for name, value in form_field.widget_kwargs.items()))
+
+
+class _FormRow(QWidget):
+    """Recyclable row frame: a fixed-width label and a slot for one editor."""
+
+    def __init__(self, label_width: int, parent: QWidget) -> None:
+        super().__init__(parent)
+        self._label = QLabel(self)
+        self._label.setFixedWidth(label_width)
+        self._layout = QHBoxLayout(self)
+        self._layout.setContentsMargins(4, 0, 4, 0)
+        self._layout.addWidget(self._label)
+        self._editor: Optional[QWidget] = None
+
+    @property
+    def editor(self) -> Optional[QWidget]:
+        return self._editor
+
+    def bind(self, label: str, editor: QWidget) -> None:
+        self._label.setText(label)
+        self._editor = editor
+        self._layout.addWidget(editor, 1)
+        editor.show()
+        self.show()
+
+    def release(self) -> Optional[QWidget]:
+        """Hide the frame for reuse and return its editor (hidden, but still alive)."""
+        editor = self._editor
+        self._editor = None
+        self.hide()
+        if editor is not None:
+            self._layout.removeWidget(editor)
+            editor.hide()
+        return editor
+
+
+class IQtVirtualForm(QAbstractScrollArea):
+    """
+    A scrollable form that only materializes IQt editors for visible rows.
+
+    All rows have the same fixed height, so the visible index range follows
+    directly from the scroll offset and no per-row geometry is stored. Row
+    frames and editors (with their controllers) are pooled and reused as the
+    user scrolls; a reused editor is rebound to the hook of its new row.
+
+    Properties:
+        schema: tuple[FormField, ...] - The rows of the form (read/write via set_schema)
+    """
+
+    def __init__(
+        self,
+        schema: Sequence[FormField],
+        *,
+        row_height: int = 28,
+        label_width: int = 160,
+        overscan_rows: int = 2,
+        editor_factories: Optional[Mapping[str, EditorFactory]] = None,
+        editor_binders: Optional[Mapping[str, EditorBinder]] = None,
+        parent: Optional[QWidget] = None,
+        logger: Optional[Logger] = None
+    ) -> None:
+        """
+        Initialize the virtual form.
+
+        Parameters
+        ----------
+        schema : Sequence[FormField]
+            The rows of the form, in display order.
+        row_height : int, optional
+            Fixed height of every row in pixels. Default is 28.
+        label_width : int, optional
+            Fixed width of the label column in pixels. Default is 160.
+        overscan_rows : int, optional
+            Number of extra rows materialized above and below the viewport to
+            keep scrolling smooth. Default is 2.
+        editor_factories : Mapping[str, EditorFactory], optional
+            Overrides or additions to DEFAULT_EDITOR_FACTORIES, keyed by field kind.
+        editor_binders : Mapping[str, EditorBinder], optional
+            Overrides or additions to DEFAULT_EDITOR_BINDERS, keyed by field kind. A kind
+            whose factory is overridden only keeps a default binder if it is given here again.
+        parent : QWidget, optional
+            The parent widget. Default is None.
+        logger : Logger, optional
+            Logger instance for debugging. Default is None.
+        """
+        super().__init__(parent)
+
+        if row_height <= 0:
+            raise ValueError(f"row_height must be positive, got {row_height}")
+        if overscan_rows < 0:
+            raise ValueError(f"overscan_rows must not be negative, got {overscan_rows}")
+
+        self._row_height = row_height
+        self._label_width = label_width
+        self._overscan_rows = overscan_rows
+        self._factories: dict[str, EditorFactory] = dict(DEFAULT_EDITOR_FACTORIES)
+        self._binders: dict[str, EditorBinder] = dict(DEFAULT_EDITOR_BINDERS)
+        if editor_factories is not None:
+            self._factories.update(editor_factories)
+            for kind in editor_factories:
+                self._binders.pop(kind, None)
+        if editor_binders is not None:
+            self._binders.update(editor_binders)
+        self._logger = logger
+
+        self._schema: tuple[FormField, ...] = ()
+        self._active_rows: dict[int, _FormRow] = {}
+        self._free_rows: list[_FormRow] = []
+        self._free_editors: dict[_PoolKey, list[QWidget]] = {}
+        # The constructor arguments of pooled editors, kept alive so the ids in the pool keys stay unique
+        self._pool_kwargs: dict[_PoolKey, Mapping[str, Any]] = {}
+        self._is_disposed: bool = False
+
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.verticalScrollBar().setSingleStep(row_height)
+
+        self.set_schema(schema)
+
+    ###########################################################################
+    # Public API
+    ###########################################################################
+
+    @property
+    def schema(self) -> tuple[FormField, ...]:
+        """Get the rows of the form."""
+        return self._schema
+
+    def set_schema(self, schema: Sequence[FormField]) -> None:
+        """
+        Replace the rows of the form.
+
+        Row frames and editors are kept for reuse.
+        """
+        for form_field in schema:
+            if form_field.kind not in self._factories:
+                raise ValueError(f"No editor factory for field kind '{form_field.kind}'")
+        self._release_all_rows()
+        self._schema = tuple(schema)
+        self._update_scroll_range()
+        self._update_visible_rows()
+
+    @property
+    def row_height(self) -> int:
+        """Get the fixed row height in pixels."""
+        return self._row_height
+
+    def pooled_editor_count(self) -> int:
+        """Get the number of editors waiting in the pool for reuse."""
+        return sum(len(editors) for editors in self._free_editors.values())
+
+    def materialized_rows(self) -> tuple[int, ...]:
+        """Get the indices of the rows that currently hold an editor, sorted."""
+        return tuple(sorted(self._active_rows))
+
+    def editor_at(self, index: int) -> Optional[QWidget]:
+        """Get the editor of a row, or None if the row is not materialized."""
+        row = self._active_rows.get(index)
+        return None if row is None else row.editor
+
+    def scroll_to_row(self, index: int) -> None:
+        """Scroll so that the given row is at the top of the viewport (as far as possible)."""
+        if not 0 <= index < len(self._schema):
+            raise IndexError(f"Row index {index} out of range")
+        self.verticalScrollBar().setValue(index * self._row_height)
+
+    def close(self) -> bool: # type: ignore
+        """Dispose all editors and close the form. Showing it again materializes new editors."""
+        self._release_all_rows()
+        self._dispose_pooled_editors()
+        return super().close()
+
+    def deleteLater(self) -> None: # type: ignore
+        """Dispose all materialized editors and schedule the form for deletion."""
+        self._dispose()
+        super().deleteLater()
+
+    ###########################################################################
+    # Qt overrides
+    ###########################################################################
+
+    def scrollContentsBy(self, dx: int, dy: int) -> None:
+        self._update_visible_rows()
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        super().resizeEvent(event)
+        self._update_scroll_range()
+        self._update_visible_rows()
+
+    def showEvent(self, event: QShowEvent) -> None:
+        super().showEvent(event)
+        self._update_visible_rows()
+
+    ###########################################################################
+    # Internal methods
+    ###########################################################################
+
+    def _update_scroll_range(self) -> None:
+        viewport_height = self.viewport().height()
+        total_height = len(self._schema) * self._row_height
+        scroll_bar = self.verticalScrollBar()
+        scroll_bar.setPageStep(viewport_height)
+        scroll_bar.setRange(0, max(0, total_height - viewport_height))
+
+    def _visible_range(self) -> range:
+        viewport_height = self.viewport().height()
+        if not self._schema or viewport_height <= 0:
+            return range(0)
+        offset = self.verticalScrollBar().value()
+        first = max(0, offset // self._row_height - self._overscan_rows)
+        last = min(len(self._schema) - 1, (offset + viewport_height) // self._row_height + self._overscan_rows)
+        return range(first, last + 1)
+
+    def _update_visible_rows(self) -> None:
+        if self._is_disposed:
+            return
+
+        visible = self._visible_range()
+
+        # Release rows that left the viewport first so their frames can be reused
+        for index in [index for index in self._active_rows if index not in visible]:
+            self._release_row(index)
+
+        offset = self.verticalScrollBar().value()
+        width = self.viewport().width()
+        for index in visible:
+            row = self._active_rows.get(index)
+            if row is None:
+                row = self._materialize_row(index)
+            row.setGeometry(0, index * self._row_height - offset, width, self._row_height)
+
+    def _materialize_row(self, index: int) -> _FormRow:
+        form_field = self._schema[index]
+        row = self._free_rows.pop() if self._free_rows else _FormRow(self._label_width, self.viewport())
+        editor = self._reuse_editor(form_field)
+        if editor is None:
+            editor = self._factories[form_field.kind](form_field)
+        row.bind(form_field.label, editor)
+        self._active_rows[index] = row
+        log_msg(self, "_materialize_row", self._logger, f"Materialized row {index} ({form_field.kind})")
+        return row
+
+    def _release_row(self, index: int) -> None:
+        row = self._active_rows.pop(index)
+        editor = row.release()
+        self._free_rows.append(row)
+        if editor is not None:
+            form_field = self._schema[index]
+            if form_field.kind in self._binders and self._detach_editor(editor, form_field):
+                key = _pool_key(form_field)
+                self._free_editors.setdefault(key, []).append(editor)
+                self._pool_kwargs[key] = form_field.widget_kwargs
+            else:
+                editor.deleteLater()
+        log_msg(self, "_release_row", self._logger, f"Released row {index}")
+
+    def _detach_editor(self, editor: QWidget, form_field: FormField) -> bool:
+        """Rebind a released editor to a plain copy of its field's value. Returns False if that fails."""
+        try:
+            self._binders[form_field.kind](editor, replace(form_field, hook=form_field.hook.value)) # type: ignore
+        except SubmissionError as error:
+            log_msg(self, "_detach_editor", self._logger, f"Could not detach released editor: {error}")
+            return False
+        return True
+
+    def _reuse_editor(self, form_field: FormField) -> Optional[QWidget]:
+        """Take an editor from the pool and rebind it to the field, or return None if there is none."""
+        editors = self._free_editors.get(_pool_key(form_field))
+        while editors:
+            editor = editors.pop()
+            try:
+                self._binders[form_field.kind](editor, form_field)
+            except SubmissionError as error:
+                # The editor rejects the field's value; a new editor will report it
+                log_msg(self, "_reuse_editor", self._logger, f"Could not rebind pooled editor: {error}")
+                editor.deleteLater()
+                continue
+            return editor
+        return None
+
+    def _dispose_pooled_editors(self) -> None:
+        for editors in self._free_editors.values():
+            for editor in editors:
+                editor.deleteLater()
+        self._free_editors.clear()
+        self._pool_kwargs.clear()
+
+    def _release_all_rows(self) -> None:
+        for index in list(self._active_rows):
+            self._release_row(index)
+
+    def _dispose(self) -> None:
+        if self._is_disposed:
+            return
+        self._release_all_rows()
+        self._dispose_pooled_editors()
+        self._is_disposed = True
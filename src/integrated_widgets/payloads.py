@@ -36,31 +36,50 @@ Available Payloads:
 All payload classes follow the naming convention: {WidgetName}Payload
 """
 
-# Entry Widget Payloads
-from .iqt_widgets.iqt_text_entry import Controller_Payload as TextEntryPayload
-from .iqt_widgets.iqt_optional_text_entry import Controller_Payload as OptionalTextEntryPayload
-from .iqt_widgets.iqt_float_entry import Controller_Payload as FloatEntryPayload
-from .iqt_widgets.iqt_integer_entry import Controller_Payload as IntegerEntryPayload
+from typing import TYPE_CHECKING
 
-# Selection Widget Payloads
-from .iqt_widgets.iqt_check_box import Controller_Payload as CheckBoxPayload
-from .iqt_widgets.iqt_combobox_select import Controller_Payload as ComboboxSelectPayload
-from .iqt_widgets.iqt_combobox_optional_select import Controller_Payload as ComboboxOptionalSelectPayload
-from .iqt_widgets.iqt_radio_buttons_select import Controller_Payload as RadioButtonsSelectPayload
-from .iqt_widgets.iqt_listview_single_optional_select import Controller_Payload as ListviewSingleOptionalSelectPayload
-from .iqt_widgets.iqt_double_list_selection import Controller_Payload as DoubleListSelectionPayload
+from .auxiliaries.lazy_imports import lazy_module_attributes
 
-# Display Widget Payloads
-from .iqt_widgets.iqt_display_value import Controller_Payload as DisplayValuePayload
-
-# Specialized Widget Payloads
-from .iqt_widgets.iqt_path_selector import Controller_Payload as PathSelectorPayload
-from .iqt_widgets.iqt_unit_entry import Controller_Payload as UnitEntryPayload
-from .iqt_widgets.iqt_real_united_scalar_entry import Controller_Payload as RealUnitedScalarEntryPayload
-
-# Range Widget Payloads
-from .iqt_widgets.iqt_range_slider import Controller_Payload as RangeSliderPayload
+if TYPE_CHECKING:
+    # Entry Widget Payloads
+    from .iqt_widgets.iqt_text_entry import Controller_Payload as TextEntryPayload
+    from .iqt_widgets.iqt_optional_text_entry import Controller_Payload as OptionalTextEntryPayload
+    from .iqt_widgets.iqt_float_entry import Controller_Payload as FloatEntryPayload
+    from .iqt_widgets.iqt_integer_entry import Controller_Payload as IntegerEntryPayload
+    # Selection Widget Payloads
+    from .iqt_widgets.iqt_check_box import Controller_Payload as CheckBoxPayload
+    from .iqt_widgets.iqt_combobox_select import Controller_Payload as ComboboxSelectPayload
+    from .iqt_widgets.iqt_combobox_optional_select import Controller_Payload as ComboboxOptionalSelectPayload
+    from .iqt_widgets.iqt_radio_buttons_select import Controller_Payload as RadioButtonsSelectPayload
+    from .iqt_widgets.iqt_listview_single_optional_select import Controller_Payload as ListviewSingleOptionalSelectPayload
+    from .iqt_widgets.iqt_double_list_selection import Controller_Payload as DoubleListSelectionPayload
+    # Display Widget Payloads
+    from .iqt_widgets.iqt_display_value import Controller_Payload as DisplayValuePayload
+    # Specialized Widget Payloads
+    from .iqt_widgets.iqt_path_selector import Controller_Payload as PathSelectorPayload
+    from .iqt_widgets.iqt_unit_entry import Controller_Payload as UnitEntryPayload
+    from .iqt_widgets.iqt_real_united_scalar_entry import Controller_Payload as RealUnitedScalarEntryPayload
+    # Range Widget Payloads
+    from .iqt_widgets.iqt_range_slider import Controller_Payload as RangeSliderPayload
 
+# Exported name -> (module, attribute); resolved on first access
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str]] = {
+    "TextEntryPayload": (".iqt_widgets.iqt_text_entry", "Controller_Payload"),
+    "OptionalTextEntryPayload": (".iqt_widgets.iqt_optional_text_entry", "Controller_Payload"),
+    "FloatEntryPayload": (".iqt_widgets.iqt_float_entry", "Controller_Payload"),
+    "IntegerEntryPayload": (".iqt_widgets.iqt_integer_entry", "Controller_Payload"),
+    "CheckBoxPayload": (".iqt_widgets.iqt_check_box", "Controller_Payload"),
+    "ComboboxSelectPayload": (".iqt_widgets.iqt_combobox_select", "Controller_Payload"),
+    "ComboboxOptionalSelectPayload": (".iqt_widgets.iqt_combobox_optional_select", "Controller_Payload"),
+    "RadioButtonsSelectPayload": (".iqt_widgets.iqt_radio_buttons_select", "Controller_Payload"),
+    "ListviewSingleOptionalSelectPayload": (".iqt_widgets.iqt_listview_single_optional_select", "Controller_Payload"),
+    "DoubleListSelectionPayload": (".iqt_widgets.iqt_double_list_selection", "Controller_Payload"),
+    "DisplayValuePayload": (".iqt_widgets.iqt_display_value", "Controller_Payload"),
+    "PathSelectorPayload": (".iqt_widgets.iqt_path_selector", "Controller_Payload"),
+    "UnitEntryPayload": (".iqt_widgets.iqt_unit_entry", "Controller_Payload"),
+    "RealUnitedScalarEntryPayload": (".iqt_widgets.iqt_real_united_scalar_entry", "Controller_Payload"),
+    "RangeSliderPayload": (".iqt_widgets.iqt_range_slider", "Controller_Payload"),
+}
 
 # Export all with easy-to-find names
 __all__ = [
@@ -85,3 +104,5 @@ __all__ = [
     # Range widgets
     "RangeSliderPayload",
 ]
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, globals(), _LAZY_ATTRIBUTES)
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from typing import Any, Sequence
+
 import pytest
-from PySide6.QtWidgets import QApplication
+from PySide6.QtWidgets import QApplication, QVBoxLayout, QWidget
 from pytestqt.qtbot import QtBot
 
+from integrated_widgets import IQtCheckBox, IQtIntegerEntry, IQtTextEntry
+from integrated_widgets.core import LayoutPayloadBase
+
 # Central debounce configuration for tests
 TEST_DEBOUNCE_MS = 10
 
@@ -35,6 +41,32 @@ def wait_for_debounce(qtbot: QtBot, timeout: int | None = None) -> None:
     qtbot.wait(timeout)
 
 
+@dataclass(frozen=True)
+class FormPayload(LayoutPayloadBase):
+    """A small form (text entry, check box and a list of integer entries) for widget tree tests."""
+    name: IQtTextEntry
+    enabled: IQtCheckBox
+    counts: list[IQtIntegerEntry]
+
+
+def build_form_payload(name: Any = "alpha", enabled: Any = False, counts: Sequence[Any] = (0, 1, 2)) -> FormPayload:
+    """Build a FormPayload from values or observables."""
+    return FormPayload(
+        name=IQtTextEntry(name),
+        enabled=IQtCheckBox(enabled),
+        counts=[IQtIntegerEntry(count) for count in counts],
+    )
+
+
+def vertical_layout(payload: LayoutPayloadBase, **layout_strategy_kwargs: Any) -> QWidget:
+    """Layout strategy that stacks all widgets of a payload vertically."""
+    widget = QWidget()
+    layout = QVBoxLayout(widget)
+    for child in payload.registered_widgets:
+        layout.addWidget(child)
+    return widget
+
+
 @pytest.fixture
 def mock_logger():
     """Create a mock logger for testing."""
@@ -0,0 +1,89 @@
+"""Tests for the undo/redo CommitJournal fed by controller commits."""
+
+from __future__ import annotations
+
+from nexpy import XValue
+
+from integrated_widgets import CommitJournal
+from integrated_widgets.controllers import FloatEntryController, TextEntryController
+
+
+def test_undo_and_redo_single_commits() -> None:
+    observable = XValue[float](1.0)
+    controller = FloatEntryController(observable, headless=True)
+    journal = CommitJournal(group_window_ms=0)
+    journal.attach([controller])
+
+    controller.submit(2.0)
+    journal.end_group()
+    controller.submit(3.0)
+
+    assert journal.undo_count == 2
+    assert journal.undo()[0]
+    assert observable.value == 2.0
+    assert journal.undo()[0]
+    assert observable.value == 1.0
+    assert not journal.undo()[0]
+
+    assert journal.redo()[0]
+    assert controller.value == 2.0
+    assert journal.redo_count == 1
+
+    controller.dispose()
+
+
+def test_commits_within_window_are_grouped() -> None:
+    text = TextEntryController("a", headless=True)
+    number = FloatEntryController(0.0, headless=True)
+    journal = CommitJournal(group_window_ms=10_000)
+    journal.attach([text, number])
+
+    text.submit("ab")
+    text.submit("abc")
+    number.submit(5.0)
+
+    assert journal.undo_count == 1
+    journal.undo()
+    assert text.value == "a"
+    assert number.value == 0.0
+
+    journal.redo()
+    assert text.value == "abc"
+    assert number.value == 5.0
+
+    text.dispose()
+    number.dispose()
+
+
+def test_new_commit_discards_redo_history() -> None:
+    controller = FloatEntryController(0.0, headless=True)
+    journal = CommitJournal(group_window_ms=0)
+    journal.attach([controller])
+
+    controller.submit(1.0)
+    journal.undo()
+    assert journal.can_redo
+
+    controller.submit(2.0)
+    assert not journal.can_redo
+
+    controller.dispose()
+
+
+def test_memory_budget_drops_oldest_entries() -> None:
+    controller = TextEntryController("", headless=True)
+    journal = CommitJournal(memory_budget_bytes=2_000, group_window_ms=0)
+    journal.attach([controller])
+
+    for index in range(50):
+        controller.submit("x" * 100 + str(index))
+        journal.end_group()
+
+    assert 0 < journal.undo_count < 50
+    assert journal.memory_usage <= 2_000
+
+    journal.detach([controller])
+    controller.submit("not recorded")
+    assert controller.commit_journal is None
+
+    controller.dispose()
@@ -0,0 +1,128 @@
+"""Tests for visibility-aware (deferred) widget invalidation."""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+import pytest
+from pytestqt.qtbot import QtBot
+from PySide6.QtWidgets import QWidget, QVBoxLayout
+
+from nexpy import XValue
+from integrated_widgets import default
+from integrated_widgets.controllers import TextEntryController
+from integrated_widgets.controlled_widgets._visibility_watcher import VisibilityWatcher, _WindowVisibilityWatcher
+from tests.conftest import TEST_DEBOUNCE_MS
+
+
+@pytest.fixture
+def defer_hidden_invalidation() -> Iterator[None]:
+    previous = default.DEFER_HIDDEN_INVALIDATION
+    default.DEFER_HIDDEN_INVALIDATION = True
+    yield
+    default.DEFER_HIDDEN_INVALIDATION = previous
+
+
+def _hosted_controller(qtbot: QtBot, observable: XValue[str]) -> tuple[TextEntryController, QWidget]:
+    controller = TextEntryController(observable, debounce_ms=TEST_DEBOUNCE_MS)
+    host = QWidget()
+    QVBoxLayout(host).addWidget(controller.widget_text_entry)
+    qtbot.addWidget(host)
+    host.show()
+    qtbot.waitExposed(host)
+    return controller, host
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_hidden_controller_defers_invalidation(qtbot: QtBot, defer_hidden_invalidation: None) -> None:
+    observable = XValue[str]("first")
+    controller, host = _hosted_controller(qtbot, observable)
+    qtbot.waitUntil(lambda: controller.widget_text_entry.text() == "first")
+
+    host.hide()
+    observable.value = "second"
+    observable.value = "third"
+    qtbot.wait(10)
+
+    assert controller.has_pending_invalidation
+    assert controller.widget_text_entry.text() == "first"
+
+    host.show()
+    assert not controller.has_pending_invalidation
+    assert controller.widget_text_entry.text() == "third"
+
+    controller.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_evaluate_flushes_pending_invalidation(qtbot: QtBot, defer_hidden_invalidation: None) -> None:
+    observable = XValue[str]("first")
+    controller, host = _hosted_controller(qtbot, observable)
+    qtbot.waitUntil(lambda: controller.widget_text_entry.text() == "first")
+
+    host.hide()
+    observable.value = "second"
+    qtbot.wait(10)
+    assert controller.has_pending_invalidation
+
+    # Reading the stale widget must not overwrite the newer model value
+    controller.evaluate(debounce_ms=0)
+    assert observable.value == "second"
+    assert controller.widget_text_entry.text() == "second"
+
+    controller.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_invalidation_not_deferred_by_default(qtbot: QtBot) -> None:
+    observable = XValue[str]("first")
+    controller = TextEntryController(observable, debounce_ms=TEST_DEBOUNCE_MS)
+
+    observable.value = "second"
+    qtbot.waitUntil(lambda: controller.widget_text_entry.text() == "second")
+    assert not controller.has_pending_invalidation
+
+    controller.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_widgets_of_a_window_share_one_window_filter(qtbot: QtBot, defer_hidden_invalidation: None) -> None:
+    observables = [XValue[str](f"value {index}") for index in range(5)]
+    controllers = [TextEntryController(observable, debounce_ms=TEST_DEBOUNCE_MS) for observable in observables]
+    host = QWidget()
+    layout = QVBoxLayout(host)
+    for controller in controllers:
+        layout.addWidget(controller.widget_text_entry)
+    qtbot.addWidget(host)
+    host.show()
+    qtbot.waitExposed(host)
+
+    host.hide()
+    for observable in observables:
+        observable.value = "changed"
+    qtbot.wait(10)
+
+    assert len(host.findChildren(_WindowVisibilityWatcher)) == 1
+    assert all(controller.has_pending_invalidation for controller in controllers)
+
+    host.showMinimized()
+    host.showNormal()
+    qtbot.waitUntil(lambda: all(controller.widget_text_entry.text() == "changed" for controller in controllers))
+
+    for controller in controllers:
+        controller.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_no_watchers_without_deferral(qtbot: QtBot) -> None:
+    observable = XValue[str]("first")
+    controller, host = _hosted_controller(qtbot, observable)
+
+    host.hide()
+    observable.value = "second"
+    qtbot.waitUntil(lambda: controller.widget_text_entry.text() == "second")
+
+    assert host.findChildren(VisibilityWatcher) == []
+    assert host.findChildren(_WindowVisibilityWatcher) == []
+
+    controller.dispose()
@@ -0,0 +1,62 @@
+"""Tests for bulk teardown of controllers and widget trees."""
+
+from __future__ import annotations
+
+import pytest
+from pytestqt.qtbot import QtBot
+
+from nexpy import XValue
+from integrated_widgets.controllers import ControllerBase, FloatEntryController, TextEntryController
+from integrated_widgets.core import IQtWidgetBase
+
+from tests.conftest import build_form_payload, vertical_layout
+
+
+def test_dispose_many_headless_detaches_hooks() -> None:
+    observable = XValue[str]("shared")
+    controllers = [TextEntryController(observable, headless=True) for _ in range(3)]
+
+    assert ControllerBase.dispose_many(controllers + controllers[:1]) == 3
+    assert all(controller._is_disposed for controller in controllers)
+
+    # The observable no longer drives the disposed controllers
+    observable.value = "changed"
+    assert all(controller.value == "shared" for controller in controllers)
+
+    # Already disposed controllers are skipped
+    assert ControllerBase.dispose_many(controllers) == 0
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_dispose_many_drops_pending_submission(qtbot: QtBot) -> None:
+    controller = FloatEntryController(1.0, debounce_ms=50)
+    controller.submit(2.0)
+
+    ControllerBase.dispose_many([controller])
+    qtbot.wait(100)
+
+    assert controller.value == 1.0
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_dispose_many_deletes_qt_objects(qtbot: QtBot) -> None:
+    controllers = [TextEntryController(f"text {index}") for index in range(3)]
+    destroyed: list[int] = []
+    for index, controller in enumerate(controllers):
+        controller.qt_object.destroyed.connect(lambda *_, index=index: destroyed.append(index))
+
+    ControllerBase.dispose_many(controllers)
+
+    qtbot.waitUntil(lambda: sorted(destroyed) == [0, 1, 2])
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_dispose_tree_collects_nested_controllers(qtbot: QtBot) -> None:
+    form = IQtWidgetBase(build_form_payload(), vertical_layout)
+    qtbot.addWidget(form)
+
+    controllers = form.controllers_in_tree()
+    assert len(controllers) == 5
+
+    assert form.dispose_tree() == 5
+    assert all(controller._is_disposed for controller in controllers)
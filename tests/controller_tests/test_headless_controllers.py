@@ -0,0 +1,78 @@
+"""Tests for controllers constructed with headless=True (no widgets, no Qt helper objects)."""
+
+from __future__ import annotations
+
+import pytest
+
+from nexpy import XValue
+from nexpy.core import SubmissionError
+
+from integrated_widgets.controllers import FloatEntryController, SingleSetSelectController
+
+
+def test_headless_singleton_commits_synchronously() -> None:
+    observable = XValue[float](1.0)
+    controller = FloatEntryController(observable, debounce_ms=500, headless=True)
+
+    assert controller.is_headless
+    controller.submit(2.5)
+
+    # No debounce timer: the value is committed before submit() returns
+    assert controller.value == 2.5
+    assert observable.value == 2.5
+
+    controller.dispose()
+
+
+def test_headless_singleton_runs_validators() -> None:
+    controller = FloatEntryController(
+        1.0,
+        custom_validator=lambda value: (value >= 0.0, "Value must not be negative"),
+        headless=True,
+    )
+
+    with pytest.raises(SubmissionError):
+        controller.submit(-1.0)
+    assert controller.value == 1.0
+
+    controller.dispose()
+
+
+def test_headless_controller_has_no_qt_objects() -> None:
+    controller = FloatEntryController(1.0, headless=True)
+
+    with pytest.raises(RuntimeError):
+        controller.qt_object
+    assert not hasattr(controller, "_line_edit")
+    assert not hasattr(controller, "_submit_timer")
+
+    controller.invalidate_widgets()  # dropped, must not fail
+    controller.evaluate()  # no widgets to read, must not fail
+    controller.dispose()
+
+
+def test_headless_dispose_isolates_hooks() -> None:
+    observable = XValue[float](1.0)
+    controller = FloatEntryController(observable, headless=True)
+    controller.dispose()
+
+    observable.value = 3.0
+    assert controller.value == 1.0
+
+
+def test_headless_composite_validates_and_commits() -> None:
+    controller = SingleSetSelectController(
+        "a",
+        {"a", "b"},
+        {"combobox"},
+        headless=True,
+    )
+
+    controller.submit_values({"selected_option": "b"})
+    assert controller.selected_option_hook.value == "b"
+
+    with pytest.raises(SubmissionError):
+        controller.submit_values({"selected_option": "c"}, raise_submission_error_flag=True)
+    assert controller.selected_option_hook.value == "b"
+
+    controller.dispose()
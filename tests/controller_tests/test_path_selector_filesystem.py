@@ -0,0 +1,131 @@
+"""Tests for the background filesystem check and directory completion of PathSelectorController."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from pytestqt.qtbot import QtBot
+
+from nexpy.core import SubmissionError
+
+from integrated_widgets.controllers import PathSelectorController
+from integrated_widgets.controllers.singleton._path_filesystem import DirectoryIndex, check_path, normalize_extensions
+
+
+def test_check_path(tmp_path: Path) -> None:
+    data_file = tmp_path / "data.json"
+    data_file.write_text("{}")
+
+    assert check_path(data_file, "file", normalize_extensions({".JSON"}))[0]
+    assert not check_path(data_file, "file", normalize_extensions("txt"))[0]
+    assert not check_path(data_file, "directory", None)[0]
+    assert check_path(tmp_path, "directory", None)[0]
+    assert not check_path(tmp_path / "missing.json", "file", None)[0]
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_existing_file_is_committed_after_check(qtbot: QtBot, tmp_path: Path) -> None:
+    data_file = tmp_path / "data.json"
+    data_file.write_text("{}")
+    controller = PathSelectorController(None, mode="file", allowed_file_extensions="json", check_filesystem=True)
+
+    controller.widget_path_entry.setText(str(data_file))
+    controller.widget_path_entry.editingFinished.emit()
+
+    qtbot.waitUntil(lambda: controller.value == data_file)
+    assert controller.path_check_message is None
+
+    controller.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_missing_file_is_rejected(qtbot: QtBot, tmp_path: Path) -> None:
+    controller = PathSelectorController(None, mode="file", check_filesystem=True)
+
+    controller.widget_path_entry.setText(str(tmp_path / "missing.txt"))
+    controller.widget_path_entry.editingFinished.emit()
+
+    qtbot.waitUntil(lambda: controller.path_check_message is not None)
+    assert controller.value is None
+    assert controller.widget_path_entry.text() == ""
+
+    controller.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_newer_input_supersedes_pending_check(qtbot: QtBot, tmp_path: Path) -> None:
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    controller = PathSelectorController(None, mode="directory", check_filesystem=True)
+
+    controller.widget_path_entry.setText(str(first))
+    controller.widget_path_entry.editingFinished.emit()
+    controller.widget_path_entry.setText(str(second))
+    controller.widget_path_entry.editingFinished.emit()
+
+    qtbot.waitUntil(lambda: not controller.is_checking_path)
+    assert controller.value == second
+
+    controller.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_submitted_paths_are_checked(qtbot: QtBot, tmp_path: Path) -> None:
+    data_file = tmp_path / "data.json"
+    data_file.write_text("{}")
+    controller = PathSelectorController(None, mode="file", check_filesystem=True)
+
+    controller.submit(tmp_path / "missing.json")
+    qtbot.waitUntil(lambda: controller.path_check_message is not None)
+    assert controller.value is None
+
+    controller.submit(data_file)
+    qtbot.waitUntil(lambda: controller.value == data_file)
+    assert controller.path_check_message is None
+
+    controller.dispose()
+
+
+def test_headless_submit_checks_synchronously(tmp_path: Path) -> None:
+    controller = PathSelectorController(None, mode="directory", check_filesystem=True, headless=True)
+
+    with pytest.raises(SubmissionError):
+        controller.submit(tmp_path / "missing")
+    assert controller.value is None
+
+    controller.submit(tmp_path)
+    assert controller.value == tmp_path
+
+    controller.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_relative_paths_are_not_completed(qtbot: QtBot, monkeypatch: pytest.MonkeyPatch) -> None:
+    controller = PathSelectorController(None, enable_completion=True)
+    requested: list[Path] = []
+    monkeypatch.setattr(controller._directory_index, "request", lambda directory, *_: requested.append(directory)) # type: ignore
+
+    controller.widget_path_entry.textEdited.emit("data.txt")
+    controller.widget_path_entry.textEdited.emit("./")
+    assert requested == []
+
+    controller.dispose()
+
+
+def test_directory_index_scans_and_caches(qtbot: QtBot, tmp_path: Path) -> None:
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.txt").write_text("")
+    index = DirectoryIndex(ttl_s=60.0)
+    listings: list[tuple[str, ...]] = []
+
+    assert index.lookup(tmp_path) is None
+    index.request(tmp_path, lambda func: func(), lambda directory, names: listings.append(names))
+
+    qtbot.waitUntil(lambda: len(listings) == 1)
+    names = index.lookup(tmp_path)
+    assert names is not None
+    assert "a.txt" in names
+    assert any(name.startswith("sub") and name != "sub" for name in names)
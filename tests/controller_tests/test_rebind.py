@@ -0,0 +1,88 @@
+"""Tests for rebinding controllers and controller widgets to different hooks."""
+
+from __future__ import annotations
+
+import pytest
+from pytestqt.qtbot import QtBot
+
+from nexpy import XValue
+from nexpy.core import SubmissionError
+
+from integrated_widgets import IQtFloatEntry, IQtTextEntry
+from integrated_widgets.auxiliaries import tracing
+from integrated_widgets.controllers import FloatEntryController, SingleSetSelectController
+from integrated_widgets.core import IQtControllerWidgetBase, start_tracing, stop_tracing
+
+
+def test_singleton_rebind_moves_to_new_observable() -> None:
+    first = XValue[float](1.0)
+    second = XValue[float](2.0)
+    controller = FloatEntryController(first, headless=True)
+
+    controller.rebind(second)
+    assert controller.value == 2.0
+
+    # Edits reach the new record only
+    controller.submit(3.0)
+    assert second.value == 3.0
+    assert first.value == 1.0
+
+    # A plain value detaches the controller
+    controller.rebind(5.0)
+    second.value = 4.0
+    assert controller.value == 5.0
+
+    controller.dispose()
+
+
+def test_rejected_rebind_raises() -> None:
+    controller = FloatEntryController(1.0, custom_validator=lambda value: (value >= 0.0, "Must not be negative"), headless=True)
+
+    with pytest.raises(SubmissionError):
+        controller.rebind(XValue[float](-1.0))
+    assert controller.value == 1.0
+
+    controller.dispose()
+
+
+def test_composite_rebind_applies_values_together() -> None:
+    first_options = XValue[frozenset[str]](frozenset({"a", "b"}))
+    controller = SingleSetSelectController("a", first_options.value_hook, {"combobox"}, headless=True)
+
+    # The new selection is only valid together with the new options
+    second_selected = XValue[str]("z")
+    second_options = XValue[frozenset[str]](frozenset({"y", "z"}))
+    controller.rebind({"selected_option": second_selected, "available_options": second_options})
+
+    assert controller.selected_option_hook.value == "z"
+    first_options.value = frozenset({"a", "b", "c"})
+    assert controller.available_options_hook.value == {"y", "z"}
+
+    with pytest.raises(ValueError):
+        controller.rebind({"unknown": 1})
+
+    controller.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_rebind_many_invalidates_each_controller_once(qtbot: QtBot) -> None:
+    name_entry = IQtTextEntry("first")
+    mass_entry = IQtFloatEntry(1.0)
+    qtbot.addWidget(name_entry)
+    qtbot.addWidget(mass_entry)
+    qtbot.wait(20)
+
+    tracer = start_tracing()
+    try:
+        IQtControllerWidgetBase.rebind_many({
+            name_entry: XValue[str]("second"),
+            mass_entry: XValue[float](2.0),
+        })
+        qtbot.wait(20)
+    finally:
+        stop_tracing()
+
+    assert name_entry.value == "second"
+    assert mass_entry.value == 2.0
+    requests = [event.subject for event in tracer.events() if event.name == "invalidation_requested"]
+    assert sorted(requests) == sorted([tracing.subject_id(name_entry.controller), tracing.subject_id(mass_entry.controller)])
@@ -0,0 +1,126 @@
+"""Tests for commit futures and awaitable submissions."""
+
+from __future__ import annotations
+
+from concurrent.futures import Future
+
+import pytest
+from pytestqt.qtbot import QtBot
+
+from nexpy.core import SubmissionError
+
+from integrated_widgets import run_async
+from integrated_widgets.controllers import FloatEntryController
+from tests.conftest import TEST_DEBOUNCE_MS
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_future_resolves_after_debounced_commit(qtbot: QtBot) -> None:
+    controller = FloatEntryController(1.0, debounce_ms=TEST_DEBOUNCE_MS)
+
+    future = controller.submit_values_future({"value": 2.0})
+    assert not future.done()
+    assert controller.value == 1.0
+
+    qtbot.waitUntil(future.done)
+    assert future.result() is None
+    assert controller.value == 2.0
+
+    controller.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_future_fails_with_submission_error(qtbot: QtBot) -> None:
+    controller = FloatEntryController(
+        1.0,
+        custom_validator=lambda value: (value >= 0.0, "Value must not be negative"),
+        debounce_ms=TEST_DEBOUNCE_MS,
+    )
+
+    future = controller.submit_values_future({"value": -1.0})
+    qtbot.waitUntil(future.done)
+
+    assert isinstance(future.exception(), SubmissionError)
+    assert controller.value == 1.0
+
+    controller.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_dispose_cancels_pending_future(qtbot: QtBot) -> None:
+    controller = FloatEntryController(1.0, debounce_ms=1_000)
+
+    future = controller.submit_values_future({"value": 2.0})
+    controller.dispose()
+
+    assert future.cancelled()
+
+
+def test_headless_future_is_resolved_immediately() -> None:
+    controller = FloatEntryController(1.0, headless=True)
+
+    future = controller.submit_values_future({"value": 3.0})
+
+    assert future.done()
+    assert controller.value == 3.0
+
+    controller.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_run_async_sequences_commits(qtbot: QtBot) -> None:
+    first = FloatEntryController(0.0, debounce_ms=TEST_DEBOUNCE_MS)
+    second = FloatEntryController(0.0, debounce_ms=TEST_DEBOUNCE_MS)
+
+    async def sequence() -> float:
+        await first.submit_async(1.0)
+        assert first.value == 1.0
+        await second.submit_async(first.value + 1.0)
+        return second.value
+
+    assert run_async(sequence()) == 2.0
+
+    first.dispose()
+    second.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_future_is_cancelled_while_blocked_for_batch_submission(qtbot: QtBot) -> None:
+    controller = FloatEntryController(1.0, debounce_ms=TEST_DEBOUNCE_MS)
+
+    controller._is_blocked_for_batch_submission = True # type: ignore
+    try:
+        blocked = controller.submit_values_future({"value": 2.0})
+    finally:
+        controller._is_blocked_for_batch_submission = False # type: ignore
+    assert blocked.cancelled()
+
+    # Staged before the block, but the timer fires during it
+    staged = controller.submit_values_future({"value": 3.0})
+    controller._is_blocked_for_batch_submission = True # type: ignore
+    try:
+        qtbot.waitUntil(staged.done)
+    finally:
+        controller._is_blocked_for_batch_submission = False # type: ignore
+    assert staged.cancelled()
+    assert controller.value == 1.0
+
+    controller.dispose()
+
+
+def test_future_submitted_during_commit_is_resolved() -> None:
+    controller = FloatEntryController(1.0, headless=True)
+    futures: list[Future[None]] = []
+
+    def submit_again() -> None:
+        if not futures:
+            futures.append(controller.submit_values_future({"value": 5.0}))
+
+    controller.set_content_changed_notifier(submit_again)
+    controller.submit(2.0)
+
+    assert len(futures) == 1
+    assert futures[0].done() and not futures[0].cancelled()
+    assert controller.value == 5.0
+
+    controller.dispose()
@@ -0,0 +1,62 @@
+"""Tests for freezing widget trees during bulk programmatic updates."""
+
+from __future__ import annotations
+
+import pytest
+from pytestqt.qtbot import QtBot
+
+from nexpy import XValue
+from integrated_widgets import IQtTextEntry
+from integrated_widgets.auxiliaries import tracing
+from integrated_widgets.core import IQtWidgetBase, start_tracing, stop_tracing
+
+from tests.conftest import build_form_payload, vertical_layout
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_thaw_invalidates_each_dirty_controller_once(qtbot: QtBot) -> None:
+    name = XValue[str]("first")
+    counts = [XValue[int](index) for index in range(3)]
+    payload = build_form_payload(name, counts=counts)
+    name_entry, count_entries = payload.name, payload.counts
+    form = IQtWidgetBase(payload, vertical_layout)
+    qtbot.addWidget(form)
+    form.show()
+    qtbot.wait(20)
+
+    tracer = start_tracing()
+    try:
+        with form.frozen():
+            assert not form.updatesEnabled()
+            for round_index in range(5):
+                name.value = f"name {round_index}"
+                counts[0].value = 100 + round_index
+            qtbot.wait(20)
+            assert form.is_frozen
+        qtbot.wait(20)
+    finally:
+        stop_tracing()
+
+    assert form.updatesEnabled()
+    assert name_entry.controller.widget_text_entry.text() == "name 4"
+    assert count_entries[0].controller.widget_integer_entry.text() == "104"
+
+    invalidated = [event.subject for event in tracer.events() if event.name == "invalidate"]
+    expected = [tracing.subject_id(name_entry.controller), tracing.subject_id(count_entries[0].controller)]
+    assert sorted(invalidated) == sorted(expected)
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_freeze_nests_and_unmatched_thaw_raises(qtbot: QtBot) -> None:
+    entry = IQtTextEntry("text")
+    qtbot.addWidget(entry)
+
+    entry.freeze()
+    entry.freeze()
+    entry.thaw()
+    assert entry.is_frozen and entry.controller.is_frozen
+    entry.thaw()
+    assert not entry.is_frozen and not entry.controller.is_frozen
+
+    with pytest.raises(RuntimeError):
+        entry.thaw()
@@ -0,0 +1,138 @@
+"""Tests for IQtVirtualForm row materialization and recycling."""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+# Ensure QApplication exists before importing widgets
+app = QApplication.instance() or QApplication(sys.argv)
+
+from nexpy import XValue
+
+from integrated_widgets import FormField, IQtFloatEntry, IQtVirtualForm
+
+
+def _make_form(count: int) -> tuple[IQtVirtualForm, list[XValue[float]]]:
+    values = [XValue(float(i)) for i in range(count)]
+    fields = [FormField(f"Value {i}", "float", value) for i, value in enumerate(values)]
+    form = IQtVirtualForm(fields, row_height=20, overscan_rows=1)
+    form.resize(300, 200)
+    form.show()
+    app.processEvents()
+    return form, values
+
+
+def test_only_visible_rows_are_materialized() -> None:
+    form, _ = _make_form(5000)
+
+    rows = form.materialized_rows()
+    assert rows[0] == 0
+    assert len(rows) <= 200 // 20 + 2 * 1 + 1
+    assert form.editor_at(4999) is None
+
+    form.close()
+
+
+def test_scrolling_recycles_rows() -> None:
+    form, _ = _make_form(5000)
+    frames_before = len(form._active_rows) + len(form._free_rows) # type: ignore
+
+    form.scroll_to_row(2500)
+    app.processEvents()
+
+    rows = form.materialized_rows()
+    assert 2500 in rows
+    assert 0 not in rows
+    assert len(form._active_rows) + len(form._free_rows) == frames_before # type: ignore
+
+    form.close()
+
+
+def test_offscreen_rows_stay_bound_to_hooks() -> None:
+    form, values = _make_form(1000)
+
+    values[900].value = 42.0
+    form.scroll_to_row(900)
+    app.processEvents()
+
+    editor = form.editor_at(900)
+    assert editor is not None
+    assert editor.value == 42.0 # type: ignore
+
+    form.close()
+
+
+def test_unknown_kind_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        IQtVirtualForm([FormField("Bad", "nope", XValue(1.0))]) # type: ignore
+
+
+def test_scrolling_reuses_and_rebinds_editors() -> None:
+    form, values = _make_form(5000)
+    editors_before = {id(form.editor_at(index)) for index in form.materialized_rows()}
+
+    form.scroll_to_row(2500)
+    app.processEvents()
+
+    rows = form.materialized_rows()
+    assert {id(form.editor_at(index)) for index in rows} <= editors_before
+    editor = form.editor_at(2500)
+    assert editor.value == 2500.0 # type: ignore
+
+    # The reused editor is bound to its new row only
+    values[2500].value = -1.0
+    assert editor.value == -1.0 # type: ignore
+    editor.value = 7.0 # type: ignore
+    assert values[2500].value == 7.0
+    assert values[0].value == 0.0
+
+    form.close()
+
+
+def test_custom_factory_without_binder_is_not_pooled() -> None:
+    values = [XValue(float(i)) for i in range(200)]
+    fields = [FormField(f"Value {i}", "float", value) for i, value in enumerate(values)]
+    form = IQtVirtualForm(fields, row_height=20, editor_factories={"float": lambda f: IQtFloatEntry(f.hook)})
+    form.resize(300, 200)
+    form.show()
+    app.processEvents()
+
+    form.scroll_to_row(150)
+    app.processEvents()
+    assert form.pooled_editor_count() == 0
+
+    form.close()
+
+
+def test_released_editor_no_longer_follows_its_row() -> None:
+    form, values = _make_form(100)
+    editor = form.editor_at(0)
+    assert editor is not None
+
+    # An empty schema releases all editors into the pool
+    form.set_schema([])
+    assert form.pooled_editor_count() > 0
+
+    values[0].value = -5.0
+    assert editor.value == 0.0 # type: ignore
+    editor.value = 3.0 # type: ignore
+    assert values[0].value == -5.0
+
+    form.close()
+
+
+def test_closed_form_can_be_shown_again() -> None:
+    form, _ = _make_form(100)
+    form.close()
+    assert form.materialized_rows() == ()
+    assert form.pooled_editor_count() == 0
+
+    form.show()
+    app.processEvents()
+    assert form.materialized_rows()[0] == 0
+    assert form.editor_at(0).value == 0.0 # type: ignore
+
+    form.close()
@@ -0,0 +1,113 @@
+"""Tests for LayoutPayloadBase field discovery and its per-class plan cache."""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+
+import pytest
+from PySide6.QtWidgets import QApplication, QLabel, QPushButton, QWidget
+
+# Ensure QApplication exists before importing widgets
+app = QApplication.instance() or QApplication(sys.argv)
+
+from integrated_widgets.controllers import TextEntryController
+from integrated_widgets.controlled_widgets import ControlledLineEdit
+from integrated_widgets.iqt_widgets.foundation import layout_payload_base
+from integrated_widgets.iqt_widgets.foundation.layout_payload_base import LayoutPayloadBase
+from integrated_widgets.iqt_widgets.iqt_text_entry import IQtTextEntry
+
+
+@dataclass(frozen=True)
+class _ScalarPayload(LayoutPayloadBase):
+    title: str
+    label: QLabel
+    entry: ControlledLineEdit
+
+
+@dataclass(frozen=True)
+class _CollectionPayload(LayoutPayloadBase):
+    buttons: list[QWidget]
+    options: dict[str, QWidget]
+
+
+def test_scalar_payload_uses_fast_path() -> None:
+    controller = TextEntryController("hello")
+    label = QLabel("Name")
+    payload = _ScalarPayload(title="Form", label=label, entry=controller.widget_text_entry)
+
+    assert payload.registered_widgets == {label, controller.widget_text_entry}
+    assert payload.registered_controlled_widgets == {controller.widget_text_entry}
+    assert payload.registered_controllers == {controller}
+    assert payload.list_of_widgets == ()
+    assert dict(payload.mapping_of_widgets) == {}
+
+    controller.dispose()
+
+
+def test_plan_is_computed_once_per_class() -> None:
+    first = _ScalarPayload(title="A", label=QLabel(), entry=TextEntryController("a").widget_text_entry)
+    plans_before = len(layout_payload_base._PLANS) # type: ignore
+    second = _ScalarPayload(title="B", label=QLabel(), entry=TextEntryController("b").widget_text_entry)
+
+    assert len(layout_payload_base._PLANS) == plans_before # type: ignore
+    assert first.registered_widgets.isdisjoint(second.registered_widgets)
+
+
+def test_plan_cache_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(layout_payload_base, "_MAX_PLANS", 2)
+    monkeypatch.setattr(layout_payload_base, "_PLANS", {})
+    label = QLabel()
+    controller = TextEntryController("a")
+    entry = controller.widget_text_entry
+
+    # Each title of a new str subclass is a new combination of field value types
+    for index in range(5):
+        title_type = type(f"_Title{index}", (str,), {})
+        _ScalarPayload(title=title_type("Form"), label=label, entry=entry)
+        assert len(layout_payload_base._PLANS) <= 2 # type: ignore
+
+    controller.dispose()
+
+
+def test_collection_payload_discovery() -> None:
+    buttons: list[QWidget] = [QPushButton("OK"), QPushButton("Cancel")]
+    options: dict[str, QWidget] = {"a": QLabel("A"), "b": QLabel("B")}
+    payload = _CollectionPayload(buttons=buttons, options=options)
+
+    assert payload.list_of_widgets == tuple(buttons)
+    assert dict(payload.mapping_of_widgets) == options
+    with pytest.raises(TypeError):
+        payload.mapping_of_widgets["c"] = QLabel("C") # type: ignore
+
+
+def test_nested_controller_widget_registers_controller() -> None:
+    @dataclass(frozen=True)
+    class _NestedPayload(LayoutPayloadBase):
+        text: QWidget
+
+    text_widget = IQtTextEntry("nested")
+    payload = _NestedPayload(text=text_widget)
+
+    assert payload.registered_controllers == {text_widget.controller}
+    assert payload.registered_widgets == {text_widget}
+
+
+def test_only_one_sequence_field_allowed() -> None:
+    @dataclass(frozen=True)
+    class _TwoSequencesPayload(LayoutPayloadBase):
+        first: list[QWidget]
+        second: tuple[QWidget, ...]
+
+    with pytest.raises(ValueError):
+        _TwoSequencesPayload(first=[QLabel()], second=(QLabel(),))
+
+
+def test_duplicate_mapping_keys_rejected() -> None:
+    @dataclass(frozen=True)
+    class _TwoMappingsPayload(LayoutPayloadBase):
+        first: dict[str, QWidget]
+        second: dict[str, QWidget]
+
+    with pytest.raises(ValueError):
+        _TwoMappingsPayload(first={"x": QLabel()}, second={"x": QLabel()})
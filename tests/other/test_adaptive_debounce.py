@@ -0,0 +1,59 @@
+"""Tests for the adaptive debounce policy driven by measured commit cost."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from integrated_widgets import AdaptiveDebounce
+from integrated_widgets.controllers import FloatEntryController
+
+
+def test_delay_follows_moving_average_within_bounds() -> None:
+    debounce = AdaptiveDebounce(min_ms=5, max_ms=100, cost_factor=2.0, smoothing=0.5)
+    assert debounce() == 5
+
+    debounce.record_commit(10.0)
+    assert debounce() == 20
+    debounce.record_commit(30.0)  # average 20 ms
+    assert debounce() == 40
+
+    for _ in range(10):
+        debounce.record_commit(1_000.0)
+    assert debounce() == 100
+
+    for _ in range(50):
+        debounce.record_commit(0.0)
+    assert debounce() == 5
+
+
+def test_invalid_parameters() -> None:
+    with pytest.raises(ValueError):
+        AdaptiveDebounce(min_ms=10, max_ms=5)
+    with pytest.raises(ValueError):
+        AdaptiveDebounce(smoothing=0.0)
+
+
+def test_controller_feeds_commit_cost() -> None:
+    def slow_validator(value: float) -> tuple[bool, str]:
+        time.sleep(0.01)
+        return True, "Value is valid"
+
+    debounce = AdaptiveDebounce(min_ms=0, max_ms=1_000, cost_factor=1.0)
+    controller = FloatEntryController(1.0, custom_validator=slow_validator, debounce_ms=debounce, headless=True)
+
+    controller.submit(2.0)
+    diagnostics = controller.debounce_diagnostics()
+
+    assert diagnostics["samples"] == 1
+    assert diagnostics["last_commit_ms"] >= 10.0
+    assert diagnostics["debounce_ms"] >= 10
+
+    controller.dispose()
+
+
+def test_fixed_debounce_diagnostics() -> None:
+    controller = FloatEntryController(1.0, debounce_ms=75, headless=True)
+    assert controller.debounce_diagnostics() == {"debounce_ms": 75, "last_commit_ms": None, "commits": 0, "elided_commits": 0}
+    controller.dispose()
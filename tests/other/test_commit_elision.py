@@ -0,0 +1,101 @@
+"""Tests for eliding commits of unchanged values."""
+
+from __future__ import annotations
+
+import math
+from typing import Iterator
+
+import pytest
+from pytestqt.qtbot import QtBot
+
+from nexpy import XValue
+from integrated_widgets import default
+from integrated_widgets.auxiliaries import equality
+from integrated_widgets.auxiliaries.equality import register_value_equality, values_equal
+from integrated_widgets.controllers import FloatEntryController, SingleSetSelectController, TextEntryController
+
+
+@pytest.fixture(autouse=True)
+def elide_unchanged_commits() -> Iterator[None]:
+    previous = default.ELIDE_UNCHANGED_COMMITS
+    default.ELIDE_UNCHANGED_COMMITS = True
+    yield
+    default.ELIDE_UNCHANGED_COMMITS = previous
+
+
+def test_values_equal_is_type_aware() -> None:
+    assert not values_equal(0.1 + 0.2, 0.3)
+    assert values_equal(math.nan, math.nan)
+    assert not values_equal(1.0, 1.1)
+    assert not values_equal(1, 1.0)
+    assert not values_equal(True, 1)
+    assert values_equal({"a", "b"}, frozenset({"b", "a"}))
+    assert not values_equal({"a"}, {"a", "b"})
+    assert values_equal("text", "text")
+
+
+def test_registered_equality() -> None:
+    class CaseInsensitive(str):
+        pass
+
+    register_value_equality(CaseInsensitive, lambda a, b: a.lower() == b.lower())
+    assert values_equal(CaseInsensitive("Abc"), CaseInsensitive("aBC"))
+
+
+def test_float_tolerance_is_opt_in(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(equality, "FLOAT_REL_TOL", 1e-12)
+    assert values_equal(0.1 + 0.2, 0.3)
+    assert not values_equal(1.0, 1.0 + 1e-9)
+
+
+def test_unchanged_submission_is_elided() -> None:
+    observable = XValue[float](1.5)
+    controller = FloatEntryController(observable, headless=True)
+
+    controller.submit(1.5)
+    controller.submit(1.5 + 1e-15)
+    controller.submit(2.0)
+
+    assert observable.value == 2.0
+    diagnostics = controller.debounce_diagnostics()
+    assert diagnostics["commits"] == 2
+    assert diagnostics["elided_commits"] == 1
+
+    controller.dispose()
+
+
+def test_option_sets_use_set_equality() -> None:
+    controller = SingleSetSelectController("a", frozenset({"a", "b"}), {"combobox"}, headless=True)
+
+    controller.submit_primary_values({"available_options": {"b", "a"}})
+    assert controller.debounce_diagnostics()["elided_commits"] == 1
+
+    controller.dispose()
+
+
+def test_elision_can_be_disabled_and_customized() -> None:
+    controller = TextEntryController("text", headless=True)
+
+    controller.set_value_equality(lambda current, new: current.lower() == new.lower())
+    controller.submit("TEXT")
+    assert controller.value == "text"
+
+    default.ELIDE_UNCHANGED_COMMITS = False
+    controller.submit("text")
+    assert controller.debounce_diagnostics()["commits"] == 1
+
+    controller.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_focus_out_of_unedited_field_commits_nothing(qtbot: QtBot) -> None:
+    controller = TextEntryController("text", debounce_ms=10)
+    qtbot.wait(20)
+
+    controller.evaluate()
+    qtbot.wait(30)
+
+    assert controller.debounce_diagnostics()["commits"] == 0
+    assert controller.debounce_diagnostics()["elided_commits"] == 1
+
+    controller.dispose()
@@ -0,0 +1,83 @@
+"""Tests for the cached commit plans of controllers."""
+
+from __future__ import annotations
+
+import pytest
+from pytestqt.qtbot import QtBot
+
+from nexpy import XValue
+from integrated_widgets.controllers import FloatEntryController, SingleSetSelectController
+from tests.conftest import TEST_DEBOUNCE_MS, wait_for_debounce
+
+
+def test_commit_plan_is_reused_per_key_set() -> None:
+    controller = FloatEntryController(1.0, headless=True)
+
+    controller.submit(2.0)
+    plan = controller._commit_plan({"value": 3.0})
+    controller.submit(3.0)
+
+    assert controller._commit_plan({"value": 4.0}) is plan
+    assert controller.value == 3.0
+
+    controller.dispose()
+
+
+def test_commit_plan_follows_join_and_isolate() -> None:
+    controller = FloatEntryController(1.0, headless=True)
+    controller.submit(2.0)
+
+    other = XValue[float](2.0)
+    controller.value_hook.join(other.value_hook, initial_sync_mode="use_target_value") # type: ignore
+    controller.submit(3.0)
+    assert other.value == 3.0
+
+    controller.value_hook.isolate()
+    controller.submit(4.0)
+    assert controller.value == 4.0
+    assert other.value == 3.0
+
+    controller.dispose()
+
+
+def test_commit_plan_survives_rebind() -> None:
+    controller = FloatEntryController(1.0, headless=True)
+    controller.submit(2.0)
+    plan = controller._commit_plan({"value": 3.0})
+
+    target = XValue[float](5.0)
+    controller.rebind(target)
+    assert controller._commit_plan({"value": 6.0}) is plan
+
+    controller.submit(6.0)
+    assert target.value == 6.0
+
+    controller.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_staged_values_are_copied(qtbot: QtBot) -> None:
+    controller = FloatEntryController(1.0, debounce_ms=TEST_DEBOUNCE_MS)
+    values = {"value": 2.0}
+
+    controller._submit_values_debounced(values) # type: ignore
+    values["value"] = 3.0
+    wait_for_debounce(qtbot)
+
+    assert controller.value == 2.0
+
+    controller.dispose()
+
+
+def test_composite_plans_per_key_set() -> None:
+    controller = SingleSetSelectController("a", frozenset({"a", "b"}), {"combobox"}, headless=True)
+    controller.submit_primary_values({"selected_option": "b", "available_options": frozenset({"a", "b", "c"})})
+    controller.submit_primary_values({"selected_option": "c"})
+
+    assert set(controller._commit_plans) == {
+        ("selected_option", "available_options"),
+        ("selected_option",),
+    }
+    assert controller.selected_option_hook.value == "c"
+
+    controller.dispose()
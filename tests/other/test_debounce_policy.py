@@ -0,0 +1,106 @@
+"""Tests for debounce policies (leading edge, trailing edge, max wait)."""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+import pytest
+from PySide6.QtCore import QTimer
+from pytestqt.qtbot import QtBot
+
+from integrated_widgets import DebouncePolicy, default
+from integrated_widgets.controllers import FloatEntryController
+
+
+@pytest.fixture
+def restore_debounce_policy() -> Iterator[None]:
+    previous = default.DEBOUNCE_POLICY
+    yield
+    default.DEBOUNCE_POLICY = previous
+
+
+def test_invalid_policies() -> None:
+    with pytest.raises(ValueError):
+        DebouncePolicy(leading=False, trailing=False)
+    with pytest.raises(ValueError):
+        DebouncePolicy(max_wait_ms=-1)
+    assert DebouncePolicy(delay_ms=40)() == 40
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_max_wait_commits_during_sustained_input(qtbot: QtBot) -> None:
+    controller = FloatEntryController(0.0, debounce_ms=DebouncePolicy(delay_ms=200, max_wait_ms=150))
+
+    counter = [0]
+    def type_next_value() -> None:
+        counter[0] += 1
+        controller.submit(float(counter[0]))
+
+    # A change every 20 ms never leaves the 200 ms delay quiet
+    typing = QTimer()
+    typing.setInterval(20)
+    typing.timeout.connect(type_next_value)
+    typing.start()
+
+    qtbot.waitUntil(lambda: controller.value != 0.0, timeout=1_000)
+    assert typing.isActive()
+
+    typing.stop()
+    qtbot.waitUntil(lambda: controller.value == float(counter[0]), timeout=1_000)
+    controller.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_leading_edge_commits_first_change_immediately(qtbot: QtBot) -> None:
+    controller = FloatEntryController(0.0, debounce_ms=DebouncePolicy(delay_ms=100, leading=True))
+
+    controller.submit(1.0)
+    assert controller.value == 1.0
+
+    # Later changes of the burst are committed on the trailing edge
+    controller.submit(2.0)
+    assert controller.value == 1.0
+    qtbot.waitUntil(lambda: controller.value == 2.0, timeout=1_000)
+    controller.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_leading_only_drops_rest_of_burst(qtbot: QtBot) -> None:
+    controller = FloatEntryController(0.0, debounce_ms=DebouncePolicy(delay_ms=50, leading=True, trailing=False))
+
+    controller.submit(1.0)
+    controller.submit(2.0)
+    qtbot.wait(150)
+    assert controller.value == 1.0
+
+    # The next burst starts with a leading commit again
+    controller.submit(3.0)
+    assert controller.value == 3.0
+    controller.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_global_policy_keeps_controller_delay(qtbot: QtBot, restore_debounce_policy: None) -> None:
+    default.DEBOUNCE_POLICY = DebouncePolicy(leading=True)
+    controller = FloatEntryController(0.0, debounce_ms=100)
+
+    controller.submit(1.0)
+    assert controller.value == 1.0
+    assert controller.debounce_diagnostics()["debounce_ms"] == 100
+    assert controller.debounce_diagnostics()["leading"] is True
+    controller.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_max_wait_commit_survives_early_timer(qtbot: QtBot) -> None:
+    controller = FloatEntryController(0.0, debounce_ms=DebouncePolicy(delay_ms=1_000, max_wait_ms=500, leading=True, trailing=False))
+
+    controller.submit(1.0)
+    controller.submit(2.0)
+    assert controller.value == 1.0
+
+    # A coarse timer may fire a few milliseconds before the max-wait deadline
+    controller._submit_timer.stop() # type: ignore
+    controller._on_submit_timer() # type: ignore
+    assert controller.value == 2.0
+    controller.dispose()
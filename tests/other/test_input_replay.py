@@ -0,0 +1,93 @@
+"""Tests for recording and replaying user input."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from PySide6.QtCore import Qt
+from pytestqt.qtbot import QtBot
+
+from nexpy import XValue
+from integrated_widgets import IQtCheckBox, IQtFloatEntry
+from integrated_widgets.auxiliaries import tracing
+from integrated_widgets.auxiliaries.input_replay import EDIT, INPUT
+from integrated_widgets.core import InputLog, InputRecorder, replay_input
+
+from tests.conftest import TEST_DEBOUNCE_MS, wait_for_debounce
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_recorded_entry_is_replayed(qtbot: QtBot, tmp_path: Path) -> None:
+    entry = IQtFloatEntry(1.0, debounce_ms=TEST_DEBOUNCE_MS)
+    qtbot.addWidget(entry)
+    line_edit = entry.controller.widget_float_entry
+
+    recorder = InputRecorder(entry)
+    recorder.start()
+    assert recorder.is_recording
+    line_edit.clear()
+    qtbot.keyClicks(line_edit, "2.5")
+    line_edit.editingFinished.emit()
+    wait_for_debounce(qtbot)
+    log = recorder.stop()
+
+    assert entry.value == 2.5
+    assert [event.kind for event in log.events if event.kind == INPUT] == [INPUT]
+    assert any(event.kind == EDIT for event in log.events)
+    assert log.events[-1].state == "2.5"
+
+    path = tmp_path / "session.json"
+    log.save(path)
+    loaded = InputLog.load(path)
+    assert loaded == log
+
+    observable = XValue[float](1.0)
+    replayed = IQtFloatEntry(observable, debounce_ms=TEST_DEBOUNCE_MS)
+    qtbot.addWidget(replayed)
+    report = replay_input(replayed, loaded, speed=None)
+
+    assert observable.value == 2.5
+    assert report.events == len(log)
+    assert report.commits == 1
+    assert len(report.commit_latencies_ms) == 1
+    assert report.commit_latencies_ms[0] >= 0.0
+    assert report.frame_times_ms
+    assert tracing.get_tracer() is None
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_real_time_replay_keeps_timing(qtbot: QtBot) -> None:
+    check_box = IQtCheckBox(False)
+    qtbot.addWidget(check_box)
+
+    recorder = InputRecorder(check_box)
+    recorder.start()
+    qtbot.wait(50)
+    check_box.controller.widget_check_box.setCheckState(Qt.CheckState.Checked)
+    log = recorder.stop()
+    assert log.duration_ms >= 50
+
+    observable = XValue[bool](False)
+    replayed = IQtCheckBox(observable)
+    qtbot.addWidget(replayed)
+    report = replay_input(replayed, log, speed=1.0)
+
+    assert observable.value is True
+    assert report.duration_ms >= 50
+    assert report.invalidations >= 1
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_replay_rejects_other_tree(qtbot: QtBot) -> None:
+    entry = IQtFloatEntry(1.0)
+    check_box = IQtCheckBox(False)
+    qtbot.addWidget(entry)
+    qtbot.addWidget(check_box)
+
+    recorder = InputRecorder(entry)
+    recorder.start()
+    log = recorder.stop()
+
+    with pytest.raises(KeyError):
+        replay_input(check_box, log, speed=None)
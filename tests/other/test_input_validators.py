@@ -0,0 +1,81 @@
+"""Tests for keystroke-level input validation."""
+
+from __future__ import annotations
+
+import pytest
+from pytestqt.qtbot import QtBot
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QValidator
+
+from integrated_widgets import default
+from integrated_widgets.auxiliaries import input_validators
+from integrated_widgets.auxiliaries.input_validators import float_input_validator, integer_input_validator
+from integrated_widgets.controllers import FloatEntryController, IntegerEntryController
+from tests.conftest import TEST_DEBOUNCE_MS, wait_for_debounce
+
+
+@pytest.mark.parametrize("text", ["", "-", "1.", "1e", "1e-", "in", "-inf", "1_0"])
+def test_float_prefixes_are_intermediate(text: str) -> None:
+    assert float_input_validator().input_state(text) in ("intermediate", "acceptable")
+
+
+@pytest.mark.parametrize("text", ["1x", "1..", "e1", "--1", "nanx"])
+def test_float_garbage_is_invalid(text: str) -> None:
+    assert float_input_validator().input_state(text) == "invalid"
+
+
+def test_custom_validator_failures_are_intermediate() -> None:
+    validator = integer_input_validator(custom_validator=lambda value: (value >= 10, "Too small"))
+    assert validator.input_state("15") == "acceptable"
+    assert validator.input_state("1") == "intermediate"
+    assert validator.input_state("1.5") == "invalid"
+
+
+@pytest.mark.parametrize("text, state", [
+    ("m", "acceptable"),
+    ("m/s^2", "acceptable"),
+    ("kg*m/s²", "acceptable"),
+    ("(kg", "intermediate"),
+    ("m/", "intermediate"),
+    ("m^-", "intermediate"),
+    ("/m", "invalid"),
+    ("m^x", "invalid"),
+    ("m)", "invalid"),
+])
+def test_unit_token_grammar(text: str, state: str) -> None:
+    assert input_validators._unit_grammar_state(text) == state
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_float_entry_reverts_intermediate_input_without_commit(qtbot: QtBot, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(default, "ELIDE_UNCHANGED_COMMITS", True)
+    controller = FloatEntryController(
+        1.5,
+        formatter=lambda value: f"{value:.2f} m",
+        debounce_ms=TEST_DEBOUNCE_MS,
+        keystroke_validation=True,
+    )
+    line_edit = controller.widget_float_entry
+    validator = line_edit.validator()
+    assert validator is not None
+    assert validator.validate("2x", 2) == QValidator.State.Invalid
+
+    line_edit.clear()
+    qtbot.keyClicks(line_edit, "1e")
+    qtbot.keyClick(line_edit, Qt.Key.Key_Return)
+    wait_for_debounce(qtbot)
+
+    assert line_edit.text() == "1.5"
+    assert controller.value == 1.5
+    assert controller.debounce_diagnostics()["commits"] == 0
+
+
+def test_unacceptable_fallback_text_leaves_input_unchanged() -> None:
+    validator = float_input_validator(fallback_text=lambda: "1.50 m")
+    assert validator.fixup("1e") == "1e"
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_keystroke_validation_is_opt_in(qtbot: QtBot) -> None:
+    controller = IntegerEntryController(3, debounce_ms=TEST_DEBOUNCE_MS)
+    assert controller.widget_integer_entry.validator() is None
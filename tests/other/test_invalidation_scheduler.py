@@ -0,0 +1,106 @@
+"""Tests for time-sliced, prioritized invalidation flushing."""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+import pytest
+from pytestqt.qtbot import QtBot
+
+from nexpy import XValue
+from integrated_widgets import IQtTextEntry, default
+from integrated_widgets.controllers import TextEntryController
+from integrated_widgets.core import InvalidationScheduler, get_invalidation_scheduler
+
+
+@pytest.fixture
+def frame_budget() -> Iterator[float]:
+    previous = default.INVALIDATION_FRAME_BUDGET_MS
+    default.INVALIDATION_FRAME_BUDGET_MS = 1.0
+    yield 1.0
+    default.INVALIDATION_FRAME_BUDGET_MS = previous
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_requests_are_deduplicated_and_flushed(qtbot: QtBot, frame_budget: float) -> None:
+    observable = XValue[str]("first")
+    controllers = [TextEntryController(observable) for _ in range(20)]
+    scheduler = get_invalidation_scheduler()
+    qtbot.waitUntil(lambda: scheduler.backlog_depth == 0)
+    scheduler.reset_stats()
+
+    for round_index in range(5):
+        observable.value = f"round {round_index}"
+    assert scheduler.backlog_depth == len(controllers)
+
+    qtbot.waitUntil(lambda: scheduler.backlog_depth == 0)
+    stats = scheduler.stats()
+    assert stats["flushed"] == len(controllers)
+    assert stats["max_backlog_depth"] == len(controllers)
+    assert stats["max_latency_ms"] >= stats["average_latency_ms"] > 0.0
+    assert all(controller.widget_text_entry.text() == "round 4" for controller in controllers)
+
+    for controller in controllers:
+        controller.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_visible_controllers_are_flushed_first(qtbot: QtBot) -> None:
+    hidden = IQtTextEntry("hidden")
+    visible = IQtTextEntry("visible")
+    qtbot.addWidget(hidden)
+    qtbot.addWidget(visible)
+    visible.show()
+    qtbot.waitExposed(visible)
+
+    # A tiny budget flushes one controller per slice
+    scheduler = InvalidationScheduler(budget_ms=1e-6)
+    scheduler.schedule(hidden.controller)
+    scheduler.schedule(visible.controller)
+
+    assert scheduler.flush_slice() == 1
+    assert scheduler.is_pending(hidden.controller)
+    assert not scheduler.is_pending(visible.controller)
+    assert scheduler.stats()["deferred_slices"] == 1
+
+    assert scheduler.flush_all() == 1
+    assert scheduler.backlog_depth == 0
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_disposed_controllers_are_dropped(qtbot: QtBot) -> None:
+    controller = TextEntryController("text")
+    scheduler = InvalidationScheduler(budget_ms=1.0)
+    scheduler.schedule(controller)
+    controller.dispose()
+
+    assert scheduler.flush_slice() == 0
+    assert scheduler.backlog_depth == 0
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_priority_is_taken_once_when_enqueued(qtbot: QtBot, monkeypatch: pytest.MonkeyPatch) -> None:
+    controllers = [TextEntryController(f"text {index}") for index in range(10)]
+    calls: list[TextEntryController] = []
+    original = TextEntryController._invalidation_priority
+
+    def counting_priority(self: TextEntryController) -> int:
+        calls.append(self)
+        return original(self)
+
+    monkeypatch.setattr(TextEntryController, "_invalidation_priority", counting_priority)
+    scheduler = InvalidationScheduler(budget_ms=1e-6)
+    for controller in controllers:
+        scheduler.schedule(controller)
+        scheduler.schedule(controller)
+    assert len(calls) == len(controllers)
+
+    # Each slice pops from the priority buckets without re-sorting the backlog
+    assert scheduler.flush_slice() == 1
+    scheduler.discard(controllers[1])
+    assert scheduler.flush_all() == len(controllers) - 2
+    assert len(calls) == len(controllers)
+    assert scheduler.backlog_depth == 0
+
+    for controller in controllers:
+        controller.dispose()
@@ -0,0 +1,80 @@
+"""Tests for the emission control options of IQtSignalHook (coalescing, rate limit, change-only)."""
+
+from __future__ import annotations
+
+import pytest
+from pytestqt.qtbot import QtBot
+
+from nexpy import FloatingHook
+from integrated_widgets import IQtSignalHook
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_coalesce_emits_latest_value_once_per_loop_turn(qtbot: QtBot) -> None:
+    source = FloatingHook(value=0)
+    hook = IQtSignalHook[int](source, coalesce=True)
+    emitted: list[int] = []
+    hook.value_changed.connect(emitted.append)
+
+    for value in range(1, 101):
+        source.submit_value(value)
+    assert emitted == []
+
+    qtbot.waitUntil(lambda: emitted == [100])
+    assert hook.emitted_count == 1
+    assert hook.suppressed_count == 99
+
+    hook.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_max_rate_delivers_trailing_value(qtbot: QtBot) -> None:
+    source = FloatingHook(value=0)
+    hook = IQtSignalHook[int](source, max_rate_hz=20)
+    emitted: list[int] = []
+    hook.value_changed.connect(emitted.append)
+
+    source.submit_value(1)  # leading emission
+    source.submit_value(2)
+    source.submit_value(3)
+    assert emitted == [1]
+
+    qtbot.waitUntil(lambda: emitted == [1, 3], timeout=500)
+    assert hook.suppressed_count == 1
+
+    hook.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_tolerance_suppresses_small_changes(qtbot: QtBot) -> None:
+    hook = IQtSignalHook[float](1.0, tolerance=0.01)
+    emitted: list[float] = []
+    hook.value_changed.connect(emitted.append)
+
+    hook.submit_value(1.005)
+    hook.submit_value(1.5)
+    hook.submit_value(1.501)
+
+    assert emitted == [1.5]
+    assert hook.emitted_count == 1
+    assert hook.suppressed_count == 2
+
+    hook.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_flush_emits_pending_value_immediately(qtbot: QtBot) -> None:
+    hook = IQtSignalHook[int](0, coalesce=True)
+    emitted: list[int] = []
+    hook.value_changed.connect(emitted.append)
+
+    hook.submit_value(5)
+    hook.flush()
+    assert emitted == [5]
+
+    hook.dispose()
+
+
+def test_equality_and_tolerance_are_exclusive() -> None:
+    with pytest.raises(ValueError):
+        IQtSignalHook[float](0.0, equality=lambda a, b: a == b, tolerance=0.1)
@@ -0,0 +1,63 @@
+"""Tests for IQtSignalHookGroup."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from pytestqt.qtbot import QtBot
+
+from nexpy import FloatingHook
+from integrated_widgets import IQtSignalHookGroup
+from integrated_widgets.controllers import RangeSliderController
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_group_emits_once_with_all_changes(qtbot: QtBot) -> None:
+    a = FloatingHook(value=1)
+    b = FloatingHook(value="x")
+    group = IQtSignalHookGroup({"a": a, "b": b})
+    emitted: list[dict[str, Any]] = []
+    group.values_changed.connect(emitted.append)
+
+    a.submit_value(2)
+    b.submit_value("y")
+    a.submit_value(3)
+
+    qtbot.waitUntil(lambda: len(emitted) == 1)
+    assert emitted[0] == {"a": 3, "b": "y"}
+    assert group.emission_count == 1
+    assert group.change_count == 3
+
+    group.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_group_emits_once_per_composite_update(qtbot: QtBot) -> None:
+    controller = RangeSliderController(range_values_tuple=(0.0, 100.0))
+    keys = ["span_values_tuple", "span_size_value", "span_center_value"]
+    group = IQtSignalHookGroup.from_hook_carrier(controller, keys)
+    emitted: list[dict[str, Any]] = []
+    group.values_changed.connect(emitted.append)
+
+    controller.change_span_relative_values(0.25, 0.75, debounce_ms=0)
+
+    qtbot.waitUntil(lambda: len(emitted) == 1)
+    assert set(emitted[0]) == set(keys)
+    assert emitted[0]["span_values_tuple"] == (25.0, 75.0)
+
+    group.dispose()
+    controller.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_group_initial_values_do_not_emit(qtbot: QtBot) -> None:
+    group = IQtSignalHookGroup({"a": FloatingHook(value=1), "b": 2})
+    emitted: list[dict[str, Any]] = []
+    group.values_changed.connect(emitted.append)
+
+    qtbot.wait(10)
+    assert emitted == []
+    assert group.values == {"a": 1, "b": 2}
+
+    group.dispose()
@@ -0,0 +1,46 @@
+"""Tests for the lazy (PEP 562) exports of the integrated_widgets packages."""
+
+from __future__ import annotations
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+
+LAZY_MODULES = (
+    "integrated_widgets",
+    "integrated_widgets.controllers",
+    "integrated_widgets.payloads",
+    "integrated_widgets.core",
+)
+
+
+def test_bare_import_does_not_load_qt() -> None:
+    probe = "import sys, integrated_widgets; print(any(name.startswith('PySide6') for name in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+
+
+@pytest.mark.parametrize("module_name", LAZY_MODULES)
+def test_all_exports_resolve(module_name: str) -> None:
+    module = importlib.import_module(module_name)
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+        assert name in dir(module)
+
+
+def test_resolved_attribute_is_cached() -> None:
+    import integrated_widgets
+    from integrated_widgets.iqt_widgets.iqt_check_box import IQtCheckBox
+
+    assert integrated_widgets.IQtCheckBox is IQtCheckBox
+    assert integrated_widgets.__dict__["IQtCheckBox"] is IQtCheckBox
+
+
+def test_unknown_attribute_raises() -> None:
+    import integrated_widgets
+
+    with pytest.raises(AttributeError):
+        integrated_widgets.DoesNotExist # type: ignore
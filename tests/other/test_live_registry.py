@@ -0,0 +1,63 @@
+"""Tests for the live-controller registry and leak detection."""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+import pytest
+
+from integrated_widgets.auxiliaries import live_registry
+from integrated_widgets.controllers import FloatEntryController, TextEntryController
+from integrated_widgets.core import LiveRegistry, start_live_tracking, stop_live_tracking
+
+
+@pytest.fixture
+def registry() -> Iterator[LiveRegistry]:
+    registry = start_live_tracking()
+    yield registry
+    stop_live_tracking()
+
+
+def _build_controllers() -> list[FloatEntryController]:
+    return [FloatEntryController(float(index), headless=True) for index in range(3)]
+
+
+def test_disabled_tracking_registers_nothing() -> None:
+    assert live_registry.get_live_registry() is None
+    controller = TextEntryController("text", headless=True)
+    controller.dispose()
+
+
+def test_counts_and_creation_sites(registry: LiveRegistry) -> None:
+    controllers = _build_controllers()
+    text_controller = TextEntryController("text", headless=True)
+
+    assert registry.counts() == {"FloatEntryController": 3, "TextEntryController": 1}
+    assert registry.live_objects(TextEntryController) == [text_controller]
+    site = registry.creation_site(controllers[0])
+    assert site is not None and site.endswith("in _build_controllers")
+    assert registry.approximate_memory()["FloatEntryController"] > 0
+
+    for controller in [*controllers, text_controller]:
+        controller.dispose()
+
+
+def test_snapshot_diff_finds_leaked_controllers(registry: LiveRegistry) -> None:
+    before = registry.snapshot()
+
+    leaked = _build_controllers()
+    released = _build_controllers()
+    for controller in released:
+        controller.dispose()
+    del released, controller
+
+    diff = registry.snapshot().diff(before)
+    assert list(diff.values()) == [3]
+    ((class_name, site),) = diff
+    assert class_name == "FloatEntryController"
+    assert "_build_controllers" in site
+
+    for controller in leaked:
+        controller.dispose()
+    del leaked, controller
+    assert registry.snapshot().diff(before) == {}
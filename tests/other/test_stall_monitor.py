@@ -0,0 +1,91 @@
+"""Tests for the GUI stall monitor and its attribution to controller work."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+from PySide6.QtCore import QTimer
+from pytestqt.qtbot import QtBot
+
+from integrated_widgets.auxiliaries import tracing
+from integrated_widgets.controllers import FloatEntryController
+from integrated_widgets.core import StallMonitor
+
+
+def _slow_validator(value: float) -> tuple[bool, str]:
+    time.sleep(0.3)
+    return True, "Value is valid"
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_stall_is_attributed_to_commit(qtbot: QtBot) -> None:
+    controller = FloatEntryController(1.0, custom_validator=_slow_validator, debounce_ms=0)
+    monitor = StallMonitor(interval_ms=20, threshold_ms=150)
+    monitor.start()
+
+    QTimer.singleShot(50, lambda: controller.submit(2.0))
+    qtbot.waitUntil(lambda: len(monitor.reports()) > 0, timeout=3_000)
+
+    report = monitor.reports()[0]
+    assert report.duration_ms >= 150
+    assert report.culprit is not None
+    assert report.culprit.name in ("commit", "nexus_submit")
+    assert report.culprit.subject == tracing.subject_id(controller)
+    assert monitor.reports(subject=tracing.subject_id(controller)) == [report]
+
+    monitor.dispose()
+    controller.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_stall_outside_controllers_has_no_culprit(qtbot: QtBot) -> None:
+    monitor = StallMonitor(interval_ms=20, threshold_ms=150)
+    monitor.start()
+    assert tracing.get_tracer() is not None
+
+    QTimer.singleShot(50, lambda: time.sleep(0.3))
+    qtbot.waitUntil(lambda: len(monitor.reports()) > 0, timeout=3_000)
+
+    assert monitor.reports()[0].culprit is None
+    assert monitor.max_lag_ms >= 150
+
+    monitor.stop()
+    # The monitor disables the tracing it enabled
+    assert tracing.get_tracer() is None
+    monitor.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_history_is_bounded(qtbot: QtBot) -> None:
+    monitor = StallMonitor(interval_ms=10, threshold_ms=20, history_size=2)
+    monitor.start()
+
+    for delay in (30, 100, 170):
+        QTimer.singleShot(delay, lambda: time.sleep(0.04))
+    qtbot.wait(400)
+
+    assert len(monitor.reports()) <= 2
+    assert monitor.tick_count > 0
+
+    monitor.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_stop_keeps_tracers_started_elsewhere(qtbot: QtBot) -> None:
+    # Tracing enabled before the monitor starts
+    tracer = tracing.start_tracing()
+    monitor = StallMonitor(interval_ms=20, threshold_ms=150)
+    monitor.start()
+    monitor.stop()
+    assert tracing.get_tracer() is tracer
+    tracing.stop_tracing()
+
+    # Tracing enabled while the monitor runs replaces the monitor's tracer
+    monitor.start()
+    tracer = tracing.start_tracing()
+    monitor.stop()
+    assert tracing.get_tracer() is tracer
+    tracing.stop_tracing()
+
+    monitor.dispose()
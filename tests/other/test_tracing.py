@@ -0,0 +1,84 @@
+"""Tests for the controller activity tracer and its Chrome trace export."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from pytestqt.qtbot import QtBot
+
+from integrated_widgets.auxiliaries import tracing
+from integrated_widgets.controllers import FloatEntryController
+from integrated_widgets.core import start_tracing, stop_tracing
+
+
+@pytest.fixture
+def tracer():
+    tracer = start_tracing()
+    yield tracer
+    stop_tracing()
+
+
+def test_disabled_tracing_records_nothing() -> None:
+    assert tracing.get_tracer() is None
+    assert tracing.span("commit") is tracing.span("invalidate")
+
+    controller = FloatEntryController(1.0, headless=True)
+    controller.submit(2.0)
+    controller.dispose()
+
+
+def test_commit_spans_carry_controller_and_keys(tracer: tracing.Tracer) -> None:
+    controller = FloatEntryController(1.0, headless=True)
+    controller.submit(2.0)
+
+    spans = {event.name: event for event in tracer.events() if event.phase == "X"}
+    assert {"commit", "nexus_submit"} <= set(spans)
+    assert spans["commit"].subject == tracing.subject_id(controller)
+    assert spans["commit"].keys == ("value",)
+    # The nexus submission is nested in the commit
+    assert spans["commit"].start_ns <= spans["nexus_submit"].start_ns
+    assert spans["nexus_submit"].end_ns <= spans["commit"].end_ns
+
+    controller.dispose()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_invalidation_is_traced(qtbot: QtBot, tracer: tracing.Tracer) -> None:
+    controller = FloatEntryController(1.0, debounce_ms=0)
+    controller.submit(3.0)
+
+    qtbot.waitUntil(lambda: any(event.name == "invalidate" for event in tracer.events()))
+    names = [event.name for event in tracer.events()]
+    assert "debounce" in names
+    assert "invalidation_requested" in names
+
+    controller.dispose()
+
+
+def test_chrome_trace_export(tmp_path: Path, tracer: tracing.Tracer) -> None:
+    with tracing.span("outer", keys=["a", "b"], args={"note": 1}):
+        tracing.instant("marker")
+
+    path = tmp_path / "trace.json"
+    tracer.export_chrome_trace(path)
+    trace = json.loads(path.read_text())
+
+    events = {event["name"]: event for event in trace["traceEvents"]}
+    assert events["outer"]["ph"] == "X"
+    assert events["outer"]["dur"] >= 0
+    assert events["outer"]["args"] == {"keys": ["a", "b"], "note": 1}
+    assert events["marker"]["ph"] == "i"
+
+
+def test_ring_buffer_drops_oldest_events() -> None:
+    tracer = start_tracing(capacity=3)
+    try:
+        for index in range(5):
+            tracing.instant(f"event {index}")
+    finally:
+        stop_tracing()
+
+    assert [event.name for event in tracer.events()] == ["event 2", "event 3", "event 4"]
+    assert tracer.dropped_count == 2
@@ -0,0 +1,126 @@
+"""Tests for memoized validation of composite controllers."""
+
+from __future__ import annotations
+
+from typing import Any, Mapping
+
+import pytest
+from united_system import RealUnitedScalar, Unit
+
+from integrated_widgets import default, pure_validator
+from integrated_widgets.auxiliaries.validation_cache import CachedValidator, is_pure_validator
+from integrated_widgets.controllers import RealUnitedScalarController, SingleSetSelectController
+
+
+def _counting_validator() -> tuple[CachedValidator, list[Mapping[str, Any]]]:
+    calls: list[Mapping[str, Any]] = []
+
+    @pure_validator
+    def validator(values: Mapping[str, Any]) -> tuple[bool, str]:
+        calls.append(dict(values))
+        return values["value"] != 0, "Must not be zero"
+
+    return CachedValidator(validator, maxsize=2), calls
+
+
+def test_cached_validator_hits_and_evicts() -> None:
+    cached, calls = _counting_validator()
+
+    assert cached({"value": 1}) == (True, "Must not be zero")
+    assert cached({"value": 1}) == (True, "Must not be zero")
+    assert cached({"value": 0})[0] is False
+    assert len(calls) == 2
+
+    # 1 and 1.0 are different states
+    cached({"value": 1.0})
+    assert len(calls) == 3
+
+    # {"value": 1} was least recently used and has been evicted
+    cached({"value": 1})
+    assert len(calls) == 4
+    assert cached.info() == {"hits": 1, "misses": 4, "uncacheable": 0, "size": 2, "maxsize": 2}
+
+    cached.clear()
+    assert cached.info()["size"] == 0
+
+
+def test_unhashable_values_bypass_cache() -> None:
+    cached, calls = _counting_validator()
+
+    cached({"value": [1]})
+    cached({"value": [1]})
+    assert len(calls) == 2
+    assert cached.info()["uncacheable"] == 2
+
+
+def test_sets_and_mappings_are_frozen_into_the_key() -> None:
+    calls: list[Mapping[str, Any]] = []
+
+    def validator(values: Mapping[str, Any]) -> tuple[bool, str]:
+        calls.append(values)
+        return True, "Value is valid"
+
+    cached = CachedValidator(validator, maxsize=8)
+
+    cached({"options": {"a": {1, 2}}, "selected": {"x"}})
+    cached({"options": {"a": {2, 1}}, "selected": {"x"}})
+    assert len(calls) == 1
+
+    cached({"options": {"a": {1, 3}}, "selected": {"x"}})
+    assert len(calls) == 2
+    assert cached.info()["uncacheable"] == 0
+
+
+def test_pure_validator_marker() -> None:
+    assert is_pure_validator(pure_validator(lambda values: (True, "")))
+    assert not is_pure_validator(lambda values: (True, ""))
+    assert not is_pure_validator(None)
+    with pytest.raises(ValueError):
+        CachedValidator(lambda values: (True, ""), maxsize=0)
+
+
+def test_composite_controller_memoizes_pure_validators() -> None:
+    custom_calls: list[str] = []
+
+    @pure_validator
+    def not_c(values: Mapping[str, Any]) -> tuple[bool, str]:
+        custom_calls.append(values["selected_option"])
+        return values["selected_option"] != "c", "c is not allowed"
+
+    controller = SingleSetSelectController("a", frozenset({"a", "b", "c"}), {"combobox"}, custom_validator=not_c, headless=True)
+    for _ in range(5):
+        controller.submit_primary_values({"selected_option": "b"})
+        controller.submit_primary_values({"selected_option": "a"})
+
+    info = controller.validation_cache_info()
+    assert set(info) == {"validate_complete_primary_values_callback", "custom_validator"}
+    assert info["custom_validator"]["hits"] > 0
+    assert custom_calls.count("b") == 1
+
+    controller.clear_validation_cache()
+    assert controller.validation_cache_info()["custom_validator"]["size"] == 0
+    controller.dispose()
+
+
+def test_real_united_scalar_controller_hits_the_cache() -> None:
+    controller = RealUnitedScalarController(RealUnitedScalar(1.0, Unit("m")), headless=True)
+    for value in (2.0, 3.0, 2.0, 3.0):
+        controller.submit_primary_values({"scalar_value": RealUnitedScalar(value, Unit("m"))})
+
+    info = controller.validation_cache_info()["validate_complete_primary_values_callback"]
+    assert info["hits"] > 0
+    assert info["uncacheable"] == 0
+    assert controller.value == RealUnitedScalar(3.0, Unit("m"))
+
+    controller.dispose()
+
+
+def test_validation_cache_can_be_disabled() -> None:
+    previous = default.VALIDATION_CACHE_SIZE
+    default.VALIDATION_CACHE_SIZE = 0
+    try:
+        controller = SingleSetSelectController("a", frozenset({"a", "b"}), {"combobox"}, headless=True)
+        assert controller.validation_cache_info() == {}
+        controller.dispose()
+    finally:
+        default.VALIDATION_CACHE_SIZE = previous
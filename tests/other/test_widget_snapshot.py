@@ -0,0 +1,142 @@
+"""Tests for capturing, encoding and restoring widget tree snapshots."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+from pytestqt.qtbot import QtBot
+from united_system import RealUnitedScalar, Unit, Dimension
+
+from nexpy.core import NexusManager
+from integrated_widgets import IQtIntegerEntry, IQtRangeSlider
+from integrated_widgets.core import (
+    LayoutPayloadBase,
+    SnapshotLibrary,
+    WidgetSnapshot,
+    capture_snapshot,
+    restore_snapshot,
+    write_snapshot_library,
+)
+
+from tests.conftest import build_form_payload
+
+
+def test_encoding_round_trip() -> None:
+    snapshot = WidgetSnapshot({
+        "a": {"value": None},
+        "b": {"value": (1, -2.5, "text", Path("/tmp/x"), b"\x00\x01", True)},
+        "c": {"selected_options": {"x", "y"}, "available_options": frozenset({"x", "y", "z"})},
+        "d": {"value": {"nested": [1, 2, 2 ** 80]}},
+        "e": {"value": RealUnitedScalar(2.5, Unit("km")), "unit": Unit("km")},
+    })
+
+    assert WidgetSnapshot.from_bytes(snapshot.to_bytes()) == snapshot
+
+
+def test_units_are_interned() -> None:
+    many = WidgetSnapshot({str(index): {"value": Unit("m")} for index in range(100)})
+
+    # The unit text is stored once; each further reference costs a tag and an index
+    assert many.to_bytes().count(str(Unit("m")).encode("utf-8")) == 1
+
+
+def test_dimension_round_trip() -> None:
+    snapshot = WidgetSnapshot({"a": {"value": Dimension("L")}})
+    assert WidgetSnapshot.from_bytes(snapshot.to_bytes()) == snapshot
+
+
+def test_unsupported_value_raises() -> None:
+    with pytest.raises(TypeError):
+        WidgetSnapshot({"a": {"value": object()}}).to_bytes()
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_capture_and_restore(qtbot: QtBot) -> None:
+    form = build_form_payload()
+    snapshot = capture_snapshot(form)
+
+    assert list(snapshot.values) == ["name", "enabled", "counts[0]", "counts[1]", "counts[2]"]
+
+    form.name.controller.submit("beta")
+    form.enabled.controller.submit(True)
+    form.counts[2].controller.submit(42)
+    qtbot.waitUntil(lambda: form.counts[2].controller.value == 42)
+
+    success, _ = restore_snapshot(form, WidgetSnapshot.from_bytes(snapshot.to_bytes()))
+
+    assert success
+    assert form.name.controller.value == "alpha"
+    assert form.enabled.controller.value is False
+    assert [entry.controller.value for entry in form.counts] == [0, 1, 2]
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_restore_into_new_tree_strict(qtbot: QtBot) -> None:
+    snapshot = capture_snapshot(build_form_payload())
+    other = build_form_payload()
+    other.name.controller.submit("changed")
+    qtbot.waitUntil(lambda: other.name.controller.value == "changed")
+
+    assert restore_snapshot(other, snapshot, strict=True)[0]
+    assert other.name.controller.value == "alpha"
+
+    snapshot.values.pop("enabled")
+    with pytest.raises(KeyError):
+        restore_snapshot(other, snapshot, strict=True)
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_restore_recomputes_secondary_values(qtbot: QtBot) -> None:
+    slider = IQtRangeSlider(range_values_tuple=(0.0, 10.0))
+    qtbot.addWidget(slider)
+
+    # A stale secondary value in the snapshot must not reach its nexus
+    snapshot = WidgetSnapshot({"": {
+        "span_relative_values_tuple": (0.2, 0.6),
+        "span_size_value": 123.0,
+    }})
+    success, _ = restore_snapshot(slider, snapshot)
+
+    assert success
+    assert slider.get_hook_value_by_key("span_relative_values_tuple") == (0.2, 0.6)
+    assert slider.get_hook_value_by_key("span_size_value") == pytest.approx(4.0)
+
+
+@dataclass(frozen=True)
+class _TwoManagerPayload(LayoutPayloadBase):
+    shared: IQtIntegerEntry
+    separate: IQtIntegerEntry
+
+
+@pytest.mark.qt_log_ignore(".*")
+def test_restore_across_managers_reports_failed_paths(qtbot: QtBot) -> None:
+    form = _TwoManagerPayload(shared=IQtIntegerEntry(1), separate=IQtIntegerEntry(2, nexus_manager=NexusManager()))
+    snapshot = capture_snapshot(form)
+    snapshot.values["separate"]["value"] = "not an integer"
+
+    form.shared.controller.submit(10)
+    qtbot.waitUntil(lambda: form.shared.controller.value == 10)
+
+    # The manager of "separate" rejects its part; the other manager's part stays restored
+    success, msg = restore_snapshot(form, snapshot)
+
+    assert not success
+    assert "separate" in msg
+    assert form.shared.controller.value == 1
+    assert form.separate.controller.value == 2
+
+
+def test_snapshot_library(tmp_path: Path) -> None:
+    presets = {
+        "default": WidgetSnapshot({"gain": {"value": 1.0}}),
+        "boost": WidgetSnapshot({"gain": {"value": 4.0}, "label": {"value": "Boost"}}),
+    }
+    library_path = tmp_path / "presets.iwl"
+    write_snapshot_library(library_path, presets)
+
+    with SnapshotLibrary(library_path) as library:
+        assert list(library) == ["default", "boost"]
+        assert library["boost"] == presets["boost"]
+        assert library["default"] == presets["default"]